@@ -0,0 +1,64 @@
+import json
+import os
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.errors import OQSBaseError
+from .utils import (best_time, print_table)
+
+
+TESTS_JSON_PATH: str = os.path.join(os.path.dirname(__file__), '..', '..', 'tests.json')
+HOT_RULES: dict[str, tuple[str, dict[str, any]]] = {
+    "arithmetic": ("a + b * c - d / 2 + e % 3", {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}),
+    "pricing": (
+        "IF(price * quantity > 100 & discount < 0.5, price * quantity * (1 - discount), price * quantity) + shipping",
+        {"price": 12.5, "quantity": 10, "discount": 0.1, "shipping": 5}
+    ),
+    "map": ('MAP(RANGE(500), "x", x * 2 + 1 > 7 & x % 3 == 0)', {}),
+}
+
+
+def load_tests_json_workload() -> list[tuple[str, dict[str, any]]]:
+    with open(TESTS_JSON_PATH) as file:
+        test_classes_data: dict[str, dict[str, list[dict[str, any]]]] = json.load(file)
+    return [
+        (case["input"]["expression"], case["input"]["variables"])
+        for test_data in test_classes_data.values()
+        for cases in test_data.values()
+        for case in cases
+        if not case["input"]["string_embedded"]
+    ]
+
+
+def compile_workload(workload: list[tuple[str, dict[str, any]]], backend: str) -> list[tuple[CompiledExpression, dict]]:
+    compiled: list[tuple[CompiledExpression, dict[str, any]]] = []
+    for expression, variables in workload:
+        try:
+            compiled.append((compile_expression(expression, backend=backend, optimize=False), variables))
+        except OQSBaseError:
+            continue
+    return compiled
+
+
+def run_workload(compiled: list[tuple[CompiledExpression, dict[str, any]]]) -> None:
+    for compiled_expression, variables in compiled:
+        compiled_expression.evaluate(variables=dict(variables or {}))
+
+
+def main() -> None:
+    workloads: dict[str, list[tuple[str, dict[str, any]]]] = {"tests.json": load_tests_json_workload()}
+    for name, (expression, variables) in HOT_RULES.items():
+        workloads[name] = [(expression, variables)] * 100
+    rows: list[list[any]] = []
+    for name, workload in workloads.items():
+        baseline: float | None = None
+        for backend in CompiledExpression.BACKENDS:
+            compiled: list[tuple[CompiledExpression, dict[str, any]]] = compile_workload(
+                workload=workload, backend=backend
+            )
+            seconds: float = best_time(lambda: run_workload(compiled=compiled), repeat=5)
+            baseline: float = baseline or seconds
+            rows.append([name, backend, len(compiled), seconds * 1_000, baseline / seconds])
+    print_table(headers=["workload", "backend", "expressions", "ms", "speedup"], rows=rows)
+
+
+if __name__ == '__main__':
+    main()
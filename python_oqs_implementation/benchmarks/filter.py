@@ -0,0 +1,28 @@
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from .utils import (best_time, print_table)
+
+
+SIZES: list[int] = [1_000, 10_000, 100_000, 200_000]
+EXPRESSION: str = 'FILTER(orders, "order", ACCESS(order, "status") == "open")'
+
+
+def build_orders(size: int) -> list[dict[str, any]]:
+    return [{"id": index, "status": "open" if index % 50 == 0 else "closed"} for index in range(size)]
+
+
+def main() -> None:
+    compiled: CompiledExpression = compile_expression(expression=EXPRESSION)
+    rows: list[list[any]] = []
+    for size in SIZES:
+        orders: list[dict[str, any]] = build_orders(size=size)
+        inputs: dict[str, any] = {
+            "List": orders, "KVS": {f"order_{order['id']}": order for order in orders}
+        }
+        for input_type, collection in inputs.items():
+            seconds: float = best_time(lambda: compiled.results(variables={"orders": collection}), repeat=3)
+            rows.append([input_type, size, seconds * 1_000, seconds * 1_000_000_000 / size])
+    print_table(headers=["input", "elements", "ms", "ns/element"], rows=rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+from python_oqs_implementation.oqs.parser import (OQSParser, PARSE_CACHE, configure_parse_cache)
+from .utils import (best_time, print_table)
+
+
+SIZES: list[int] = [100, 1_000, 5_000, 20_000]
+SHAPES: dict[str, str] = {
+    "sum chain": "a{i}",
+    "mixed chain": "a{i} * 2 ** b{i}",
+    "function calls": "ADD(a{i}, [1, 2], {{\"k\": b{i}}})",
+}
+SEPARATORS: dict[str, str] = {"sum chain": " + ", "mixed chain": " - ", "function calls": " + "}
+
+
+def build_expression(shape: str, size: int) -> str:
+    return SEPARATORS[shape].join(SHAPES[shape].format(i=i) for i in range(size))
+
+
+def main() -> None:
+    original_maxsize: int = PARSE_CACHE.maxsize
+    configure_parse_cache(maxsize=0)
+    try:
+        rows: list[list[any]] = []
+        for shape in SHAPES:
+            for size in SIZES:
+                expression: str = build_expression(shape=shape, size=size)
+                seconds: float = best_time(lambda: OQSParser(eager=True).parse(expression), repeat=3)
+                rows.append([shape, size, len(expression), seconds * 1_000, seconds * 1_000_000 / size])
+        print_table(headers=["shape", "terms", "chars", "ms", "us/term"], rows=rows)
+    finally:
+        configure_parse_cache(maxsize=original_maxsize)
+
+
+if __name__ == '__main__':
+    main()
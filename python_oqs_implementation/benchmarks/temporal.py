@@ -0,0 +1,45 @@
+import datetime
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.utils.temporal import parse_datetime
+from .utils import (best_time, print_table)
+
+
+SIZE: int = 100_000
+SAMPLES: dict[str, str] = {
+    "%Y-%m-%dT%H:%M:%S": "2023-12-25T10:30:00",
+    "%Y-%m-%d": "2023-12-25",
+    "%H:%M:%S": "10:30:00",
+    "%d/%m/%Y %H:%M": "25/12/2023 10:30",
+    "%Y%m%d %H%M%S.%f": "20231225 103000.250",
+}
+EXPRESSION: str = 'MAP(timestamps, "timestamp", PARSE_TEMPORAL(timestamp, "DateTime"))'
+
+
+def main() -> None:
+    rows: list[list[any]] = []
+    for format_str, string in SAMPLES.items():
+        strptime_seconds: float = best_time(
+            lambda: [datetime.datetime.strptime(string, format_str) for _ in range(SIZE)], repeat=3
+        )
+        parser_seconds: float = best_time(lambda: [parse_datetime(string, format_str) for _ in range(SIZE)], repeat=3)
+        rows.append([
+            format_str,
+            strptime_seconds * 1_000_000_000 / SIZE,
+            parser_seconds * 1_000_000_000 / SIZE,
+            strptime_seconds / parser_seconds
+        ])
+    print_table(headers=["format", "strptime ns", "parser ns", "speedup"], rows=rows)
+    print()
+    compiled: CompiledExpression = compile_expression(expression=EXPRESSION)
+    timestamps: list[str] = [
+        (datetime.datetime(2023, 1, 1) + datetime.timedelta(minutes=index)).isoformat() for index in range(SIZE)
+    ]
+    seconds: float = best_time(lambda: compiled.results(variables={"timestamps": timestamps}), repeat=3)
+    print_table(
+        headers=["expression", "elements", "ms", "ns/element"],
+        rows=[["MAP(PARSE_TEMPORAL)", SIZE, seconds * 1_000, seconds * 1_000_000_000 / SIZE]]
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+import time
+from typing import Callable
+
+
+def best_time(function: Callable[[], any], repeat: int = 5, number: int = 1) -> float:
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        for _ in range(number):
+            function()
+        best: float = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def print_table(headers: list[str], rows: list[list[any]]) -> None:
+    cells: list[list[str]] = [headers] + [
+        [f"{cell:,.3f}" if isinstance(cell, float) else str(cell) for cell in row] for row in rows
+    ]
+    widths: list[int] = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for row in cells:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
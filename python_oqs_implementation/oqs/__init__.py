@@ -1,3 +1,19 @@
-from .engine import (ExpressionInput, oqs_engine)
+from .engine import (
+    CompiledExpression,
+    CompiledTemplate,
+    ExpressionInput,
+    compile_expression,
+    compile_template,
+    evaluate_many,
+    oqs_engine
+)
+from .governor import ResourceLimits
 from .interpreter import OQSInterpreter
 from .nodes import FunctionNode
+from .parser import (clear_parse_cache, configure_parse_cache, parse_cache_info)
+from .profiler import OQSProfiler
+from .reactive import OQSReactiveGraph
+from .registry import OQSFunctionRegistry
+from .ruleset import RuleSet
+
+compile = compile_expression
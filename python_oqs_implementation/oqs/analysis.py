@@ -0,0 +1,130 @@
+from typing import Callable
+from .nodes import (
+    ASTNode,
+    BinaryOpNode,
+    ComparisonOpNode,
+    FunctionNode,
+    KVSNode,
+    ListNode,
+    PackedNode,
+    StringNode,
+    UnparsedNode,
+    VariableNode
+)
+
+
+IMPURE_FUNCTIONS: frozenset[str] = frozenset({"NOW", "TODAY", "TIME_NOW"})
+BINDING_FUNCTIONS: frozenset[str] = frozenset({"FOR", "MAP", "FILTER", "SORT"})
+INVARIANT_NODES: tuple[type[ASTNode], ...] = (FunctionNode, BinaryOpNode, ComparisonOpNode)
+PASS_THROUGH_NODES: tuple[type[ASTNode], ...] = (ListNode, KVSNode, PackedNode)
+PASS_THROUGH_FUNCTIONS: frozenset[str] = frozenset({"IF", "TRY", "FOR", "MAP"})
+
+
+def child_nodes(node: ASTNode) -> list[ASTNode]:
+    if isinstance(node, (BinaryOpNode, ComparisonOpNode)):
+        return [node.left, node.right]
+    elif isinstance(node, FunctionNode):
+        return list(node.args)
+    elif isinstance(node, ListNode):
+        return list(node.elements)
+    elif isinstance(node, KVSNode):
+        return [child for pair in node.key_value_store.items() for child in pair]
+    elif isinstance(node, PackedNode) and node.node is not None:
+        return [node.node]
+    return []
+
+
+def walk(node: ASTNode) -> list[ASTNode]:
+    nodes: list[ASTNode] = []
+    pending: list[ASTNode] = [node]
+    while pending:
+        current: ASTNode = pending.pop()
+        nodes.append(current)
+        pending.extend(reversed(child_nodes(current)))
+    return nodes
+
+
+def is_opaque(node: ASTNode) -> bool:
+    return isinstance(node, UnparsedNode) or (isinstance(node, PackedNode) and node.node is None)
+
+
+def free_variables(node: ASTNode) -> set[str]:
+    return {current.name for current in walk(node) if isinstance(current, VariableNode)}
+
+
+def called_functions(node: ASTNode) -> dict[str, str]:
+    functions: dict[str, str] = {}
+    for current in walk(node):
+        if isinstance(current, FunctionNode):
+            functions.setdefault(current.key, current.name)
+    return functions
+
+
+def bound_variables(node: ASTNode) -> set[str] | None:
+    names: set[str] = set()
+    for current in walk(node):
+        if is_opaque(current):
+            return None
+        elif isinstance(current, FunctionNode) and current.key in BINDING_FUNCTIONS:
+            if len(current.args) < 2 or not isinstance(current.args[1], StringNode):
+                return None
+            names.add(current.args[1].value)
+    return names
+
+
+def binding_name(node: ASTNode) -> str | None:
+    if isinstance(node, FunctionNode) and node.key in BINDING_FUNCTIONS and len(node.args) >= 2 and isinstance(
+            node.args[1], StringNode
+    ):
+        return node.args[1].value
+    return None
+
+
+def scoped_free_variables(
+        node: ASTNode, is_pure: Callable[[FunctionNode], bool], known: dict[ASTNode, frozenset[str] | None]
+) -> frozenset[str] | None:
+    if node in known:
+        return known[node]
+    if isinstance(node, VariableNode):
+        names: frozenset[str] | None = frozenset({node.name})
+    elif is_opaque(node) or isinstance(node, FunctionNode) and not is_pure(node):
+        names: frozenset[str] | None = None
+    else:
+        bound_name: str | None = binding_name(node)
+        collected: set[str] | None = set()
+        for index, child in enumerate(child_nodes(node)):
+            child_names: frozenset[str] | None = scoped_free_variables(node=child, is_pure=is_pure, known=known)
+            if child_names is None:
+                collected: set[str] | None = None
+                break
+            collected.update(name for name in child_names if index < 2 or name != bound_name)
+        names: frozenset[str] | None = None if collected is None else frozenset(collected)
+    known[node] = names
+    return names
+
+
+def loop_invariants(
+        body: ASTNode, variable_name: str, is_pure: Callable[[FunctionNode], bool]
+) -> frozenset[ASTNode]:
+    known: dict[ASTNode, frozenset[str] | None] = {}
+    invariants: set[ASTNode] = set()
+    pending: list[tuple[ASTNode, frozenset[str], bool]] = [(body, frozenset({variable_name}), True)]
+    while pending:
+        node, bound_names, returned = pending.pop()
+        names: frozenset[str] | None = scoped_free_variables(node=node, is_pure=is_pure, known=known)
+        if names is not None and not names & bound_names and isinstance(node, INVARIANT_NODES) and not returned:
+            invariants.add(node)
+            continue
+        children: list[ASTNode] = child_nodes(node)
+        returned: bool = returned and (
+            isinstance(node, PASS_THROUGH_NODES)
+            or (isinstance(node, FunctionNode) and node.key in PASS_THROUGH_FUNCTIONS)
+        )
+        if isinstance(node, FunctionNode) and node.key in BINDING_FUNCTIONS:
+            bound_name: str | None = binding_name(node)
+            pending.extend((child, bound_names, returned) for child in children[:2])
+            if bound_name is not None:
+                pending.extend((child, bound_names | {bound_name}, returned) for child in children[2:])
+        else:
+            pending.extend((child, bound_names, returned) for child in children)
+    return frozenset(invariants)
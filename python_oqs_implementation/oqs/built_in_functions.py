@@ -1,7 +1,8 @@
 import datetime
+import itertools
 import json
-import re
-from .constants.values import MAX_ARGS
+from typing import Iterator
+from .constants.values import (MAX_ARGS, MAX_CACHED_VALUE_SETS, MIN_HASHED_LOOKUP_SIZE)
 from .errors import (
     OQSInvalidArgumentQuantityError,
     OQSDivisionByZeroError,
@@ -10,12 +11,21 @@ from .errors import (
     OQSBaseError,
     OQSCustomErrorParent,
     OQSValueError,
+    OQSResourceLimitError,
     get_error_name_mapping
 )
 from .nodes import (FunctionNode, ASTNode)
+from .scope import OQSScope
+from .sequences import (LazyList, RepeatedList, materialize)
 from .utils.checks import ensure_function_arg_quantity
 from .utils.conversion import OQSJSONEncoder
+from .utils.hashing import (ValueSet, unique)
 from .utils.shortcuts import (get_oqs_type, is_oqs_instance)
+from .utils.temporal import (parse_datetime, parse_duration)
+
+
+def copy_on_write(interpreter: 'OQSInterpreter', node: ASTNode, container: list | dict) -> list | dict:
+    return container if interpreter.is_fresh(node) else container.copy()
 
 
 def bif_add(
@@ -24,14 +34,22 @@ def bif_add(
     ensure_function_arg_quantity(node=node, min_args=2)
     evaluated_args: list[any] = [interpreter.evaluate(arg) for arg in node.args]
     completion: any = evaluated_args.pop(0)
+    owned: bool = interpreter.is_fresh(node.args[0])
     for evaluated_arg in evaluated_args:
         if isinstance(completion, (int, float)) and isinstance(evaluated_arg, (int, float)):
             completion += evaluated_arg
         elif isinstance(completion, list) and isinstance(evaluated_arg, list):
-            completion += evaluated_arg
+            if owned:
+                completion += evaluated_arg
+            else:
+                completion: list[any] = completion + evaluated_arg
+                owned: bool = True
         elif isinstance(completion, str) and isinstance(evaluated_arg, str):
             completion += evaluated_arg
         elif isinstance(completion, dict) and isinstance(evaluated_arg, dict):
+            if not owned:
+                completion: dict[str, any] = completion.copy()
+                owned: bool = True
             for key, value in evaluated_arg.items():
                 completion[key] = value
         elif (
@@ -69,7 +87,8 @@ def bif_subtract(
     if isinstance(a, (int, float)) and isinstance(b, (int, float)):
         return a - b
     elif isinstance(a, list) and isinstance(b, list):
-        return [item for item in a if item not in b]
+        excluded: ValueSet = ValueSet(b)
+        return [item for item in a if item not in excluded]
     elif isinstance(a, str) and isinstance(b, str):
         return a.replace(b, '')
     elif isinstance(a, datetime.datetime) and isinstance(b, datetime.timedelta):
@@ -93,7 +112,17 @@ def bif_subtract(
         raise OQSTypeError(message=f"Cannot subtract '{get_oqs_type(a)}' by '{get_oqs_type(b)}'")
 
 
+def ensure_repeated_size(interpreter: 'OQSInterpreter', size: int, multiplier: int) -> None:
+    limit: int = interpreter.MAX_REPEATED_SIZE
+    if size * multiplier > limit:
+        raise OQSValueError(message=f"Repeating a value of size {size} {multiplier} times exceeds the limit of {limit}")
+
+
 def bif_multiply(interpreter: 'OQSInterpreter', node: FunctionNode) -> int | float | list | str:
+    return materialize(value=lazy_multiply(interpreter=interpreter, node=node), governor=interpreter.governor)
+
+
+def lazy_multiply(interpreter: 'OQSInterpreter', node: FunctionNode) -> int | float | LazyList | str:
     ensure_function_arg_quantity(node=node, min_args=2)
     evaluated_args: list[any] = [interpreter.evaluate(arg) for arg in node.args]
     completion: any = evaluated_args.pop(0)
@@ -106,16 +135,15 @@ def bif_multiply(interpreter: 'OQSInterpreter', node: FunctionNode) -> int | flo
             lst, multiplier = (completion, evaluated_arg) if isinstance(
                 completion, list
             ) else (evaluated_arg, completion)
-            if multiplier > 1:
-                for i in range(multiplier - 1):
-                    lst.extend(lst)
-            return lst
+            ensure_repeated_size(interpreter=interpreter, size=len(lst), multiplier=multiplier)
+            return LazyList(RepeatedList(items=lst, times=multiplier))
         elif (
                 isinstance(completion, str) and isinstance(evaluated_arg, int)
         ) or (isinstance(completion, int) and isinstance(evaluated_arg, str)):
             string, multiplier = (completion, evaluated_arg) if isinstance(
                 completion, str
             ) else (evaluated_arg, completion)
+            ensure_repeated_size(interpreter=interpreter, size=len(string), multiplier=multiplier)
             return string * multiplier
 
         else:
@@ -472,7 +500,7 @@ def bif_unique(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any]:
     lst: any = interpreter.evaluate(node.args[0])
     if not isinstance(lst, list):
         raise OQSTypeError(message='Argument must be a list')
-    return list(set(lst))
+    return unique(lst)
 
 
 def bif_reverse(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any]:
@@ -499,15 +527,23 @@ def bif_min(interpreter: 'OQSInterpreter', node: FunctionNode) -> int | float:
 
 def bif_sum(interpreter: 'OQSInterpreter', node: FunctionNode) -> int | float:
     ensure_function_arg_quantity(node=node, min_args=1, max_args=1)
-    lst: any = interpreter.evaluate(node.args[0])
-    if not isinstance(lst, list) or not all(isinstance(item, (int, float)) for item in lst):
+    lst: any = interpreter.evaluate_sequence(node.args[0])
+    if not isinstance(lst, (list, LazyList)):
         raise OQSTypeError(message='Argument must be a list of numbers')
-    return sum(lst)
+
+    def ensure_number(item: any) -> int | float:
+        if not isinstance(item, (int, float)):
+            raise OQSTypeError(message='Argument must be a list of numbers')
+        return item
+
+    return sum(ensure_number(item) for item in lst)
 
 
 def bif_length(interpreter: 'OQSInterpreter', node: FunctionNode) -> int:
     ensure_function_arg_quantity(node=node, min_args=1, max_args=1)
-    value: any = interpreter.evaluate(node.args[0])
+    value: any = interpreter.evaluate_sequence(node.args[0])
+    if isinstance(value, LazyList):
+        return value.count()
     if not isinstance(value, (str, list, dict)):
         raise OQSTypeError(message="Argument must be a string, list or KVS")
     return len(value)
@@ -518,6 +554,7 @@ def bif_append(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any]:
     lst, item = [interpreter.evaluate(arg) for arg in node.args]
     if not isinstance(lst, list):
         raise OQSTypeError(message="First argument must be a list")
+    lst: list[any] = copy_on_write(interpreter=interpreter, node=node.args[0], container=lst)
     lst.append(item)
     return lst
 
@@ -531,10 +568,12 @@ def bif_update(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any] |
         key_or_index: int = key_or_index % len(container)
         if key_or_index < 0 or key_or_index >= len(container):
             raise IndexError("List index out of range")
+        container: list[any] = copy_on_write(interpreter=interpreter, node=node.args[0], container=container)
         container[key_or_index] = value
     elif isinstance(container, dict):
         if not isinstance(key_or_index, str):
             raise OQSTypeError(message="Key must be a string")
+        container: dict[str, any] = copy_on_write(interpreter=interpreter, node=node.args[0], container=container)
         container[key_or_index] = value
     else:
         raise OQSTypeError(message="First argument must be a list or KVS")
@@ -556,8 +595,8 @@ def bif_remove_item(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[a
             new_list.append(elem)
         return new_list
     elif isinstance(container, dict):
-        if item in container:
-            del container[item]
+        container: dict[str, any] = copy_on_write(interpreter=interpreter, node=node.args[0], container=container)
+        container.pop(item, None)
         return container
     else:
         raise OQSTypeError(message="First argument must be a list or KVS")
@@ -571,10 +610,12 @@ def bif_remove(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any] |
             raise OQSTypeError(message="Index must be an integer")
         if key_or_index < 0 or key_or_index >= len(container):
             raise IndexError("List index out of range")
+        container: list[any] = copy_on_write(interpreter=interpreter, node=node.args[0], container=container)
         del container[key_or_index]
     elif isinstance(container, dict):
         if not isinstance(key_or_index, str):
             raise OQSTypeError(message="Key must be a string")
+        container: dict[str, any] = copy_on_write(interpreter=interpreter, node=node.args[0], container=container)
         container.pop(key_or_index, None)
     else:
         raise OQSTypeError(message="First argument must be a list or KVS")
@@ -633,6 +674,8 @@ def bif_try(interpreter: 'OQSInterpreter', node: FunctionNode) -> any:
 
     try:
         return interpreter.evaluate(primary_expression)
+    except OQSResourceLimitError:
+        raise
     except OQSBaseError as error:
         for i in range(0, len(arguments) - 1, 2):
             exception: any = interpreter.evaluate(arguments[i])
@@ -646,6 +689,10 @@ def bif_try(interpreter: 'OQSInterpreter', node: FunctionNode) -> any:
 
 
 def bif_range(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[int]:
+    return materialize(value=lazy_range(interpreter=interpreter, node=node), governor=interpreter.governor)
+
+
+def lazy_range(interpreter: 'OQSInterpreter', node: FunctionNode) -> LazyList:
     ensure_function_arg_quantity(node=node, min_args=1, max_args=3)
     start: int = 0
     step: int = 1
@@ -662,27 +709,32 @@ def bif_range(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[int]:
         raise OQSTypeError(message=f"stop argument must be an Integer. Instead got '{get_oqs_type(stop)}'.")
     elif not isinstance(step, int):
         raise OQSTypeError(message=f"step argument must be an Integer. Instead got '{get_oqs_type(step)}'.")
-    return list(range(start, stop, step))
+    return LazyList(range(start, stop, step))
 
 
 def bif_for_or_map(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any]:
+    return materialize(value=lazy_for_or_map(interpreter=interpreter, node=node), governor=interpreter.governor)
+
+
+def lazy_for_or_map(interpreter: 'OQSInterpreter', node: FunctionNode) -> LazyList:
     ensure_function_arg_quantity(node=node, min_args=3, max_args=3)
-    looping_list: any = interpreter.evaluate(node.args[0])
+    looping_list: any = interpreter.evaluate_sequence(node.args[0])
     variable_name: any = interpreter.evaluate(node.args[1])
     expression: ASTNode = node.args[2]
-    if not isinstance(looping_list, list):
+    if not isinstance(looping_list, (list, LazyList)):
         raise OQSTypeError(message=f"list argument must be a List. Instead got '{get_oqs_type(looping_list)}'.")
     elif not isinstance(variable_name, str):
         raise OQSTypeError(
             message=f"variable_name argument must be a String. Instead got '{get_oqs_type(variable_name)}'."
         )
-    resulting_list: list[any] = []
-    for item in looping_list:
-        interpreter.variables[variable_name] = item
-        evaluated_expression: any = interpreter.evaluate(expression)
-        resulting_list.append(evaluated_expression)
+    scope: OQSScope = interpreter.loop_scope(body=expression, variable_name=variable_name)
 
-    return resulting_list
+    def generate() -> Iterator[any]:
+        for item in looping_list:
+            scope[variable_name] = item
+            yield interpreter.evaluate_in_scope(scope=scope, node=expression)
+
+    return LazyList(generate())
 
 
 def bif_raise(interpreter: 'OQSInterpreter', node: FunctionNode) -> any:
@@ -709,10 +761,14 @@ def bif_raise(interpreter: 'OQSInterpreter', node: FunctionNode) -> any:
 
 
 def bif_filter(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any] | dict[str, any]:
+    return materialize(value=lazy_filter(interpreter=interpreter, node=node), governor=interpreter.governor)
+
+
+def lazy_filter(interpreter: 'OQSInterpreter', node: FunctionNode) -> LazyList | dict[str, any]:
     ensure_function_arg_quantity(node=node, min_args=3, max_args=3)
     collection, unevaluated_variable_name, predicate = node.args
-    collection_value: any = interpreter.evaluate(collection)
-    if not isinstance(collection_value, (list, dict)):
+    collection_value: any = interpreter.evaluate_sequence(collection)
+    if not isinstance(collection_value, (list, dict, LazyList)):
         raise OQSTypeError(
             message=f"FILTER function requires a List or KVS as the first argument. "
                     f"Instead got '{get_oqs_type(collection_value)}'."
@@ -723,17 +779,20 @@ def bif_filter(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any] |
             message=f"FILTER function requires a String as the second argument. "
                     f"Instead got '{get_oqs_type(evaluated_variable_name)}'. "
         )
-    filtered_result: dict[str, any] | list[any] = collection_value.copy()
-    if isinstance(collection_value, list):
-        for item in collection_value:
-            interpreter.variables[evaluated_variable_name] = item
-            if not interpreter.evaluate(predicate):
-                filtered_result.remove(item)
-    else:
-        for key, value in collection_value.items():
-            interpreter.variables[evaluated_variable_name] = value
-            if not interpreter.evaluate(predicate):
-                del filtered_result[key]
+    scope: OQSScope = interpreter.loop_scope(body=predicate, variable_name=evaluated_variable_name)
+    if not isinstance(collection_value, dict):
+        def generate() -> Iterator[any]:
+            for item in collection_value:
+                scope[evaluated_variable_name] = item
+                if interpreter.evaluate_in_scope(scope=scope, node=predicate):
+                    yield item
+
+        return LazyList(generate())
+    filtered_result: dict[str, any] = {}
+    for key, value in collection_value.items():
+        scope[evaluated_variable_name] = value
+        if interpreter.evaluate_in_scope(scope=scope, node=predicate):
+            filtered_result[key] = value
     return filtered_result
 
 
@@ -756,9 +815,11 @@ def bif_sort(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any]:
                     f"Instead got '{get_oqs_type(evaluated_variable_name)}'. "
         )
 
+    scope: OQSScope = interpreter.loop_scope(body=key_expression, variable_name=evaluated_variable_name)
+
     def evaluate_expression_with_variable(item: any) -> any:
-        interpreter.variables[evaluated_variable_name] = item
-        return interpreter.evaluate(key_expression)
+        scope[evaluated_variable_name] = item
+        return interpreter.evaluate_in_scope(scope=scope, node=key_expression)
 
     sorted_collection = sorted(collection_value, key=evaluate_expression_with_variable, reverse=descending)
     return sorted_collection
@@ -785,11 +846,16 @@ def bif_flatten(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any]:
 
 
 def bif_slice(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any] | str:
+    return materialize(value=lazy_slice(interpreter=interpreter, node=node), governor=interpreter.governor)
+
+
+def lazy_slice(interpreter: 'OQSInterpreter', node: FunctionNode) -> LazyList | list[any] | str:
     ensure_function_arg_quantity(node=node, min_args=2, max_args=3)
-    collection, start = [interpreter.evaluate(arg) for arg in node.args[:2]]
+    collection: any = interpreter.evaluate_sequence(node.args[0])
+    start: any = interpreter.evaluate(node.args[1])
     end: any = interpreter.evaluate(node.args[2]) if len(node.args) == 3 else None
 
-    if not isinstance(collection, (list, str)):
+    if not isinstance(collection, (list, str, LazyList)):
         raise OQSTypeError(
             message=f"SLICE function requires a List or String as the first argument. "
                     f"Instead got '{get_oqs_type(collection)}'. "
@@ -800,16 +866,43 @@ def bif_slice(interpreter: 'OQSInterpreter', node: FunctionNode) -> list[any] |
                     f"Instead got '{get_oqs_type(start)}', '{get_oqs_type(end)}' respectively. "
         )
 
+    if isinstance(collection, LazyList):
+        if isinstance(collection.iterable, range):
+            return LazyList(collection.iterable[start:end])
+        elif start >= 0 and (end is None or end >= 0):
+            def generate() -> Iterator[any]:
+                items: Iterator[any] = iter(collection)
+                yield from itertools.islice(items, start, end)
+                for _ in items:
+                    pass
+
+            return LazyList(generate())
+        collection: list[any] = materialize(value=collection, governor=interpreter.governor)
     return collection[start:end]
 
 
+def lookup_collection(interpreter: 'OQSInterpreter', collection: list[any]) -> list[any] | ValueSet:
+    if len(collection) < MIN_HASHED_LOOKUP_SIZE:
+        return collection
+    cached: tuple[list[any], int, ValueSet] | None = interpreter.value_sets.get(id(collection))
+    if cached is None or cached[0] is not collection or cached[1] != len(collection):
+        if len(interpreter.value_sets) >= MAX_CACHED_VALUE_SETS:
+            del interpreter.value_sets[next(iter(interpreter.value_sets))]
+        cached: tuple[list[any], int, ValueSet] = (collection, len(collection), ValueSet(collection))
+        interpreter.value_sets[id(collection)] = cached
+    return cached[2]
+
+
 def bif_in(interpreter: 'OQSInterpreter', node: FunctionNode) -> bool:
     ensure_function_arg_quantity(node=node, min_args=2, max_args=2)
     value, collection = [interpreter.evaluate(arg) for arg in node.args]
     if isinstance(collection, list):
-        return value in collection
+        return value in lookup_collection(interpreter=interpreter, collection=collection)
     elif isinstance(collection, dict):
-        return value in collection.keys()
+        try:
+            return value in collection
+        except TypeError:
+            return False
     else:
         raise OQSTypeError(
             message=f"IN function requires a list or KVS as the second argument. "
@@ -903,22 +996,13 @@ def bif_parse_temporal(
     format_str: str | None = optional_format[0] if optional_format else None
     try:
         if temporal_type == "datetime":
-            default_format: str = "%Y-%m-%dT%H:%M:%S"
-            return datetime.datetime.strptime(string, format_str or default_format)
+            return parse_datetime(string=string, format_str=format_str or "%Y-%m-%dT%H:%M:%S")
         elif temporal_type == "date":
-            default_format: str = "%Y-%m-%d"
-            return datetime.datetime.strptime(string, format_str or default_format).date()
+            return parse_datetime(string=string, format_str=format_str or "%Y-%m-%d").date()
         elif temporal_type == "time":
-            default_format: str = "%H:%M:%S"
-            return datetime.datetime.strptime(string, format_str or default_format).time()
+            return parse_datetime(string=string, format_str=format_str or "%H:%M:%S").time()
         elif temporal_type == "duration":
-            duration_pattern: str = r"(\d+)\s+(\d+):(\d+):(\d+)"
-            duration_match: re.Match | None = re.match(duration_pattern, string)
-            if duration_match:
-                days, hours, minutes, seconds = map(int, duration_match.groups())
-                return datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
-            else:
-                raise ValueError("Invalid duration format")
+            return parse_duration(string=string)
         else:
             raise ValueError("Invalid temporal type specified")
 
@@ -0,0 +1,439 @@
+import operator
+from typing import (Callable, Mapping)
+from . import built_in_functions
+from .analysis import INVARIANT_NODES
+from .errors import (
+    OQSBaseError,
+    OQSFunctionEvaluationError,
+    OQSSyntaxError,
+    OQSTypeError,
+    OQSUndefinedFunctionError,
+    OQSUndefinedVariableError
+)
+from .governor import (OQSGovernor, allocation_size)
+from .interpreter import OQSInterpreter
+from .profiler import OQSProfiler
+from .registry import OQSFunctionRegistry
+from .scope import OQSScope
+from .nodes import (
+    ASTNode,
+    BinaryOpNode,
+    BooleanNode,
+    ComparisonOpNode,
+    EvaluatedNode,
+    FunctionNode,
+    KVSNode,
+    ListNode,
+    NullNode,
+    NumberNode,
+    PackedNode,
+    StringNode,
+    UnparsedNode,
+    VariableNode
+)
+
+
+Closure = Callable[[OQSInterpreter], any]
+BUILT_IN_FUNCTIONS: Mapping[str, Callable] = OQSInterpreter.FUNCTIONS
+NUMBER_TYPES: frozenset[type] = frozenset({int, float})
+INTEGER_TYPES: frozenset[type] = frozenset({int})
+NUMBER_OPERATIONS: dict[str, tuple[Callable[[any, any], any], frozenset[type]]] = {
+    '+': (operator.add, NUMBER_TYPES),
+    '-': (operator.sub, NUMBER_TYPES),
+    '*': (operator.mul, NUMBER_TYPES),
+    '**': (operator.pow, NUMBER_TYPES),
+    '%': (operator.mod, INTEGER_TYPES),
+    '<': (operator.lt, NUMBER_TYPES),
+    '>': (operator.gt, NUMBER_TYPES),
+    '<=': (operator.le, NUMBER_TYPES),
+    '>=': (operator.ge, NUMBER_TYPES)
+}
+
+
+def evaluated_operation(interpreter: OQSInterpreter, function: Callable, name: str, left: any, right: any) -> any:
+    return function(interpreter, FunctionNode(name=name, args=[EvaluatedNode(left), EvaluatedNode(right)]))
+
+
+def divide(interpreter: OQSInterpreter, left: any, right: any) -> any:
+    if type(left) is int and type(right) is int and right != 0:
+        results: float = left / right
+        return int(results) if results == int(results) else results
+    if type(left) is float and type(right) in NUMBER_TYPES and right != 0:
+        return left / right
+    return evaluated_operation(
+        interpreter=interpreter, function=built_in_functions.bif_divide, name="DIVIDE", left=left, right=right
+    )
+
+
+class CompiledNode(ASTNode):
+    def __init__(self, source: ASTNode, closure: Closure) -> None:
+        self.source: ASTNode = source
+        self.closure: Closure = closure
+        self.function_node: FunctionNode | BinaryOpNode | None = None
+
+
+class OQSClosureCompiler:
+    def __init__(self, functions: Mapping[str, Callable] | None = None, instrumented: bool = False) -> None:
+        self.functions: Mapping[str, Callable] = functions if functions is not None else BUILT_IN_FUNCTIONS
+        self.instrumented: bool = instrumented
+        self.compilers: dict[type[ASTNode], Callable[[ASTNode], Closure]] = {
+            EvaluatedNode: self.compile_constant,
+            NumberNode: self.compile_constant,
+            StringNode: self.compile_constant,
+            BooleanNode: self.compile_constant,
+            NullNode: self.compile_null,
+            ListNode: self.compile_list,
+            VariableNode: self.compile_variable,
+            BinaryOpNode: self.compile_operation,
+            ComparisonOpNode: self.compile_operation,
+            FunctionNode: self.compile_function,
+            KVSNode: self.compile_kvs,
+            UnparsedNode: self.compile_unparsed,
+            PackedNode: self.compile_packed
+        }
+
+    def compile(self, node: ASTNode) -> CompiledNode:
+        if isinstance(node, CompiledNode):
+            return node
+        compiler: Callable[[ASTNode], Closure] | None = self.compilers.get(type(node))
+        closure: Closure = self.compile_invalid(node) if compiler is None else compiler(node)
+        if self.instrumented:
+            closure: Closure = self.instrument(node=node, closure=closure)
+        return CompiledNode(source=node, closure=closure)
+
+    def allocates(self, node: ASTNode) -> bool:
+        if isinstance(node, (ListNode, KVSNode)):
+            return True
+        elif isinstance(node, FunctionNode):
+            return self.functions.get(node.key) in OQSInterpreter.FRESH_FUNCTIONS
+        elif isinstance(node, BinaryOpNode):
+            return self.functions.get(OQSInterpreter.OPERATORS.get(node.op)) in OQSInterpreter.FRESH_FUNCTIONS
+        return False
+
+    def instrument(self, node: ASTNode, closure: Closure) -> Closure:
+        fresh: bool = self.allocates(node)
+
+        def instrumented(interpreter: OQSInterpreter) -> any:
+            governor: OQSGovernor | None = interpreter.governor
+            if governor is not None:
+                governor.step()
+            profiler: OQSProfiler | None = interpreter.profiler
+            if profiler is None:
+                value: any = closure(interpreter)
+            else:
+                value: any = profiler.measure(node=node, function=closure, argument=interpreter, fresh=fresh)
+            if fresh and governor is not None:
+                governor.allocate(allocation_size(value))
+            return value
+
+        return instrumented
+
+    @staticmethod
+    def compile_constant(node: EvaluatedNode | NumberNode | StringNode | BooleanNode) -> Closure:
+        value: any = node.value
+        return lambda interpreter: value
+
+    @staticmethod
+    def compile_null(node: NullNode) -> Closure:
+        return lambda interpreter: None
+
+    @staticmethod
+    def compile_invalid(node: ASTNode) -> Closure:
+        def closure(interpreter: OQSInterpreter) -> any:
+            raise OQSSyntaxError(f"Unable to parse the following: {node}")
+
+        return closure
+
+    @staticmethod
+    def compile_variable(node: VariableNode) -> Closure:
+        name: str = node.name
+
+        def closure(interpreter: OQSInterpreter) -> any:
+            try:
+                return interpreter.variables[name]
+            except KeyError:
+                raise OQSUndefinedVariableError(name) from None
+
+        return closure
+
+    @staticmethod
+    def compile_unparsed(node: UnparsedNode) -> Closure:
+        token: str = node.token
+        return lambda interpreter: interpreter.parse_and_evaluate(token)
+
+    def compile_packed(self, node: PackedNode) -> Closure:
+        return self.compile_invalid(node)
+
+    def compile_unpacked(self, node: PackedNode) -> CompiledNode:
+        if node.node is not None:
+            return self.compile(node.node)
+        expression: str = node.expression
+        return CompiledNode(source=node, closure=lambda interpreter: interpreter.parse_and_evaluate(expression))
+
+    def compile_element(self, node: ASTNode) -> CompiledNode:
+        return self.compile_unpacked(node) if isinstance(node, PackedNode) else self.compile(node)
+
+    def compile_list(self, node: ListNode) -> Closure:
+        elements: list[tuple[bool, Closure]] = [
+            (isinstance(element, PackedNode), self.compile_element(element).closure) for element in node.elements
+        ]
+        if not any(packed for packed, _ in elements):
+            element_closures: list[Closure] = [element for _, element in elements]
+            return lambda interpreter: [element(interpreter) for element in element_closures]
+
+        def closure(interpreter: OQSInterpreter) -> list[any]:
+            values: list[any] = []
+            for packed, element in elements:
+                if packed:
+                    value: any = element(interpreter)
+                    if isinstance(value, list):
+                        values.extend(value)
+                    else:
+                        raise OQSTypeError(message="Cannot unpack anything into a list construction other than a List.")
+                else:
+                    values.append(element(interpreter))
+            return values
+
+        return closure
+
+    def compile_kvs(self, node: KVSNode) -> Closure:
+        entries: list[tuple[bool, Closure, Closure]] = [
+            (isinstance(value, PackedNode), self.compile(key).closure, self.compile_element(value).closure)
+            for key, value in node.key_value_store.items()
+        ]
+
+        def closure(interpreter: OQSInterpreter) -> dict[str, any]:
+            kvs: dict[str, any] = {}
+            for packed, key, value in entries:
+                if packed:
+                    unpacked_value: any = value(interpreter)
+                    if isinstance(unpacked_value, list):
+                        unpacked_value: any = interpreter.evaluate(
+                            FunctionNode(name="UNPACKED_KVS", args=unpacked_value)
+                        )
+                    elif not isinstance(unpacked_value, dict):
+                        raise OQSTypeError(
+                            message="Cannot unpack anything into a KVS construction other than a List or KVS."
+                        )
+                    for unpacked_key, unpacked_item in unpacked_value.items():
+                        kvs[unpacked_key] = unpacked_item
+                else:
+                    kvs[key(interpreter)] = value(interpreter)
+            return kvs
+
+        return closure
+
+    def compile_operation(self, node: BinaryOpNode | ComparisonOpNode) -> Closure:
+        if node.op not in OQSInterpreter.OPERATORS:
+            operation_type: str = "binary" if isinstance(node, BinaryOpNode) else "comparison"
+
+            def closure(interpreter: OQSInterpreter) -> any:
+                raise OQSSyntaxError(f"Invalid {operation_type} operator '{node.op}'")
+
+            return closure
+        function_node: FunctionNode = FunctionNode(
+            name=OQSInterpreter.OPERATORS[node.op], args=[self.compile(node.left), self.compile(node.right)]
+        )
+        function: Callable | None = self.functions.get(function_node.name)
+        if function is None:
+            return lambda interpreter: interpreter.functions[function_node.name](interpreter, function_node)
+        elif function is BUILT_IN_FUNCTIONS[function_node.name]:
+            return self.compile_built_in_operation(node=node, function=function)
+        return lambda interpreter: function(interpreter, function_node)
+
+    def compile_operand(self, node: ASTNode) -> Closure:
+        compiled: CompiledNode = self.compile(node)
+        closure: Closure = compiled.closure
+        if not isinstance(node, INVARIANT_NODES):
+            return closure
+
+        def operand(interpreter: OQSInterpreter) -> any:
+            variables: dict[str, any] = interpreter.variables
+            if variables.__class__ is OQSScope and node in variables.invariants:
+                return interpreter.evaluate_invariant(scope=variables, node=compiled, source=node)
+            return closure(interpreter)
+
+        return operand
+
+    def compile_built_in_operation(self, node: BinaryOpNode | ComparisonOpNode, function: Callable) -> Closure:
+        name: str = OQSInterpreter.OPERATORS[node.op]
+        left: Closure = self.compile_operand(node.left)
+        right: Closure = self.compile_operand(node.right)
+        if node.op == '&':
+            return lambda interpreter: True if left(interpreter) and right(interpreter) else False
+        elif node.op == '|':
+            return lambda interpreter: True if left(interpreter) or right(interpreter) else False
+        elif node.op == '/':
+            return lambda interpreter: divide(interpreter, left(interpreter), right(interpreter))
+        elif node.op == '==':
+            return lambda interpreter: True if left(interpreter) == right(interpreter) else False
+        elif node.op == '!=':
+            return lambda interpreter: True if left(interpreter) != right(interpreter) else False
+        elif node.op not in NUMBER_OPERATIONS:
+            return lambda interpreter: evaluated_operation(
+                interpreter, function, name, left(interpreter), right(interpreter)
+            )
+        number_operation, number_types = NUMBER_OPERATIONS[node.op]
+
+        def closure(interpreter: OQSInterpreter) -> any:
+            left_value: any = left(interpreter)
+            right_value: any = right(interpreter)
+            if left_value.__class__ in number_types and right_value.__class__ in number_types:
+                return number_operation(left_value, right_value)
+            return evaluated_operation(interpreter, function, name, left_value, right_value)
+
+        return closure
+
+    def compile_function(self, node: FunctionNode) -> Closure:
+        name: str = node.name
+        function_key: str = node.key
+        bound_function: Callable | None = self.functions.get(function_key)
+        if (
+                function_key in ["IF", "AND", "OR"]
+                and bound_function is BUILT_IN_FUNCTIONS[function_key]
+                and len(node.args) >= 2
+                and not node.packed
+        ):
+            return self.compile_control_flow(node=node)
+        args: list[ASTNode] = [self.compile_element(arg) for arg in node.args]
+        packed_args: list[bool] = [isinstance(arg, PackedNode) for arg in node.args]
+        function_node: FunctionNode | None = None if node.packed else FunctionNode(name=name, args=args)
+
+        def closure(interpreter: OQSInterpreter) -> any:
+            try:
+                function: Callable | None = bound_function or interpreter.functions.get(function_key)
+                if function is None:
+                    raise OQSUndefinedFunctionError(function_name=name)
+                if function_node is not None:
+                    return function(interpreter, function_node)
+                call_args: list[ASTNode] = []
+                for packed, arg in zip(packed_args, args):
+                    if packed:
+                        value: any = arg.closure(interpreter)
+                        if not isinstance(value, list):
+                            raise OQSTypeError(message="Cannot unpack anything into a function call other than a List.")
+                        call_args.extend([EvaluatedNode(part) for part in value])
+                    else:
+                        call_args.append(arg)
+                return function(interpreter, FunctionNode(name=name, args=call_args))
+            except OQSBaseError:
+                raise
+            except Exception as e:
+                raise OQSFunctionEvaluationError(function_name=name, message=str(e))
+
+        return closure
+
+    def compile_control_flow(self, node: FunctionNode) -> Closure:
+        name: str = node.name
+        operands: list[Closure] = [self.compile_operand(arg) for arg in node.args]
+        if node.key == "IF":
+            branches: list[tuple[Closure, Closure]] = list(zip(operands[0:-1:2], operands[1::2]))
+            default: Closure | None = operands[-1] if len(operands) % 2 != 0 else None
+
+            def evaluate(interpreter: OQSInterpreter) -> any:
+                for condition, branch in branches:
+                    if condition(interpreter):
+                        return branch(interpreter)
+                return default(interpreter) if default is not None else None
+        else:
+            stop_on: bool = node.key == "OR"
+
+            def evaluate(interpreter: OQSInterpreter) -> bool:
+                for operand in operands:
+                    if bool(operand(interpreter)) is stop_on:
+                        return stop_on
+                return not stop_on
+
+        def closure(interpreter: OQSInterpreter) -> any:
+            try:
+                return evaluate(interpreter)
+            except OQSBaseError:
+                raise
+            except Exception as e:
+                raise OQSFunctionEvaluationError(function_name=name, message=str(e))
+
+        return closure
+
+
+class OQSClosureInterpreter(OQSInterpreter):
+    COMPILER: OQSClosureCompiler = OQSClosureCompiler()
+    INSTRUMENTED_COMPILER: OQSClosureCompiler = OQSClosureCompiler(instrumented=True)
+
+    def __init__(
+            self,
+            expression: str,
+            variables: dict[str, any] | None = None,
+            ast: ASTNode | None = None,
+            parsed_expressions: dict[str, ASTNode] | None = None,
+            governor: OQSGovernor | None = None,
+            profiler: OQSProfiler | None = None,
+            registry: OQSFunctionRegistry | None = None
+    ) -> None:
+        super().__init__(
+            expression=expression,
+            variables=variables,
+            ast=ast,
+            parsed_expressions=parsed_expressions,
+            governor=governor,
+            profiler=profiler,
+            registry=registry
+        )
+        instrumented: bool = governor is not None or profiler is not None
+        self.compiler: OQSClosureCompiler = self.INSTRUMENTED_COMPILER if instrumented else self.COMPILER
+        if self.original_ast.__class__ is not CompiledNode:
+            self.original_ast: CompiledNode = self.compiler.compile(self.original_ast)
+
+    @classmethod
+    def prepare_ast(cls, ast: ASTNode, instrumented: bool = False) -> CompiledNode:
+        return (cls.INSTRUMENTED_COMPILER if instrumented else cls.COMPILER).compile(ast)
+
+    def install_profiler(self, profiler: OQSProfiler) -> None:
+        pass
+
+    def parse_and_evaluate(self, expression: str) -> any:
+        compiled: CompiledNode | None = self.parsed_expressions.get(expression)
+        if compiled is None:
+            compiled: CompiledNode = self.compiler.compile(self.parser.parse(expression=expression))
+            self.parsed_expressions[expression] = compiled
+        return compiled.closure(self)
+
+    def is_fresh(self, node: ASTNode) -> bool:
+        if node.__class__ is CompiledNode:
+            return super().is_fresh(node.source)
+        return super().is_fresh(node)
+
+    def loop_scope(self, body: ASTNode, variable_name: str) -> OQSScope:
+        if body.__class__ is CompiledNode:
+            return super().loop_scope(body=body.source, variable_name=variable_name)
+        return super().loop_scope(body=body, variable_name=variable_name)
+
+    def is_invariant(self, node: ASTNode) -> bool:
+        if node.__class__ is CompiledNode:
+            return super().is_invariant(node.source)
+        return super().is_invariant(node)
+
+    def evaluate_sequence(self, node: ASTNode) -> any:
+        if self.is_invariant(node):
+            return self.evaluate(node)
+        elif node.__class__ is CompiledNode and isinstance(node.source, FunctionNode) and not node.source.packed:
+            if node.function_node is None:
+                node.function_node = FunctionNode(
+                    name=node.source.name, args=[self.compiler.compile(arg) for arg in node.source.args]
+                )
+            return super().evaluate_sequence(node.function_node)
+        elif node.__class__ is CompiledNode and isinstance(node.source, BinaryOpNode):
+            if node.function_node is None:
+                node.function_node = BinaryOpNode(
+                    left=self.compiler.compile(node.source.left),
+                    op=node.source.op,
+                    right=self.compiler.compile(node.source.right)
+                )
+            return super().evaluate_sequence(node.function_node)
+        return super().evaluate_sequence(node)
+
+    def evaluate(self, node: ASTNode) -> any:
+        if node.__class__ is CompiledNode:
+            if self.variables.__class__ is OQSScope and node.source in self.variables.invariants:
+                return self.evaluate_invariant(scope=self.variables, node=node, source=node.source)
+            return node.closure(self)
+        return super().evaluate(node)
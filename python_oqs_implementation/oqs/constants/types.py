@@ -27,4 +27,28 @@ class ErrorTypeStrings:
     DIVISION_BY_ZERO: str = "Division By Zero Error"
     UNEXPECTED_CHARACTER: str = "Unexpected Character Error"
     MISSING_EXPECTED_CHARACTER: str = "Missing Expected Character Error"
+    RESOURCE_LIMIT: str = "Resource Limit Error"
     CUSTOM: str = "Custom Error"
+
+
+class TokenTypeStrings:
+    NUMBER: str = "number"
+    STRING: str = "string"
+    NAME: str = "name"
+    OPERATOR: str = "operator"
+    OPEN: str = "open"
+    CLOSE: str = "close"
+    COMMA: str = "comma"
+    COLON: str = "colon"
+    INVALID: str = "invalid"
+
+
+class BackendTypeStrings:
+    INTERPRETER: str = "interpreter"
+    CLOSURE: str = "closure"
+    NATIVE: str = "native"
+
+
+class ExecutorTypeStrings:
+    THREAD: str = "thread"
+    PROCESS: str = "process"
@@ -32,3 +32,33 @@ OPS_TYPE_HIERARCHY_MAPPING: dict[type, list[str]] = {
 
 
 MAX_ARGS: int = 999_999_999_999
+
+DEFAULT_PARSE_CACHE_SIZE: int = 1_024
+
+MAX_FOLDED_CONTAINER_SIZE: int = 1_000
+
+MAX_FOLDING_STEPS: int = 10_000
+
+MAX_FOLDING_ELEMENTS: int = 10_000
+
+MAX_REPEATED_SIZE: int = 10_000_000
+
+MIN_HASHED_LOOKUP_SIZE: int = 8
+
+MAX_CACHED_VALUE_SETS: int = 16
+
+DEADLINE_CHECK_INTERVAL: int = 1_024
+
+BATCH_CHUNKS_PER_WORKER: int = 4
+
+WORKER_COMPILED_EXPRESSION_CACHE_SIZE: int = 1_024
+
+DEFAULT_VECTOR_CHUNK_SIZE: int = 4_096
+
+MAX_CACHED_REGISTRY_OVERLAYS: int = 256
+
+DEFAULT_TEMPLATE_CACHE_SIZE: int = 1_024
+
+LOOP_INVARIANT_CACHE_SIZE: int = 1_024
+
+TEMPORAL_FORMAT_CACHE_SIZE: int = 256
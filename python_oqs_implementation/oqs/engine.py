@@ -1,9 +1,32 @@
+import copy
+import math
 import re
 import time
-from typing import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+from .analysis import called_functions
+from .compiler import OQSClosureInterpreter
+from .constants.types import BackendTypeStrings as BTS, ExecutorTypeStrings as XTS
+from .constants.values import (
+    BATCH_CHUNKS_PER_WORKER,
+    DEFAULT_TEMPLATE_CACHE_SIZE,
+    DEFAULT_VECTOR_CHUNK_SIZE,
+    WORKER_COMPILED_EXPRESSION_CACHE_SIZE
+)
 from .interpreter import OQSInterpreter
+from .native import OQSNativeInterpreter
+from .optimizer import OQSOptimizer
 from .errors import OQSBaseError
+from .governor import (OQSGovernor, ResourceLimits)
+from .nodes import ASTNode
+from .parser import OQSParser
+from .profiler import OQSProfiler
+from .registry import OQSFunctionRegistry
+from .utils.cache import LRUCache
 from .utils.shortcuts import get_oqs_type
+from .vectorizer import (OQSVectorizationUnsupported, OQSVectorizer, numpy)
 
 
 class ExpressionInput:
@@ -13,11 +36,352 @@ class ExpressionInput:
         self.string_embedded: bool = string_embedded
 
 
+class CompiledExpression:
+    BACKENDS: dict[str, type[OQSInterpreter]] = {
+        BTS.INTERPRETER: OQSInterpreter,
+        BTS.CLOSURE: OQSClosureInterpreter,
+        BTS.NATIVE: OQSNativeInterpreter
+    }
+
+    def __init__(
+            self,
+            expression: str,
+            backend: str = BTS.INTERPRETER,
+            optimize: bool = True,
+            known_variables: dict[str, any] | None = None,
+            defer_undefined_functions: bool = False,
+            registry: OQSFunctionRegistry | None = None
+    ) -> None:
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Expected one of: {', '.join(self.BACKENDS)}")
+        self.expression: str = expression
+        self.backend: str = backend
+        self.known_variables: dict[str, any] = known_variables if known_variables is not None else {}
+        self.defer_undefined_functions: bool = defer_undefined_functions
+        self.registry: OQSFunctionRegistry = registry if registry is not None else OQSInterpreter.REGISTRY
+        ast: ASTNode = OQSParser(eager=True).parse(expression=expression)
+        self.called_functions: dict[str, str] = called_functions(ast)
+        self.unoptimized_ast: ASTNode = ast
+        if optimize or self.known_variables:
+            ast: ASTNode = OQSOptimizer(
+                known_variables=self.known_variables, functions=self.registry.functions
+            ).optimize(ast)
+        self.source_ast: ASTNode = ast
+        self.ast: ASTNode = self.BACKENDS[backend].prepare_ast(ast=ast)
+        self.parsed_expressions: dict[str, ASTNode] = {}
+        self.instrumented_asts: dict[bool, tuple[ASTNode, dict[str, ASTNode]]] = {}
+        self.checked_registry: OQSFunctionRegistry | None = None
+
+    def instrumented(self, governed: bool) -> tuple[ASTNode, dict[str, ASTNode]]:
+        if governed not in self.instrumented_asts:
+            self.instrumented_asts[governed] = (
+                self.BACKENDS[self.backend].prepare_ast(
+                    ast=self.unoptimized_ast if governed else self.source_ast, instrumented=True
+                ),
+                {}
+            )
+        return self.instrumented_asts[governed]
+
+    def results(
+            self,
+            variables: dict[str, any] | None = None,
+            additional_functions: list[tuple[str, Callable]] | None = None,
+            limits: ResourceLimits | None = None,
+            profiler: OQSProfiler | None = None,
+            registry: OQSFunctionRegistry | None = None
+    ) -> any:
+        if self.known_variables:
+            variables: dict[str, any] = {**(variables or {}), **self.known_variables}
+        registry: OQSFunctionRegistry = registry if registry is not None else self.registry
+        if additional_functions:
+            registry: OQSFunctionRegistry = registry.extend(additional_functions)
+        if limits is None and profiler is None:
+            interpreter: OQSInterpreter = self.BACKENDS[self.backend](
+                expression=self.expression,
+                variables=variables,
+                ast=self.ast,
+                parsed_expressions=self.parsed_expressions,
+                registry=registry
+            )
+        else:
+            ast, parsed_expressions = self.instrumented(governed=limits is not None)
+            interpreter: OQSInterpreter = self.BACKENDS[self.backend](
+                expression=self.expression,
+                variables=variables,
+                ast=ast,
+                parsed_expressions=parsed_expressions,
+                governor=OQSGovernor(limits=limits) if limits is not None else None,
+                profiler=profiler,
+                registry=registry
+            )
+        if not self.defer_undefined_functions and registry is not self.checked_registry:
+            interpreter.check_functions(functions=self.called_functions)
+            self.checked_registry: OQSFunctionRegistry | None = registry
+        return interpreter.results()
+
+    def evaluate(
+            self,
+            variables: dict[str, any] | None = None,
+            additional_functions: list[tuple[str, Callable]] | None = None,
+            limits: ResourceLimits | None = None,
+            profiler: OQSProfiler | None = None,
+            registry: OQSFunctionRegistry | None = None
+    ) -> dict[str, any]:
+        return capture_results(
+            lambda: self.results(
+                variables=variables,
+                additional_functions=additional_functions,
+                limits=limits,
+                profiler=profiler,
+                registry=registry
+            )
+        )
+
+    def evaluate_many(
+            self,
+            rows: Iterable[dict[str, any] | None],
+            additional_functions: list[tuple[str, Callable]] | None = None,
+            vectorize: bool = False,
+            chunk_size: int = DEFAULT_VECTOR_CHUNK_SIZE,
+            limits: ResourceLimits | None = None
+    ) -> Iterator[dict[str, any]]:
+        if vectorize and numpy is None:
+            raise ImportError("Vectorized evaluation requires NumPy. Install it with 'pip install numpy'.")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if additional_functions is None:
+            additional_functions: list[tuple[str, Callable]] = []
+        vectorizer: OQSVectorizer | None = OQSVectorizer(ast=self.source_ast) if vectorize else None
+        if vectorizer is None or not vectorizer.is_vectorizable:
+            return (
+                self.evaluate(variables=row, additional_functions=additional_functions, limits=limits) for row in rows
+            )
+        return self.evaluate_vectorized(
+            rows=rows,
+            additional_functions=additional_functions,
+            vectorizer=vectorizer,
+            chunk_size=chunk_size,
+            limits=limits
+        )
+
+    def evaluate_vectorized(
+            self,
+            rows: Iterable[dict[str, any] | None],
+            additional_functions: list[tuple[str, Callable]],
+            vectorizer: OQSVectorizer,
+            chunk_size: int,
+            limits: ResourceLimits | None = None
+    ) -> Iterator[dict[str, any]]:
+        rows: Iterator[dict[str, any] | None] = iter(rows)
+        registry: OQSFunctionRegistry = self.registry.extend(additional_functions)
+        while chunk := list(islice(rows, chunk_size)):
+            values: list[any] | None = None
+            fallback: list[bool] = [True] * len(chunk)
+            if OQSVectorizer.uses_built_in_operators(functions=registry.functions):
+                merged_rows: list[dict[str, any] | None] = [
+                    {**(row or {}), **self.known_variables} for row in chunk
+                ] if self.known_variables else chunk
+                try:
+                    values, fallback = vectorizer.evaluate(rows=merged_rows)
+                except OQSVectorizationUnsupported:
+                    pass
+            for index, row in enumerate(chunk):
+                if fallback[index]:
+                    yield self.evaluate(variables=row, additional_functions=additional_functions, limits=limits)
+                else:
+                    yield {"results": {"value": values[index], "type": get_oqs_type(values[index])}}
+
+
+class CompiledTemplate:
+    EMBEDDED_EXPRESSION_PATTERN: re.Pattern = re.compile(r'<\{(.*?)\}>')
+
+    def __init__(
+            self,
+            template: str,
+            backend: str = BTS.INTERPRETER,
+            optimize: bool = True,
+            defer_undefined_functions: bool = False,
+            registry: OQSFunctionRegistry | None = None
+    ) -> None:
+        self.template: str = template
+        parts: list[str] = self.EMBEDDED_EXPRESSION_PATTERN.split(template)
+        self.chunks: list[str] = parts[0::2]
+        slot_indexes: dict[str, int] = {}
+        self.positions: list[int] = [
+            slot_indexes.setdefault(expression, len(slot_indexes)) for expression in parts[1::2]
+        ]
+        self.slots: list[CompiledExpression | dict[str, any]] = []
+        for expression in slot_indexes:
+            try:
+                self.slots.append(
+                    compile_expression(
+                        expression=expression,
+                        backend=backend,
+                        optimize=optimize,
+                        defer_undefined_functions=defer_undefined_functions,
+                        registry=registry
+                    )
+                )
+            except Exception as e:
+                self.slots.append(error_results(error=e))
+
+    def render(
+            self,
+            variables: dict[str, any] | None = None,
+            additional_functions: list[tuple[str, Callable]] | None = None,
+            limits: ResourceLimits | None = None,
+            profiler: OQSProfiler | None = None,
+            registry: OQSFunctionRegistry | None = None
+    ) -> str:
+        values: list[str] = []
+        for slot in self.slots:
+            slot_results: dict[str, any] = slot if isinstance(slot, dict) else slot.evaluate(
+                variables=variables,
+                additional_functions=additional_functions,
+                limits=limits,
+                profiler=profiler,
+                registry=registry
+            )
+            values.append(str(slot_results["results"]["value"]))
+        pieces: list[str] = [self.chunks[0]]
+        for position, chunk in zip(self.positions, self.chunks[1:]):
+            pieces.append(values[position])
+            pieces.append(chunk)
+        return "".join(pieces)
+
+    def evaluate(
+            self,
+            variables: dict[str, any] | None = None,
+            additional_functions: list[tuple[str, Callable]] | None = None,
+            limits: ResourceLimits | None = None,
+            profiler: OQSProfiler | None = None,
+            registry: OQSFunctionRegistry | None = None
+    ) -> dict[str, any]:
+        return capture_results(
+            lambda: self.render(
+                variables=variables,
+                additional_functions=additional_functions,
+                limits=limits,
+                profiler=profiler,
+                registry=registry
+            )
+        )
+
+
+TEMPLATE_CACHE: LRUCache = LRUCache(maxsize=DEFAULT_TEMPLATE_CACHE_SIZE)
+
+
+def compile_template(
+        template: str,
+        backend: str = BTS.INTERPRETER,
+        optimize: bool = True,
+        defer_undefined_functions: bool = False,
+        registry: OQSFunctionRegistry | None = None
+) -> CompiledTemplate:
+    return CompiledTemplate(
+        template=template,
+        backend=backend,
+        optimize=optimize,
+        defer_undefined_functions=defer_undefined_functions,
+        registry=registry
+    )
+
+
+def compile_template_cached(template: str, defer_undefined_functions: bool) -> CompiledTemplate:
+    cache_key: tuple[str, bool] = (template, defer_undefined_functions)
+    compiled: CompiledTemplate = TEMPLATE_CACHE.get(cache_key)
+    if compiled is LRUCache.MISSING:
+        compiled: CompiledTemplate = compile_template(
+            template=template, optimize=False, defer_undefined_functions=defer_undefined_functions
+        )
+        TEMPLATE_CACHE.put(cache_key, compiled)
+    return compiled
+
+
+def compile_expression(
+        expression: str,
+        backend: str = BTS.INTERPRETER,
+        optimize: bool = True,
+        known_variables: dict[str, any] | None = None,
+        defer_undefined_functions: bool = False,
+        registry: OQSFunctionRegistry | None = None
+) -> CompiledExpression:
+    return CompiledExpression(
+        expression=expression,
+        backend=backend,
+        optimize=optimize,
+        known_variables=known_variables,
+        defer_undefined_functions=defer_undefined_functions,
+        registry=registry
+    )
+
+
+def evaluate_many(
+        expression: str,
+        rows: Iterable[dict[str, any] | None],
+        backend: str = BTS.INTERPRETER,
+        additional_functions: list[tuple[str, Callable]] | None = None,
+        vectorize: bool = False,
+        chunk_size: int = DEFAULT_VECTOR_CHUNK_SIZE,
+        limits: ResourceLimits | None = None,
+        defer_undefined_functions: bool = True,
+        registry: OQSFunctionRegistry | None = None
+) -> Iterator[dict[str, any]]:
+    try:
+        compiled: CompiledExpression = compile_expression(
+            expression=expression,
+            backend=backend,
+            optimize=False,
+            defer_undefined_functions=defer_undefined_functions,
+            registry=registry
+        )
+    except Exception as e:
+        error: dict[str, any] = error_results(error=e)
+        return (copy.deepcopy(error) for _ in rows)
+    return compiled.evaluate_many(
+        rows=rows,
+        additional_functions=additional_functions,
+        vectorize=vectorize,
+        chunk_size=chunk_size,
+        limits=limits
+    )
+
+
+def capture_results(evaluation: Callable[[], any]) -> dict[str, any]:
+    try:
+        result: any = evaluation()
+        return {"results": {"value": result, "type": get_oqs_type(result)}}
+    except Exception as e:
+        return error_results(error=e)
+
+
+def error_results(error: Exception) -> dict[str, any]:
+    if isinstance(error, OQSBaseError):
+        return {"error": {"type": error.readable_name, "message": str(error)}}
+    return {
+        "error": {
+            "type": "unknown", "message": "An unknown error occurred. Please reach out to our help team immediately"
+        },
+        "additional_info": {"type": type(error).__name__, "message": str(error)}
+    }
+
+
+def with_profile(results: dict[str, any], profiler: OQSProfiler | None) -> dict[str, any]:
+    if profiler is not None:
+        results["profile"] = profiler.report()
+    return results
+
+
 def evaluate_expression(
         expression: str | ExpressionInput,
         variables: dict[str, any] | None = None,
         string_embedded: bool = False,
-        additional_functions: list[tuple[str, Callable]] | None = None
+        additional_functions: list[tuple[str, Callable]] | None = None,
+        compiled_expressions: dict[str, CompiledExpression] | LRUCache | None = None,
+        limits: ResourceLimits | None = None,
+        profiler: OQSProfiler | None = None,
+        defer_undefined_functions: bool = True,
+        registry: OQSFunctionRegistry | None = None
 ) -> dict[str, any]:
     if isinstance(expression, ExpressionInput):
         variables: dict[str, any] | None = expression.variables
@@ -25,36 +389,139 @@ def evaluate_expression(
         expression: str = expression.expression
     if additional_functions is None:
         additional_functions: list[tuple[str, Callable]] = []
-    try:
-        if string_embedded:
-            def replace_embedded(match: re.match):
-                embedded_expr: str = match.group(1)
-                embedded_result: dict[str, any] = evaluate_expression(
-                    expression=embedded_expr,
-                    variables=variables,
-                    string_embedded=False,
-                    additional_functions=additional_functions
-                )
-                return str(embedded_result["results"]["value"])
+    if string_embedded:
+        return with_profile(
+            results=compile_template_cached(
+                template=expression, defer_undefined_functions=defer_undefined_functions
+            ).evaluate(
+                variables=variables,
+                additional_functions=additional_functions,
+                limits=limits,
+                profiler=profiler,
+                registry=registry
+            ),
+            profiler=profiler
+        )
 
-            result_expression: str = re.sub(r'<\{(.*?)\}>', replace_embedded, expression)
-            return {"results": {"value": result_expression, "type": "String"}}
+    def compile_cached() -> CompiledExpression:
+        if compiled_expressions is None:
+            return compile_expression(
+                expression=expression, optimize=False, defer_undefined_functions=defer_undefined_functions
+            )
+        compiled: CompiledExpression | None = compiled_expressions.get(expression)
+        if compiled is None or compiled is LRUCache.MISSING:
+            compiled: CompiledExpression = compile_expression(
+                expression=expression, optimize=False, defer_undefined_functions=defer_undefined_functions
+            )
+            if isinstance(compiled_expressions, LRUCache):
+                compiled_expressions.put(expression, compiled)
+            else:
+                compiled_expressions[expression] = compiled
+        return compiled
 
-        interpreter: OQSInterpreter = OQSInterpreter(expression=expression, variables=variables)
-        for function_name, function in additional_functions:
-            interpreter.add_additional_function(function_name=function_name, function=function)
-        result: any = interpreter.results()
+    return with_profile(
+        results=capture_results(
+            lambda: compile_cached().results(
+                variables=variables,
+                additional_functions=additional_functions,
+                limits=limits,
+                profiler=profiler,
+                registry=registry
+            )
+        ),
+        profiler=profiler
+    )
 
-        return {"results": {"value": result, "type": get_oqs_type(result)}}
-    except OQSBaseError as e:
-        return {"error": {"type": e.readable_name, "message": str(e)}}
-    except Exception as e:
-        return {
-            "error": {
-                "type": "unknown", "message": "An unknown error occurred. Please reach out to our help team immediately"
-            },
-            "additional_info": {"type": type(e).__name__, "message": str(e)}
-        }
+
+WORKER_COMPILED_EXPRESSIONS: LRUCache = LRUCache(maxsize=WORKER_COMPILED_EXPRESSION_CACHE_SIZE)
+
+
+def reset_worker_compiled_expressions() -> None:
+    WORKER_COMPILED_EXPRESSIONS.clear()
+
+
+def evaluate_batch(
+        expression_inputs: list[ExpressionInput],
+        additional_functions: list[tuple[str, Callable]] | None = None,
+        compiled_expressions: dict[str, CompiledExpression] | LRUCache | None = None,
+        limits: ResourceLimits | None = None,
+        profile: bool = False,
+        defer_undefined_functions: bool = True,
+        registry: OQSFunctionRegistry | None = None
+) -> list[dict[str, any]]:
+    if compiled_expressions is None:
+        compiled_expressions: LRUCache = WORKER_COMPILED_EXPRESSIONS
+    return [
+        evaluate_expression(
+            expression=expression_input,
+            additional_functions=additional_functions,
+            compiled_expressions=compiled_expressions,
+            limits=limits,
+            profiler=OQSProfiler() if profile else None,
+            defer_undefined_functions=defer_undefined_functions,
+            registry=registry
+        )
+        for expression_input in expression_inputs
+    ]
+
+
+def evaluate_multiple_expressions(
+        expression_inputs: list[ExpressionInput],
+        additional_functions: list[tuple[str, Callable]] | None = None,
+        workers: int = 1,
+        executor: str = XTS.THREAD,
+        chunk_size: int | None = None,
+        limits: ResourceLimits | None = None,
+        profile: bool = False,
+        defer_undefined_functions: bool = True,
+        registry: OQSFunctionRegistry | None = None
+) -> list[dict[str, any]]:
+    if executor not in (XTS.THREAD, XTS.PROCESS):
+        raise ValueError(f"Unknown executor '{executor}'. Expected one of: {XTS.THREAD}, {XTS.PROCESS}")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    expression_inputs: list[ExpressionInput] = list(expression_inputs)
+    if workers == 1 or len(expression_inputs) <= 1:
+        return evaluate_batch(
+            expression_inputs=expression_inputs,
+            additional_functions=additional_functions,
+            compiled_expressions={},
+            limits=limits,
+            profile=profile,
+            defer_undefined_functions=defer_undefined_functions,
+            registry=registry
+        )
+    if chunk_size is None:
+        chunk_size: int = max(1, math.ceil(len(expression_inputs) / (workers * BATCH_CHUNKS_PER_WORKER)))
+    chunks: list[list[ExpressionInput]] = [
+        expression_inputs[index:index + chunk_size] for index in range(0, len(expression_inputs), chunk_size)
+    ]
+    if executor == XTS.THREAD:
+        pool: Executor = ThreadPoolExecutor(max_workers=workers)
+        evaluate_chunk: Callable = partial(
+            evaluate_batch,
+            additional_functions=additional_functions,
+            compiled_expressions=LRUCache(maxsize=WORKER_COMPILED_EXPRESSION_CACHE_SIZE),
+            limits=limits,
+            profile=profile,
+            defer_undefined_functions=defer_undefined_functions,
+            registry=registry
+        )
+    else:
+        pool: Executor = ProcessPoolExecutor(max_workers=workers, initializer=reset_worker_compiled_expressions)
+        evaluate_chunk: Callable = partial(
+            evaluate_batch,
+            additional_functions=additional_functions,
+            limits=limits,
+            profile=profile,
+            defer_undefined_functions=defer_undefined_functions,
+            registry=registry
+        )
+    with pool:
+        chunk_results: Iterable[list[dict[str, any]]] = pool.map(evaluate_chunk, chunks)
+        return [result for chunk_result in chunk_results for result in chunk_result]
 
 
 def oqs_engine(
@@ -64,22 +531,42 @@ def oqs_engine(
         report_usage: bool = False,
         evaluate_multiple: bool = False,
         expression_inputs: list[ExpressionInput] = None,
-        additional_functions: list[tuple[str, Callable]] | None = None
+        additional_functions: list[tuple[str, Callable]] | None = None,
+        workers: int = 1,
+        executor: str = XTS.THREAD,
+        chunk_size: int | None = None,
+        limits: ResourceLimits | None = None,
+        profile: bool = False,
+        defer_undefined_functions: bool = True,
+        registry: OQSFunctionRegistry | None = None
 ) -> dict[str, any]:
     start_cpu_time: int = time.process_time_ns()
     if evaluate_multiple:
         if expression_inputs is None:
             expression_inputs: list[ExpressionInput] = []
-        expression_results: list[dict[str, any]] = []
-        for expression_input in expression_inputs:
-            expression_results.append(evaluate_expression(expression=expression_input))
-        results: dict[str, any] = {"results": expression_results}
+        results: dict[str, any] = {
+            "results": evaluate_multiple_expressions(
+                expression_inputs=expression_inputs,
+                additional_functions=additional_functions,
+                workers=workers,
+                executor=executor,
+                chunk_size=chunk_size,
+                limits=limits,
+                profile=profile,
+                defer_undefined_functions=defer_undefined_functions,
+                registry=registry
+            )
+        }
     else:
         results: dict[str, any] = evaluate_expression(
             expression=expression,
             variables=variables,
             string_embedded=string_embedded,
-            additional_functions=additional_functions
+            additional_functions=additional_functions,
+            limits=limits,
+            profiler=OQSProfiler() if profile else None,
+            defer_undefined_functions=defer_undefined_functions,
+            registry=registry
         )
     if report_usage:
         results["cpu_time_ns"] = time.process_time_ns() - start_cpu_time
@@ -96,6 +96,13 @@ class OQSMissingExpectedCharacterError(OQSSyntaxError):
         super().__init__(message=message)
 
 
+class OQSResourceLimitError(OQSBaseError):
+    READABLE_NAME: str = ETS.RESOURCE_LIMIT
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message=message)
+
+
 class OQSCustomErrorParent(OQSBaseError, ABC):
     READABLE_NAME: str = ETS.CUSTOM
 
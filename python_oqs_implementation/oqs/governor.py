@@ -0,0 +1,79 @@
+import time
+from typing import (Iterable, Iterator, NamedTuple)
+from .constants.values import DEADLINE_CHECK_INTERVAL
+from .errors import OQSResourceLimitError
+
+
+class ResourceLimits(NamedTuple):
+    max_steps: int | None = None
+    max_elements: int | None = None
+    timeout: float | None = None
+
+
+def allocation_size(value: any) -> int:
+    if isinstance(value, (list, dict, str)):
+        return len(value)
+    return 0
+
+
+class OQSGovernor:
+    __slots__ = ("limits", "steps", "elements", "deadline", "until_deadline_check")
+
+    def __init__(self, limits: ResourceLimits) -> None:
+        self.limits: ResourceLimits = limits
+        self.steps: int = 0
+        self.elements: int = 0
+        self.deadline: float | None = None
+        self.until_deadline_check: int = DEADLINE_CHECK_INTERVAL
+
+    def start(self) -> None:
+        self.steps: int = 0
+        self.elements: int = 0
+        self.until_deadline_check: int = DEADLINE_CHECK_INTERVAL
+        self.deadline: float | None = (
+            time.monotonic() + self.limits.timeout if self.limits.timeout is not None else None
+        )
+
+    def step(self) -> None:
+        self.steps += 1
+        if self.limits.max_steps is not None and self.steps > self.limits.max_steps:
+            raise OQSResourceLimitError(message=f"Evaluation exceeded the limit of {self.limits.max_steps} steps")
+        self.tick()
+
+    def allocate(self, count: int) -> None:
+        self.reserve(count=count)
+        self.elements += count
+
+    def reserve(self, count: int) -> None:
+        if self.limits.max_elements is not None and self.elements + count > self.limits.max_elements:
+            raise OQSResourceLimitError(
+                message=f"Evaluation exceeded the limit of {self.limits.max_elements} elements"
+            )
+        self.tick()
+
+    def tick(self) -> None:
+        self.until_deadline_check -= 1
+        if self.until_deadline_check <= 0:
+            self.until_deadline_check: int = DEADLINE_CHECK_INTERVAL
+            self.check_deadline()
+
+    def check_deadline(self) -> None:
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise OQSResourceLimitError(
+                message=f"Evaluation exceeded the time limit of {self.limits.timeout} seconds"
+            )
+
+    def meter(self, iterable: Iterable) -> Iterator:
+        for item in iterable:
+            self.allocate(1)
+            yield item
+
+    def reserving(self, iterable: Iterable) -> Iterator:
+        count: int = 0
+        for item in iterable:
+            count += 1
+            self.reserve(count=count)
+            yield item
+
+    def usage(self) -> dict[str, int]:
+        return {"steps": self.steps, "elements": self.elements}
@@ -1,5 +1,8 @@
-from typing import Callable
+from types import MappingProxyType
+from typing import (Callable, Mapping)
 from . import built_in_functions
+from .analysis import loop_invariants
+from .constants.values import (LOOP_INVARIANT_CACHE_SIZE, MAX_REPEATED_SIZE)
 from .errors import (
     OQSUndefinedFunctionError,
     OQSBaseError,
@@ -24,7 +27,16 @@ from .nodes import (
     PackedNode,
     EvaluatedNode
 )
+from .governor import (OQSGovernor, allocation_size)
 from .parser import OQSParser
+from .registry import OQSFunctionRegistry
+from .scope import OQSScope
+from .sequences import LazyList
+from .utils.cache import LRUCache
+from .utils.hashing import ValueSet
+
+
+LOOP_INVARIANT_CACHE: LRUCache = LRUCache(maxsize=LOOP_INVARIANT_CACHE_SIZE)
 
 
 class OQSInterpreter:
@@ -46,7 +58,7 @@ class OQSInterpreter:
         '&': "AND",
         '|': "OR"
     }
-    FUNCTIONS: dict[str, Callable] = {
+    FUNCTIONS: Mapping[str, Callable] = MappingProxyType({
         "ADD": built_in_functions.bif_add,
         "SUBTRACT": built_in_functions.bif_subtract,
         "MULTIPLY": built_in_functions.bif_multiply,
@@ -109,24 +121,191 @@ class OQSInterpreter:
         "FORMAT_TEMPORAL": built_in_functions.bif_format_temporal,
         "EXTRACT_DATE": built_in_functions.bif_date,
         "EXTRACT_TIME": built_in_functions.bif_time
+    })
+    REGISTRY: OQSFunctionRegistry = OQSFunctionRegistry(functions=FUNCTIONS)
+    SEQUENCE_FUNCTIONS: dict[Callable, Callable] = {
+        built_in_functions.bif_range: built_in_functions.lazy_range,
+        built_in_functions.bif_for_or_map: built_in_functions.lazy_for_or_map,
+        built_in_functions.bif_filter: built_in_functions.lazy_filter,
+        built_in_functions.bif_slice: built_in_functions.lazy_slice,
+        built_in_functions.bif_multiply: built_in_functions.lazy_multiply
     }
+    FRESH_FUNCTIONS: frozenset[Callable] = frozenset({
+        built_in_functions.bif_add,
+        built_in_functions.bif_subtract,
+        built_in_functions.bif_multiply,
+        built_in_functions.bif_list,
+        built_in_functions.bif_kvs,
+        built_in_functions.bif_keys,
+        built_in_functions.bif_values,
+        built_in_functions.bif_unique,
+        built_in_functions.bif_reverse,
+        built_in_functions.bif_append,
+        built_in_functions.bif_update,
+        built_in_functions.bif_remove_item,
+        built_in_functions.bif_remove,
+        built_in_functions.bif_range,
+        built_in_functions.bif_for_or_map,
+        built_in_functions.bif_filter,
+        built_in_functions.bif_sort,
+        built_in_functions.bif_flatten,
+        built_in_functions.bif_slice
+    })
+    PURE_FUNCTIONS: frozenset[Callable] = frozenset(FUNCTIONS.values()) - {
+        built_in_functions.bif_now,
+        built_in_functions.bif_today,
+        built_in_functions.bif_time_now
+    }
+    MAX_REPEATED_SIZE: int = MAX_REPEATED_SIZE
+    PARSER: OQSParser = OQSParser(eager=True)
 
-    def __init__(self, expression: str, variables: dict[str, any] | None = None) -> None:
+    def __init__(
+            self,
+            expression: str,
+            variables: dict[str, any] | None = None,
+            ast: ASTNode | None = None,
+            parsed_expressions: dict[str, ASTNode] | None = None,
+            governor: OQSGovernor | None = None,
+            profiler: 'OQSProfiler | None' = None,
+            registry: OQSFunctionRegistry | None = None
+    ) -> None:
         self.original_expression: str = expression
-        self.parser: OQSParser = OQSParser()
-        self.original_ast: ASTNode = self.parser.parse(expression=self.original_expression)
+        self.parser: OQSParser = self.PARSER
+        self.original_ast: ASTNode = ast if ast is not None else self.parser.parse(expression=self.original_expression)
         self.variables: dict[str, any] = variables if variables else {}
+        self.parsed_expressions: dict[str, ASTNode] = parsed_expressions if parsed_expressions is not None else {}
+        self.registry: OQSFunctionRegistry = registry if registry is not None else self.REGISTRY
+        self.functions: Mapping[str, Callable] = self.registry.functions
+        self.value_sets: dict[int, tuple[list[any], int, ValueSet]] = {}
+        self.governor: OQSGovernor | None = governor
+        self.profiler: 'OQSProfiler | None' = profiler
+        if profiler is not None:
+            self.install_profiler(profiler=profiler)
+
+    @classmethod
+    def prepare_ast(cls, ast: ASTNode, instrumented: bool = False) -> ASTNode:
+        return ast
+
+    def install_profiler(self, profiler: 'OQSProfiler') -> None:
+        evaluate: Callable[[ASTNode], any] = self.evaluate
+
+        def profiled_evaluate(node: ASTNode) -> any:
+            if self.is_invariant(node):
+                return evaluate(node)
+            return profiler.measure(node=node, function=evaluate, argument=node, fresh=self.is_fresh(node))
+
+        self.evaluate = profiled_evaluate
 
     def add_additional_function(self, function_name: str, function: Callable):
-        self.FUNCTIONS[function_name.upper()] = function
+        self.registry: OQSFunctionRegistry = self.registry.extend([(function_name, function)])
+        self.functions: Mapping[str, Callable] = self.registry.functions
 
     def results(self) -> any:
+        if self.governor is not None:
+            self.governor.start()
         return self.evaluate(self.original_ast)
 
-    def parse_and_evaluate(self, *args, **kwargs) -> any:
-        return self.evaluate(self.parser.parse(*args, **kwargs))
+    def parse_and_evaluate(self, expression: str) -> any:
+        ast: ASTNode | None = self.parsed_expressions.get(expression)
+        if ast is None:
+            ast: ASTNode = self.parser.parse(expression=expression)
+            self.parsed_expressions[expression] = ast
+        return self.evaluate(ast)
+
+    def evaluate_packed(self, node: PackedNode) -> any:
+        if node.node is not None:
+            return self.evaluate(node.node)
+        return self.parse_and_evaluate(node.expression)
+
+    def is_invariant(self, node: ASTNode) -> bool:
+        return self.variables.__class__ is OQSScope and node in self.variables.invariants
+
+    def is_fresh(self, node: ASTNode) -> bool:
+        if self.is_invariant(node):
+            return False
+        elif isinstance(node, (ListNode, KVSNode)):
+            return True
+        elif isinstance(node, FunctionNode):
+            return self.functions.get(node.key) in self.FRESH_FUNCTIONS
+        elif isinstance(node, BinaryOpNode):
+            return self.functions.get(self.OPERATORS.get(node.op)) in self.FRESH_FUNCTIONS
+        return False
+
+    def check_functions(self, functions: dict[str, str]) -> None:
+        for function_key, function_name in functions.items():
+            if function_key not in self.functions:
+                raise OQSUndefinedFunctionError(function_name=function_name)
+
+    def operation(self, node: BinaryOpNode | ComparisonOpNode) -> FunctionNode:
+        function_node: FunctionNode | None = node.function_node
+        if function_node is None:
+            function_node: FunctionNode = FunctionNode(name=self.OPERATORS[node.op], args=[node.left, node.right])
+            node.function_node = function_node
+        return function_node
+
+    def is_pure(self, node: FunctionNode) -> bool:
+        return self.functions.get(node.key) in self.PURE_FUNCTIONS
+
+    def loop_scope(self, body: ASTNode, variable_name: str) -> OQSScope:
+        key: tuple[ASTNode, str, OQSFunctionRegistry] = (body, variable_name, self.registry)
+        invariants: frozenset[ASTNode] = LOOP_INVARIANT_CACHE.get(key)
+        if invariants is LOOP_INVARIANT_CACHE.MISSING:
+            invariants: frozenset[ASTNode] = loop_invariants(
+                body=body, variable_name=variable_name, is_pure=self.is_pure
+            )
+            LOOP_INVARIANT_CACHE.put(key, invariants)
+        return OQSScope(parent=self.variables, invariants=invariants)
+
+    def evaluate_invariant(self, scope: OQSScope, node: ASTNode, source: ASTNode) -> any:
+        while scope.parent.__class__ is OQSScope and source in scope.parent.invariants:
+            scope: OQSScope = scope.parent
+        if source not in scope.invariant_values:
+            scope.invariant_values[source] = self.evaluate_in_scope(scope=scope.parent, node=node)
+        return scope.invariant_values[source]
+
+    def evaluate_in_scope(self, scope: dict[str, any], node: ASTNode) -> any:
+        variables: dict[str, any] = self.variables
+        self.variables = scope
+        try:
+            return self.evaluate(node)
+        finally:
+            self.variables = variables
+
+    def evaluate_sequence(self, node: ASTNode) -> any:
+        if self.is_invariant(node):
+            return self.evaluate(node)
+        elif isinstance(node, BinaryOpNode) and node.op in self.OPERATORS:
+            lazy_function: Callable | None = self.SEQUENCE_FUNCTIONS.get(self.functions.get(self.OPERATORS[node.op]))
+            if lazy_function is not None:
+                return self.streamed(node=node, value=lazy_function(self, self.operation(node)))
+        elif isinstance(node, FunctionNode) and not node.packed:
+            lazy_function: Callable | None = self.SEQUENCE_FUNCTIONS.get(self.functions.get(node.key))
+            if lazy_function is not None:
+                try:
+                    return self.streamed(node=node, value=lazy_function(self, node))
+                except OQSBaseError:
+                    raise
+                except Exception as e:
+                    raise OQSFunctionEvaluationError(function_name=node.name, message=str(e))
+        return self.evaluate(node)
+
+    def streamed(self, node: ASTNode, value: any) -> any:
+        if self.governor is not None and isinstance(value, LazyList):
+            value: any = LazyList(self.governor.meter(value.iterable))
+        if self.profiler is not None and isinstance(value, LazyList):
+            value: any = LazyList(self.profiler.stream(node=node, iterable=value.iterable))
+        return value
+
+    def allocated(self, node: ASTNode, value: any) -> any:
+        if self.governor is not None and self.is_fresh(node):
+            self.governor.allocate(allocation_size(value))
+        return value
 
     def evaluate(self, node: ASTNode) -> any:
+        if self.variables.__class__ is OQSScope and node in self.variables.invariants:
+            return self.evaluate_invariant(scope=self.variables, node=node, source=node)
+        if self.governor is not None:
+            self.governor.step()
         if isinstance(node, EvaluatedNode):
             return node.value
         elif isinstance(node, NumberNode):
@@ -139,14 +318,14 @@ class OQSInterpreter:
             elements: list[any] = []
             for elem in node.elements:
                 if isinstance(elem, PackedNode):
-                    evaluated_elem: any = self.parse_and_evaluate(elem.expression)
+                    evaluated_elem: any = self.evaluate_packed(elem)
                     if isinstance(evaluated_elem, list):
                         elements.extend(evaluated_elem)
                     else:
                         raise OQSTypeError(message="Cannot unpack anything into a list construction other than a List.")
                 else:
                     elements.append(self.evaluate(elem))
-            return elements
+            return self.allocated(node=node, value=elements)
         elif isinstance(node, VariableNode):
             if node.name in self.variables:
                 return self.variables[node.name]
@@ -154,34 +333,34 @@ class OQSInterpreter:
                 raise OQSUndefinedVariableError(node.name)
         elif isinstance(node, BinaryOpNode):
             if node.op in self.OPERATORS:
-                function_node: FunctionNode = FunctionNode(name=self.OPERATORS[node.op], args=[node.left, node.right])
-                return self.FUNCTIONS[function_node.name](self, function_node)
+                function_node: FunctionNode = self.operation(node)
+                return self.allocated(node=node, value=self.functions[function_node.key](self, function_node))
             else:
                 raise OQSSyntaxError(f"Invalid binary operator '{node.op}'")
         elif isinstance(node, ComparisonOpNode):
             if node.op in self.OPERATORS:
-                function_node: FunctionNode = FunctionNode(name=self.OPERATORS[node.op], args=[node.left, node.right])
-                return self.FUNCTIONS[function_node.name](self, function_node)
+                function_node: FunctionNode = self.operation(node)
+                return self.functions[function_node.key](self, function_node)
             else:
                 raise OQSSyntaxError(f"Invalid comparison operator '{node.op}'")
         elif isinstance(node, FunctionNode):
             try:
-                if node.name.upper() in self.FUNCTIONS:
-                    args: list[ASTNode] = []
-                    for arg in node.args:
-                        if isinstance(arg, PackedNode):
-                            parsed_value: any = self.parse_and_evaluate(arg.expression)
-                            if isinstance(parsed_value, list):
-                                args.extend([EvaluatedNode(part) for part in parsed_value])
-                            else:
-                                raise OQSTypeError(
-                                    message="Cannot unpack anything into a function call other than a List."
-                                )
-                        else:
-                            args.append(arg)
-                    return self.FUNCTIONS[node.name.upper()](self, FunctionNode(name=node.name, args=args))
-                else:
+                function: Callable | None = self.functions.get(node.key)
+                if function is None:
                     raise OQSUndefinedFunctionError(function_name=node.name)
+                if not node.packed:
+                    return self.allocated(node=node, value=function(self, node))
+                args: list[ASTNode] = []
+                for arg in node.args:
+                    if isinstance(arg, PackedNode):
+                        parsed_value: any = self.evaluate_packed(arg)
+                        if isinstance(parsed_value, list):
+                            args.extend([EvaluatedNode(part) for part in parsed_value])
+                        else:
+                            raise OQSTypeError(message="Cannot unpack anything into a function call other than a List.")
+                    else:
+                        args.append(arg)
+                return self.allocated(node=node, value=function(self, FunctionNode(name=node.name, args=args)))
             except OQSBaseError:
                 raise
             except Exception as e:
@@ -190,7 +369,7 @@ class OQSInterpreter:
             kvs: dict[str, any] = {}
             for key, value in node.key_value_store.items():
                 if isinstance(value, PackedNode):
-                    unpacked_node: any = self.parse_and_evaluate(value.expression)
+                    unpacked_node: any = self.evaluate_packed(value)
                     if isinstance(unpacked_node, list):
                         unpacked_kvs: dict[str, any] = self.evaluate(
                             FunctionNode(name="UNPACKED_KVS", args=unpacked_node)
@@ -206,7 +385,7 @@ class OQSInterpreter:
                         )
                 else:
                     kvs[self.evaluate(key)] = self.evaluate(value)
-            return kvs
+            return self.allocated(node=node, value=kvs)
         elif isinstance(node, BooleanNode):
             return node.value
         elif isinstance(node, UnparsedNode):
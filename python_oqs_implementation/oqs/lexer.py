@@ -0,0 +1,128 @@
+import re
+from .constants.types import TokenTypeStrings as TTS
+from .errors import (OQSBaseError, OQSMissingExpectedCharacterError, OQSUnexpectedCharacterError)
+
+
+class Token:
+    __slots__ = ("type", "text", "start", "end", "match", "error_class", "message")
+
+    def __init__(
+            self,
+            type: str,
+            text: str,
+            start: int,
+            end: int,
+            error_class: type[OQSBaseError] | None = None,
+            message: str | None = None
+    ) -> None:
+        self.type: str = type
+        self.text: str = text
+        self.start: int = start
+        self.end: int = end
+        self.match: int | None = None
+        self.error_class: type[OQSBaseError] | None = error_class
+        self.message: str | None = message
+
+    def __repr__(self) -> str:
+        return f"Token({self.type!r}, {self.text!r}, {self.start}, {self.end})"
+
+
+class OQSLexer:
+    OPERATOR_CHARACTERS: str = '+-*/%<>=!&|'
+    CLOSING_BRACKETS: dict[str, str] = {'(': ')', '[': ']', '{': '}'}
+    OPENING_BRACKETS: dict[str, str] = {')': '(', ']': '[', '}': '{'}
+    CHARACTERS_ALLOWED_AFTER_NUMBER: str = OPERATOR_CHARACTERS + ')]},:'
+    TOKEN_PATTERN: re.Pattern = re.compile(
+        r"""
+        (?P<whitespace>\s+)
+        |(?P<string>"[^"]*"|'[^']*')
+        |(?P<unterminated_string>["'].*)
+        |(?P<number>\.?\d[\d._]*)
+        |(?P<name>[^\W\d]\w*)
+        |(?P<operator>[+\-*/%<>=!&|]+)
+        |(?P<open>[(\[{])
+        |(?P<close>[)\]}])
+        |(?P<comma>,)
+        |(?P<colon>:)
+        |(?P<invalid>.)
+        """,
+        re.VERBOSE | re.DOTALL
+    )
+
+    @classmethod
+    def tokenize(cls, expression: str) -> list[Token]:
+        tokens: list[Token] = []
+        open_brackets: dict[str, list[int]] = {bracket: [] for bracket in cls.CLOSING_BRACKETS}
+        for match in cls.TOKEN_PATTERN.finditer(expression):
+            kind: str = match.lastgroup
+            if kind == "whitespace":
+                continue
+            text: str = match.group()
+            start, end = match.span()
+            if kind == TTS.NUMBER:
+                tokens.append(cls.number_token(text=text, start=start, end=end))
+                if end < len(expression) and not (
+                        expression[end] in cls.CHARACTERS_ALLOWED_AFTER_NUMBER or expression[end].isspace()
+                ):
+                    tokens.append(
+                        Token(
+                            type=TTS.INVALID,
+                            text=expression[end],
+                            start=end,
+                            end=end + 1,
+                            error_class=OQSUnexpectedCharacterError,
+                            message=f"The character '{expression[end]}' is not expected after the number "
+                                    f"'{tokens[-1].text}'. It is suggested these be separated by a space or an operator."
+                        )
+                    )
+            elif kind == "unterminated_string":
+                tokens.append(
+                    Token(
+                        type=TTS.INVALID,
+                        text=text,
+                        start=start,
+                        end=end,
+                        error_class=OQSMissingExpectedCharacterError,
+                        message=f"Unclosed '{text[0]}' in string: {text}"
+                    )
+                )
+            elif kind == TTS.INVALID:
+                tokens.append(
+                    Token(type=TTS.INVALID, text=text, start=start, end=end, error_class=OQSUnexpectedCharacterError)
+                )
+            else:
+                token: Token = Token(type=kind, text=text, start=start, end=end)
+                if kind == TTS.OPEN:
+                    open_brackets[text].append(len(tokens))
+                elif kind == TTS.CLOSE and open_brackets[cls.OPENING_BRACKETS[text]]:
+                    opening_index: int = open_brackets[cls.OPENING_BRACKETS[text]].pop()
+                    tokens[opening_index].match = len(tokens)
+                    token.match = opening_index
+                tokens.append(token)
+        return tokens
+
+    @staticmethod
+    def number_token(text: str, start: int, end: int) -> Token:
+        if text.startswith('.'):
+            text: str = '0' + text
+        if text.endswith('.'):
+            text += '0'
+        if text.count('.') > 1:
+            return Token(
+                type=TTS.INVALID,
+                text=text,
+                start=start,
+                end=end,
+                error_class=OQSUnexpectedCharacterError,
+                message=f"A Decimal cannot contain more than one '.': {text}"
+            )
+        if '.' in text and '_' in text.split('.')[1]:
+            return Token(
+                type=TTS.INVALID,
+                text=text,
+                start=start,
+                end=end,
+                error_class=OQSUnexpectedCharacterError,
+                message=f"An underscore cannot be used to split a number after the decimal point: {text}"
+            )
+        return Token(type=TTS.NUMBER, text=text.replace('_', ''), start=start, end=end)
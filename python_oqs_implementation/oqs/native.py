@@ -0,0 +1,378 @@
+import ast
+from typing import Callable
+from .compiler import (
+    BUILT_IN_FUNCTIONS,
+    NUMBER_TYPES,
+    Closure,
+    CompiledNode,
+    OQSClosureCompiler,
+    OQSClosureInterpreter,
+    divide,
+    evaluated_operation
+)
+from .errors import (OQSBaseError, OQSFunctionEvaluationError, OQSTypeError, OQSUndefinedVariableError)
+from .interpreter import OQSInterpreter
+from .nodes import (
+    ASTNode,
+    BinaryOpNode,
+    BooleanNode,
+    ComparisonOpNode,
+    EvaluatedNode,
+    FunctionNode,
+    KVSNode,
+    ListNode,
+    NullNode,
+    NumberNode,
+    PackedNode,
+    StringNode,
+    VariableNode
+)
+
+
+MAX_NATIVE_BLOCK_DEPTH: int = 8
+
+
+def native_unpack_into_list(values: list[any], value: any) -> None:
+    if not isinstance(value, list):
+        raise OQSTypeError(message="Cannot unpack anything into a list construction other than a List.")
+    values.extend(value)
+
+
+def native_unpack_into_kvs(interpreter: OQSInterpreter, kvs: dict[str, any], value: any) -> None:
+    if isinstance(value, list):
+        value: any = interpreter.evaluate(FunctionNode(name="UNPACKED_KVS", args=value))
+    elif not isinstance(value, dict):
+        raise OQSTypeError(message="Cannot unpack anything into a KVS construction other than a List or KVS.")
+    for key, item in value.items():
+        kvs[key] = item
+
+
+NATIVE_NAMESPACE: dict[str, any] = {
+    "NUMBER_TYPES": NUMBER_TYPES,
+    "OQSBaseError": OQSBaseError,
+    "OQSFunctionEvaluationError": OQSFunctionEvaluationError,
+    "OQSUndefinedVariableError": OQSUndefinedVariableError,
+    "native_operator": evaluated_operation,
+    "native_divide": divide,
+    "native_unpack_into_list": native_unpack_into_list,
+    "native_unpack_into_kvs": native_unpack_into_kvs
+}
+
+
+def load(identifier: str) -> ast.Name:
+    return ast.Name(id=identifier, ctx=ast.Load())
+
+
+def assign(identifier: str, value: ast.expr) -> ast.Assign:
+    return ast.Assign(targets=[ast.Name(id=identifier, ctx=ast.Store())], value=value)
+
+
+def call(function_name: str, /, *args: ast.expr, **kwargs: ast.expr) -> ast.Call:
+    keywords: list[ast.keyword] = [ast.keyword(arg=key, value=value) for key, value in kwargs.items()]
+    return ast.Call(func=load(function_name), args=list(args), keywords=keywords)
+
+
+def method_call(target: ast.expr, method: str, *args: ast.expr) -> ast.Expr:
+    function: ast.Attribute = ast.Attribute(value=target, attr=method, ctx=ast.Load())
+    return ast.Expr(value=ast.Call(func=function, args=list(args), keywords=[]))
+
+
+def is_number(value: ast.expr) -> ast.Compare:
+    return ast.Compare(left=call("type", value), ops=[ast.In()], comparators=[load("NUMBER_TYPES")])
+
+
+def is_integer(value: ast.expr) -> ast.Compare:
+    return ast.Compare(left=call("type", value), ops=[ast.Is()], comparators=[load("int")])
+
+
+def both(left: ast.expr, right: ast.expr) -> ast.BoolOp:
+    return ast.BoolOp(op=ast.And(), values=[left, right])
+
+
+def as_boolean(test: ast.expr) -> ast.IfExp:
+    return ast.IfExp(test=test, body=ast.Constant(value=True), orelse=ast.Constant(value=False))
+
+
+class NativeTranslator:
+    ARITHMETIC_OPERATORS: dict[str, ast.operator] = {
+        '+': ast.Add(), '-': ast.Sub(), '*': ast.Mult(), '**': ast.Pow()
+    }
+    ORDERING_OPERATORS: dict[str, ast.cmpop] = {
+        '<': ast.Lt(), '>': ast.Gt(), '<=': ast.LtE(), '>=': ast.GtE()
+    }
+
+    def __init__(self, compiler: 'OQSNativeCompiler') -> None:
+        self.compiler: OQSNativeCompiler = compiler
+        self.namespace: dict[str, any] = dict(NATIVE_NAMESPACE)
+        self.temporaries: int = 0
+        self.depth: int = 0
+        self.translators: dict[type[ASTNode], Callable[[ASTNode, list[ast.stmt]], ast.expr]] = {
+            NumberNode: self.translate_literal,
+            StringNode: self.translate_literal,
+            BooleanNode: self.translate_literal,
+            NullNode: self.translate_null,
+            EvaluatedNode: self.translate_evaluated,
+            VariableNode: self.translate_variable,
+            ListNode: self.translate_list,
+            KVSNode: self.translate_kvs,
+            BinaryOpNode: self.translate_operation,
+            ComparisonOpNode: self.translate_operation,
+            FunctionNode: self.translate_function
+        }
+
+    def build(self, node: ASTNode) -> Closure:
+        body: list[ast.stmt] = [
+            assign("variables", ast.Attribute(value=load("interpreter"), attr="variables", ctx=ast.Load()))
+        ]
+        result: ast.expr = self.translate(node=node, body=body)
+        body.append(ast.Return(value=result))
+        function: ast.FunctionDef = ast.FunctionDef(
+            name="native",
+            args=ast.arguments(
+                posonlyargs=[], args=[ast.arg(arg="interpreter")], kwonlyargs=[], kw_defaults=[], defaults=[]
+            ),
+            body=body,
+            decorator_list=[],
+            returns=None
+        )
+        module: ast.Module = ast.fix_missing_locations(ast.Module(body=[function], type_ignores=[]))
+        exec(compile(module, filename="<oqs-native>", mode="exec"), self.namespace)
+        return self.namespace["native"]
+
+    def temporary(self) -> str:
+        self.temporaries += 1
+        return f"_t{self.temporaries}"
+
+    def reference(self, value: any) -> ast.Name:
+        identifier: str = f"_r{len(self.namespace)}"
+        self.namespace[identifier] = value
+        return load(identifier)
+
+    def translate(self, node: ASTNode, body: list[ast.stmt]) -> ast.expr:
+        translator: Callable[[ASTNode, list[ast.stmt]], ast.expr] | None = self.translators.get(type(node))
+        too_deep: bool = self.depth >= MAX_NATIVE_BLOCK_DEPTH and isinstance(node, OQSNativeCompiler.NATIVE_NODES)
+        if translator is None or too_deep:
+            return self.translate_closure(closure=self.compiler.compile(node).closure, body=body)
+        return translator(node, body)
+
+    def translate_closure(self, closure: Closure, body: list[ast.stmt]) -> ast.expr:
+        result: str = self.temporary()
+        body.append(assign(result, ast.Call(func=self.reference(closure), args=[load("interpreter")], keywords=[])))
+        return load(result)
+
+    def translate_evaluation(self, node: CompiledNode, body: list[ast.stmt]) -> ast.expr:
+        result: str = self.temporary()
+        evaluate: ast.Attribute = ast.Attribute(value=load("interpreter"), attr="evaluate", ctx=ast.Load())
+        body.append(assign(result, ast.Call(func=evaluate, args=[self.reference(node)], keywords=[])))
+        return load(result)
+
+    @staticmethod
+    def translate_literal(node: NumberNode | StringNode | BooleanNode, body: list[ast.stmt]) -> ast.expr:
+        return ast.Constant(value=node.value)
+
+    @staticmethod
+    def translate_null(node: NullNode, body: list[ast.stmt]) -> ast.expr:
+        return ast.Constant(value=None)
+
+    def translate_evaluated(self, node: EvaluatedNode, body: list[ast.stmt]) -> ast.expr:
+        return self.reference(node.value)
+
+    def translate_variable(self, node: VariableNode, body: list[ast.stmt]) -> ast.expr:
+        result: str = self.temporary()
+        name: ast.Constant = ast.Constant(value=node.name)
+        body.append(
+            ast.Try(
+                body=[assign(result, ast.Subscript(value=load("variables"), slice=name, ctx=ast.Load()))],
+                handlers=[
+                    ast.ExceptHandler(
+                        type=load("KeyError"),
+                        name=None,
+                        body=[ast.Raise(exc=call("OQSUndefinedVariableError", name), cause=ast.Constant(value=None))]
+                    )
+                ],
+                orelse=[],
+                finalbody=[]
+            )
+        )
+        return load(result)
+
+    def translate_list(self, node: ListNode, body: list[ast.stmt]) -> ast.expr:
+        result: str = self.temporary()
+        if not any(isinstance(element, PackedNode) for element in node.elements):
+            elements: list[ast.expr] = [self.translate(node=element, body=body) for element in node.elements]
+            body.append(assign(result, ast.List(elts=elements, ctx=ast.Load())))
+            return load(result)
+        body.append(assign(result, ast.List(elts=[], ctx=ast.Load())))
+        for element in node.elements:
+            if isinstance(element, PackedNode):
+                value: ast.expr = self.translate_closure(
+                    closure=self.compiler.compile_unpacked(element).closure, body=body
+                )
+                body.append(ast.Expr(value=call("native_unpack_into_list", load(result), value)))
+            else:
+                body.append(method_call(load(result), "append", self.translate(node=element, body=body)))
+        return load(result)
+
+    def translate_kvs(self, node: KVSNode, body: list[ast.stmt]) -> ast.expr:
+        result: str = self.temporary()
+        body.append(assign(result, ast.Dict(keys=[], values=[])))
+        for key, value in node.key_value_store.items():
+            if isinstance(value, PackedNode):
+                unpacked: ast.expr = self.translate_closure(
+                    closure=self.compiler.compile_unpacked(value).closure, body=body
+                )
+                body.append(
+                    ast.Expr(value=call("native_unpack_into_kvs", load("interpreter"), load(result), unpacked))
+                )
+            else:
+                translated_value: ast.expr = self.translate(node=value, body=body)
+                translated_key: ast.expr = self.translate(node=key, body=body)
+                body.append(
+                    ast.Assign(
+                        targets=[ast.Subscript(value=load(result), slice=translated_key, ctx=ast.Store())],
+                        value=translated_value
+                    )
+                )
+        return load(result)
+
+    def translate_operation(self, node: BinaryOpNode | ComparisonOpNode, body: list[ast.stmt]) -> ast.expr:
+        name: str | None = OQSInterpreter.OPERATORS.get(node.op)
+        function: Callable | None = self.compiler.functions.get(name)
+        if function is None or function is not BUILT_IN_FUNCTIONS[name]:
+            return self.translate_closure(closure=self.compiler.compile_fallback(node), body=body)
+        if node.op in ['&', '|']:
+            return self.translate_short_circuit(args=[node.left, node.right], stop_on=node.op == '|', body=body)
+
+        left: ast.expr = self.translate(node=node.left, body=body)
+        right: ast.expr = self.translate(node=node.right, body=body)
+        result: str = self.temporary()
+        slow_result: ast.expr = call(
+            "native_operator",
+            interpreter=load("interpreter"),
+            function=self.reference(function),
+            name=ast.Constant(value=name),
+            left=left,
+            right=right
+        )
+        if node.op == '/':
+            body.append(assign(result, call("native_divide", load("interpreter"), left, right)))
+            return load(result)
+        elif node.op in ['==', '!=']:
+            comparison: ast.cmpop = ast.Eq() if node.op == '==' else ast.NotEq()
+            body.append(assign(result, as_boolean(ast.Compare(left=left, ops=[comparison], comparators=[right]))))
+            return load(result)
+        elif node.op in self.ARITHMETIC_OPERATORS:
+            condition: ast.expr = both(is_number(left), is_number(right))
+            fast_result: ast.expr = ast.BinOp(left=left, op=self.ARITHMETIC_OPERATORS[node.op], right=right)
+        elif node.op == '%':
+            condition: ast.expr = both(is_integer(left), is_integer(right))
+            fast_result: ast.expr = ast.BinOp(left=left, op=ast.Mod(), right=right)
+        elif node.op in self.ORDERING_OPERATORS:
+            condition: ast.expr = both(is_number(left), is_number(right))
+            fast_result: ast.expr = ast.Compare(left=left, ops=[self.ORDERING_OPERATORS[node.op]], comparators=[right])
+        else:
+            body.append(assign(result, slow_result))
+            return load(result)
+        body.append(ast.If(test=condition, body=[assign(result, fast_result)], orelse=[assign(result, slow_result)]))
+        return load(result)
+
+    def translate_short_circuit(self, args: list[ASTNode], stop_on: bool, body: list[ast.stmt]) -> ast.expr:
+        result: str = self.temporary()
+        current: list[ast.stmt] = body
+        for arg in args:
+            value: ast.expr = self.translate(node=arg, body=current)
+            test: ast.expr = value if stop_on else ast.UnaryOp(op=ast.Not(), operand=value)
+            remaining: list[ast.stmt] = []
+            current.append(ast.If(test=test, body=[assign(result, ast.Constant(value=stop_on))], orelse=remaining))
+            current: list[ast.stmt] = remaining
+            self.depth += 1
+        self.depth -= len(args)
+        current.append(assign(result, ast.Constant(value=not stop_on)))
+        return load(result)
+
+    def translate_function(self, node: FunctionNode, body: list[ast.stmt]) -> ast.expr:
+        function_key: str = node.key
+        function: Callable | None = self.compiler.functions.get(function_key)
+        if (
+                function_key not in ["IF", "AND", "OR"]
+                or function is not BUILT_IN_FUNCTIONS[function_key]
+                or len(node.args) < 2
+                or node.packed
+        ):
+            return self.translate_evaluation(
+                node=CompiledNode(source=node, closure=self.compiler.compile_function(node)), body=body
+            )
+
+        guarded: list[ast.stmt] = []
+        self.depth += 1
+        try:
+            if function_key == "IF":
+                result: ast.expr = self.translate_if(args=node.args, body=guarded)
+            else:
+                result: ast.expr = self.translate_short_circuit(
+                    args=node.args, stop_on=function_key == "OR", body=guarded
+                )
+        finally:
+            self.depth -= 1
+        body.append(
+            ast.Try(
+                body=guarded,
+                handlers=[
+                    ast.ExceptHandler(type=load("OQSBaseError"), name=None, body=[ast.Raise(exc=None, cause=None)]),
+                    ast.ExceptHandler(
+                        type=load("Exception"),
+                        name="error",
+                        body=[
+                            ast.Raise(
+                                exc=call(
+                                    "OQSFunctionEvaluationError",
+                                    function_name=ast.Constant(value=node.name),
+                                    message=call("str", load("error"))
+                                ),
+                                cause=None
+                            )
+                        ]
+                    )
+                ],
+                orelse=[],
+                finalbody=[]
+            )
+        )
+        return result
+
+    def translate_if(self, args: list[ASTNode], body: list[ast.stmt]) -> ast.expr:
+        result: str = self.temporary()
+        current: list[ast.stmt] = body
+        nesting: int = 0
+        for i in range(0, len(args) - 1, 2):
+            condition: ast.expr = self.translate(node=args[i], body=current)
+            self.depth += 1
+            nesting += 1
+            branch: list[ast.stmt] = []
+            branch.append(assign(result, self.translate(node=args[i + 1], body=branch)))
+            remaining: list[ast.stmt] = []
+            current.append(ast.If(test=condition, body=branch, orelse=remaining))
+            current: list[ast.stmt] = remaining
+        if len(args) % 2 != 0:
+            current.append(assign(result, self.translate(node=args[-1], body=current)))
+        else:
+            current.append(assign(result, ast.Constant(value=None)))
+        self.depth -= nesting
+        return load(result)
+
+
+class OQSNativeCompiler(OQSClosureCompiler):
+    NATIVE_NODES: tuple[type[ASTNode], ...] = (ListNode, KVSNode, BinaryOpNode, ComparisonOpNode, FunctionNode)
+
+    def compile(self, node: ASTNode) -> CompiledNode:
+        if self.instrumented or isinstance(node, CompiledNode) or not isinstance(node, self.NATIVE_NODES):
+            return super().compile(node)
+        return CompiledNode(source=node, closure=NativeTranslator(compiler=self).build(node))
+
+    def compile_fallback(self, node: ASTNode) -> Closure:
+        return super().compile(node).closure
+
+
+class OQSNativeInterpreter(OQSClosureInterpreter):
+    COMPILER: OQSNativeCompiler = OQSNativeCompiler()
+    INSTRUMENTED_COMPILER: OQSNativeCompiler = OQSNativeCompiler(instrumented=True)
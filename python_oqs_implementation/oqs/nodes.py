@@ -21,6 +21,7 @@ class BinaryOpNode(ASTNode):
         self.left: any = left
         self.op: str = op
         self.right: any = right
+        self.function_node: FunctionNode | None = None
 
 
 class ComparisonOpNode(ASTNode):
@@ -28,6 +29,7 @@ class ComparisonOpNode(ASTNode):
         self.left: any = left
         self.op: str = op
         self.right: any = right
+        self.function_node: FunctionNode | None = None
 
 
 class NumberNode(ASTNode):
@@ -63,9 +65,12 @@ class BooleanNode(ASTNode):
 class FunctionNode(ASTNode):
     def __init__(self, name: str, args: list[any]) -> None:
         self.name: str = name
+        self.key: str = name.upper()
         self.args: list[any] = args
+        self.packed: bool = any(isinstance(arg, PackedNode) for arg in args)
 
 
 class PackedNode(ASTNode):
-    def __init__(self, expression: str) -> None:
+    def __init__(self, expression: str, node: ASTNode | None = None) -> None:
         self.expression: str = expression
+        self.node: ASTNode | None = node
@@ -0,0 +1,172 @@
+import copy
+import datetime
+from typing import (Callable, Mapping)
+from .analysis import (BINDING_FUNCTIONS, bound_variables, free_variables)
+from .compiler import BUILT_IN_FUNCTIONS
+from .constants.values import (MAX_FOLDED_CONTAINER_SIZE, MAX_FOLDING_ELEMENTS, MAX_FOLDING_STEPS)
+from .governor import (OQSGovernor, ResourceLimits)
+from .interpreter import OQSInterpreter
+from .nodes import (
+    ASTNode,
+    BinaryOpNode,
+    BooleanNode,
+    ComparisonOpNode,
+    EvaluatedNode,
+    FunctionNode,
+    KVSNode,
+    ListNode,
+    NullNode,
+    NumberNode,
+    PackedNode,
+    StringNode,
+    VariableNode
+)
+
+
+IMMUTABLE_TYPES: frozenset[type] = frozenset({
+    int, float, str, bool, type(None), datetime.datetime, datetime.date, datetime.time, datetime.timedelta
+})
+FOLDING_LIMITS: ResourceLimits = ResourceLimits(
+    max_steps=MAX_FOLDING_STEPS, max_elements=MAX_FOLDING_ELEMENTS
+)
+
+
+def container_size(value: any, limit: int) -> int:
+    size: int = 0
+    pending: list[any] = [value]
+    while pending and size <= limit:
+        current: any = pending.pop()
+        if isinstance(current, list):
+            size += len(current)
+            pending.extend(current)
+        elif isinstance(current, dict):
+            size += len(current)
+            pending.extend(current.values())
+    return size
+
+
+def constant_node(value: any) -> ASTNode | None:
+    if type(value) in IMMUTABLE_TYPES:
+        return EvaluatedNode(value)
+    elif type(value) not in [list, dict]:
+        return None
+    elif container_size(value=value, limit=MAX_FOLDED_CONTAINER_SIZE) > MAX_FOLDED_CONTAINER_SIZE:
+        return None
+    elif isinstance(value, list):
+        elements: list[ASTNode | None] = [constant_node(element) for element in value]
+        return None if None in elements else ListNode(elements=elements)
+    key_value_store: dict[ASTNode, ASTNode | None] = {
+        EvaluatedNode(key): constant_node(item) for key, item in value.items()
+    }
+    if None in key_value_store.values() or any(type(key.value) not in IMMUTABLE_TYPES for key in key_value_store):
+        return None
+    return KVSNode(key_value_store=key_value_store)
+
+
+class OQSOptimizer:
+    LITERAL_NODES: tuple[type[ASTNode], ...] = (NumberNode, StringNode, BooleanNode, NullNode, EvaluatedNode)
+
+    def __init__(
+            self, known_variables: dict[str, any] | None = None, functions: Mapping[str, Callable] | None = None
+    ) -> None:
+        self.known_variables: dict[str, any] = known_variables if known_variables is not None else {}
+        self.functions: Mapping[str, Callable] = functions if functions is not None else BUILT_IN_FUNCTIONS
+        self.substitutable_variables: set[str] = set()
+
+    def optimize(self, node: ASTNode) -> ASTNode:
+        bound: set[str] | None = bound_variables(node)
+        self.substitutable_variables: set[str] = set() if bound is None else set(self.known_variables) - bound
+        optimized, _ = self.fold(node)
+        return optimized
+
+    def fold(self, node: ASTNode) -> tuple[ASTNode, bool]:
+        if isinstance(node, self.LITERAL_NODES):
+            return node, True
+        elif isinstance(node, VariableNode):
+            if node.name not in self.substitutable_variables:
+                return node, False
+            substitute: ASTNode | None = constant_node(self.known_variables[node.name])
+            return (substitute if substitute is not None else node), True
+        elif isinstance(node, ListNode):
+            elements, constants = self.fold_all(node.elements)
+            return ListNode(elements=elements), all(constants)
+        elif isinstance(node, KVSNode):
+            keys, key_constants = self.fold_all(list(node.key_value_store.keys()))
+            values, value_constants = self.fold_all(list(node.key_value_store.values()))
+            return KVSNode(key_value_store=dict(zip(keys, values))), all(key_constants + value_constants)
+        elif isinstance(node, PackedNode):
+            if node.node is None:
+                return node, False
+            inner, constant = self.fold(node.node)
+            return PackedNode(expression=node.expression, node=inner), constant
+        elif isinstance(node, (BinaryOpNode, ComparisonOpNode)):
+            (left, right), constants = self.fold_all([node.left, node.right])
+            folded: ASTNode = type(node)(left=left, op=node.op, right=right)
+            function_name: str | None = OQSInterpreter.OPERATORS.get(node.op)
+            if not all(constants) or not self.is_foldable(function_name):
+                return folded, False
+            return self.try_fold(folded), True
+        elif isinstance(node, FunctionNode):
+            return self.fold_function(node)
+        return node, False
+
+    def is_foldable(self, function_name: str | None) -> bool:
+        function: Callable | None = self.functions.get(function_name)
+        return function is BUILT_IN_FUNCTIONS.get(function_name, False) and function in OQSInterpreter.PURE_FUNCTIONS
+
+    def fold_all(self, nodes: list[ASTNode]) -> tuple[list[ASTNode], list[bool]]:
+        folded: list[tuple[ASTNode, bool]] = [self.fold(node) for node in nodes]
+        return [node for node, _ in folded], [constant for _, constant in folded]
+
+    def fold_function(self, node: FunctionNode) -> tuple[ASTNode, bool]:
+        function_key: str = node.key
+        args, constants = self.fold_all(node.args)
+        if function_key == "IF" and self.is_foldable(function_key):
+            simplified: tuple[list[ASTNode], list[bool]] | None = self.simplify_if(args=args, constants=constants)
+            if simplified is None:
+                return NullNode(), True
+            args, constants = simplified
+        folded: FunctionNode = FunctionNode(name=node.name, args=args)
+        if (
+                not all(constants)
+                or not self.is_foldable(function_key)
+                or function_key in BINDING_FUNCTIONS
+        ):
+            return folded, False
+        return self.try_fold(folded), True
+
+    def simplify_if(
+            self, args: list[ASTNode], constants: list[bool]
+    ) -> tuple[list[ASTNode], list[bool]] | None:
+        if len(args) < 2 or any(isinstance(arg, PackedNode) for arg in args):
+            return args, constants
+        while len(args) >= 2 and constants[0]:
+            succeeded, condition = self.evaluate_constant(args[0])
+            if not succeeded:
+                break
+            elif condition:
+                return [BooleanNode(value=True), args[1]], [True, constants[1]]
+            args, constants = args[2:], constants[2:]
+            if len(args) == 1:
+                return [BooleanNode(value=True), args[0]], [True, constants[0]]
+            elif not args:
+                return None
+        return args, constants
+
+    def evaluate_constant(self, node: ASTNode) -> tuple[bool, any]:
+        variables: dict[str, any] = {
+            name: self.known_variables[name] for name in free_variables(node) if name in self.known_variables
+        }
+        try:
+            return True, OQSInterpreter(
+                expression="", variables=copy.deepcopy(variables), ast=node, governor=OQSGovernor(limits=FOLDING_LIMITS)
+            ).results()
+        except Exception:
+            return False, None
+
+    def try_fold(self, node: ASTNode) -> ASTNode:
+        succeeded, value = self.evaluate_constant(node)
+        if not succeeded:
+            return node
+        folded: ASTNode | None = constant_node(value)
+        return folded if folded is not None else node
@@ -1,4 +1,7 @@
-from .errors import (OQSSyntaxError, OQSMissingExpectedCharacterError, OQSUnexpectedCharacterError)
+from .constants.types import TokenTypeStrings as TTS
+from .constants.values import DEFAULT_PARSE_CACHE_SIZE
+from .errors import (OQSBaseError, OQSSyntaxError, OQSMissingExpectedCharacterError, OQSUnexpectedCharacterError)
+from .lexer import (OQSLexer, Token)
 from .nodes import (
     ASTNode,
     BinaryOpNode,
@@ -14,6 +17,22 @@ from .nodes import (
     ComparisonOpNode,
     PackedNode
 )
+from .utils.cache import (CacheInfo, LRUCache)
+
+
+PARSE_CACHE: LRUCache = LRUCache(maxsize=DEFAULT_PARSE_CACHE_SIZE)
+
+
+def configure_parse_cache(maxsize: int) -> None:
+    PARSE_CACHE.resize(maxsize=maxsize)
+
+
+def parse_cache_info() -> CacheInfo:
+    return PARSE_CACHE.info()
+
+
+def clear_parse_cache() -> None:
+    PARSE_CACHE.clear()
 
 
 class OQSParser:
@@ -21,310 +40,244 @@ class OQSParser:
         '**': 1, '*': 2, '/': 2, '%': 2, '+': 3, '-': 3,
         '==': 4, '!=': 4, '<': 4, '<=': 4, '>': 4, '>=': 4, '===': 4, '!==': 4, '&': 4, '|': 4
     }
+    COMPARISON_OPERATORS: list[str] = ['==', '!=', '<', '<=', '>', '>=', '===', '!==', '&', '|']
+    BINARY_OPERATORS: list[str] = ['+', '-', '*', '/', '%', '**']
+    UNPACKING_OPERATOR: str = '***'
+
+    def __init__(self, eager: bool = False) -> None:
+        self.eager: bool = eager
 
     def parse(self, expression: str) -> ASTNode:
-        tokens: list[str] = self.tokenize_expression(expression=expression)
-        return self.parse_expression(tokens=tokens)
+        cache_key: tuple[bool, str] = (self.eager, expression)
+        ast: ASTNode = PARSE_CACHE.get(cache_key)
+        if ast is LRUCache.MISSING:
+            ast: ASTNode = TokenParser(expression=expression.strip(), eager=self.eager).parse()
+            PARSE_CACHE.put(cache_key, ast)
+        return ast
 
-    @staticmethod
-    def tokenize_expression(expression: str) -> list[str]:
-        def char_is_operator(single_char_str: str) -> bool:
-            return single_char_str in ['+', '-', '*', '/', '%', '<', '>', '=', '!', '&', '|']
-
-        def token_is_operator(token: str) -> bool:
-            return char_is_operator(token[0]) and not (token.startswith('***') and len(token) > 3 and token[3] != '*')
-
-        def none_operator_char_is_valid_beginning_or_ending(single_char_str: str) -> bool:
-            return single_char_str in ['_', '(', ')', '[', ']', '{', '}', '"', "'"] or single_char_str.isalnum()
-
-        tokens: list[str] = []
-        expression: str = expression.strip()
-        i: int = 0
-        while i < len(expression):
-            char: str = expression[i]
-            if char in ['"', "'"]:
-                start_index: int = i
-                i += 1
-                while i < len(expression) and expression[i] != char:
-                    i += 1
-                i += 1
-                tokens.append(expression[start_index:i])
-            elif char.isdigit() or (char == '.' and i + 1 < len(expression) and expression[i + 1].isdigit()):
-                start_index: int = i
-                i += 1
-                while i < len(expression) and (expression[i].isdigit() or expression[i] in ['.', '_']):
-                    i += 1
-                number: str = expression[start_index:i]
-                if number.startswith('.'):
-                    number: str = '0' + number
-                if number.endswith('.'):
-                    number += '0'
-                if number.count('.') > 1:
-                    raise OQSUnexpectedCharacterError(message=f"A Decimal cannot contain more than one '.': {number}")
-                if '.' in number:
-                    split_number_list: list[str] = number.split('.')
-                    decimal_number: str = split_number_list[1]
-                    if '_' in decimal_number:
-                        raise OQSUnexpectedCharacterError(
-                            message=f"An underscore cannot be used to split a number after the decimal point: {number}"
-                        )
-                number: str = number.replace('_', '')
-                tokens.append(number)
-                if i < len(expression) and not (
-                        char_is_operator(expression[i]) or expression[i] in ['}', ']', ')', ' ']
-                ):
-                    raise OQSUnexpectedCharacterError(
-                        message=f"The character '{expression[i]}' is not expected after the number '{number}'. "
-                                f"It is suggested these be separated by a space or an operator."
-                    )
-            elif char.isalpha() or char == '_':
-                start_index: int = i
-                i += 1
-                while i < len(expression) and (expression[i].isalnum() or expression[i] == '_'):
-                    i += 1
-                tokens.append(expression[start_index:i])
-            elif char_is_operator(char):
-                start_index: int = i
-                while i + 1 < len(expression) and char_is_operator(expression[i + 1]):
-                    i += 1
-                i += 1
-                tokens.append(expression[start_index:i])
-            elif char in ['(', '[', '{']:
-                closing_char: str = ')' if char == '(' else ']' if char == '[' else '}'
-                level: int = 1
-                start_index: int = i
-                i += 1
-                while i < len(expression) and level > 0:
-                    if expression[i] == char:
-                        level += 1
-                    elif expression[i] == closing_char:
-                        level -= 1
-                    i += 1
-                if level != 0:
-                    raise OQSMissingExpectedCharacterError(f"Unclosed '{char}' in expression: {expression}")
-                tokens.append(expression[start_index:i])
-            elif char == '*' and i + 2 < len(expression) and expression[i:i + 3] == '***' and (
-                    expression[i + 3] != '*' if i + 3 < len(expression) else True
-            ):
-                tokens.append('***')
-                i += 3
-            elif char == ' ':
-                i += 1
-            else:
-                raise OQSUnexpectedCharacterError(
-                    message=f"The character '{char}' is not recognized in this setting: {expression}"
-                )
 
-        tokens: list[str] = [token.strip() for token in tokens if token.strip()]
-        tokens: list[str] = [
-            token + tokens[i + 1] if token == '***' and i + 1 < len(tokens) else token
-            for i, token in enumerate(tokens) if (tokens[i - 1] != '***' if i != 0 else True)
-        ]
-        tokens: list[str] = [
-            token + tokens[i + 1]
-            if (token[0].isalpha() or token[0] == '_') and i + 1 < len(tokens) and tokens[i + 1].startswith('(')
-            else token
-            for i, token in enumerate(tokens)
-            if (
-                not (token.startswith('(') and (tokens[i - 1][0].isalpha() or tokens[i - 1][0] == '_'))
-                if i != 0 else True
-            )
-        ]
+class TokenParser:
+    def __init__(self, expression: str, eager: bool) -> None:
+        self.expression: str = expression
+        self.eager: bool = eager
+        self.tokens: list[Token] = OQSLexer.tokenize(expression)
+
+    def parse(self) -> ASTNode:
+        return self.parse_expression(start=0, end=len(self.tokens))
+
+    def source(self, start: int, end: int) -> str:
+        return self.expression[self.tokens[start].start:self.tokens[end - 1].end]
+
+    def is_unpacking_operator(self, position: int) -> bool:
+        token: Token = self.tokens[position]
+        return token.type == TTS.OPERATOR and token.text == OQSParser.UNPACKING_OPERATOR
+
+    def closing_position(self, position: int, end: int) -> int:
+        token: Token = self.tokens[position]
+        if token.match is None or token.match >= end:
+            raise OQSMissingExpectedCharacterError(f"Unclosed '{token.text}' in expression: {self.expression}")
+        return token.match
+
+    def operand_end(self, position: int, end: int) -> int:
+        if self.tokens[position].type == TTS.NAME and position + 1 < end and self.tokens[position + 1].text == '(':
+            position += 1
+        token: Token = self.tokens[position]
+        if token.type == TTS.OPEN and token.match is not None and token.match < end:
+            return token.match + 1
+        return position + 1
+
+    def split_elements(self, start: int, end: int) -> list[tuple[int, int]]:
+        elements: list[tuple[int, int]] = []
+        element_start: int = start
+        position: int = start
+        while position < end:
+            token: Token = self.tokens[position]
+            if token.type == TTS.OPEN and token.match is not None and token.match < end:
+                position: int = token.match
+            elif token.type == TTS.COMMA:
+                if position > element_start:
+                    elements.append((element_start, position))
+                element_start: int = position + 1
+            position += 1
+        if end > element_start:
+            elements.append((element_start, end))
+        return elements
+
+    def find_colon(self, start: int, end: int) -> int | None:
+        position: int = start
+        while position < end:
+            token: Token = self.tokens[position]
+            if token.type == TTS.OPEN and token.match is not None and token.match < end:
+                position: int = token.match
+            elif token.type == TTS.COLON:
+                return position
+            position += 1
+        return None
 
-        for i, token in enumerate(tokens):
-            if token_is_operator(token):
-                if i == 0:
+    def parse_expression(self, start: int, end: int) -> ASTNode:
+        if start >= end:
+            return NullNode()
+        operands, operators = self.parse_operations(start=start, end=end)
+        return self.build_operations(operands=operands, operators=operators)
+
+    def parse_operations(self, start: int, end: int) -> tuple[list[ASTNode], list[str]]:
+        operands: list[ASTNode] = []
+        operators: list[str] = []
+        previous_start: int = start
+        position: int = start
+        expecting_operand: bool = True
+        while position < end:
+            token: Token = self.tokens[position]
+            if token.type == TTS.OPERATOR and not self.is_unpacking_operator(position):
+                if not operators and expecting_operand:
                     raise OQSMissingExpectedCharacterError(
                         message=f"There must be something preceding an operator: "
-                                f"There is nothing preceding the '{token}' operator."
-                    )
-                elif token_is_operator(tokens[i - 1]):
-                    raise OQSMissingExpectedCharacterError(
-                        message=f"Operators must be preceded by something other than an operator: "
-                                f"Your '{token}' operator is being preceded by '{tokens[i - 1]}' operator."
+                                f"There is nothing preceding the '{token.text}' operator."
                     )
-                if i == len(tokens) - 1:
-                    raise OQSMissingExpectedCharacterError(
-                        message=f"There must be something following an operator: "
-                                f"There is nothing following your '{token}' operator."
-                    )
-                elif token_is_operator(tokens[i + 1]):
+                elif expecting_operand:
                     raise OQSMissingExpectedCharacterError(
                         message=f"Operators must be followed by something other than an operator: "
-                                f"Your '{token}' operator is being followed by '{tokens[i + 1]}' operator."
+                                f"Your '{operators[-1]}' operator is being followed by '{token.text}' operator."
                     )
+                operators.append(token.text)
+                expecting_operand: bool = True
+                position += 1
             else:
-                if i > 0 and not token_is_operator(tokens[i - 1]):
-                    raise OQSMissingExpectedCharacterError(
-                        message=f"non-operators must be preceded by an operator: "
-                                f"Your non-operator '{token}' is being preceded by '{tokens[i - 1]}' non-operator."
-                    )
-                elif i + 1 < len(tokens) and not token_is_operator(tokens[i + 1]):
+                if not expecting_operand:
+                    if token.type in [TTS.INVALID, TTS.CLOSE, TTS.COMMA, TTS.COLON]:
+                        raise_invalid_token(token=token, expression=self.expression)
                     raise OQSMissingExpectedCharacterError(
                         message=f"non-operators must be followed by an operator: "
-                                f"Your non-operator '{token}' is being followed by '{tokens[i + 1]}'"
-                    )
-                elif not none_operator_char_is_valid_beginning_or_ending(token[0]) and not token.startswith('***'):
-                    raise OQSUnexpectedCharacterError(
-                        message=f"the character '{token[0]}' is not expected: {expression}."
-                    )
-                elif not none_operator_char_is_valid_beginning_or_ending(token[-1]):
-                    raise OQSUnexpectedCharacterError(
-                        message=f"the character '{token[-1]}' is not expected: {expression}."
-                    )
-                elif token.startswith('***') and len(token) > 3 and (
-                        not none_operator_char_is_valid_beginning_or_ending(
-                            token[3]
-                        ) or token[3].isdigit() or token[3] in ['"', "'"]
-                ):
-                    raise OQSUnexpectedCharacterError(
-                        message=f"Unexpected unpacking syntax as the provided item to unpack is invalid: {token}"
+                                f"Your non-operator '{self.source(previous_start, position)}' is being followed by "
+                                f"'{self.source(position, self.operand_end(position=position, end=end))}'"
                     )
-        return tokens
+                previous_start: int = position
+                operand, position = self.parse_operand(position=position, end=end)
+                operands.append(operand)
+                expecting_operand: bool = False
+        if expecting_operand:
+            raise OQSMissingExpectedCharacterError(
+                message=f"There must be something following an operator: "
+                        f"There is nothing following your '{operators[-1]}' operator."
+            )
+        return operands, operators
+
+    def build_operations(self, operands: list[ASTNode], operators: list[str]) -> ASTNode:
+        output: list[ASTNode] = [operands[0]]
+        pending: list[str] = []
+        for op, operand in zip(operators, operands[1:]):
+            if op not in OQSParser.OPERATOR_PRECEDENCE:
+                raise OQSSyntaxError(f"Invalid Operator: '{op}'")
+            while pending and OQSParser.OPERATOR_PRECEDENCE[pending[-1]] <= OQSParser.OPERATOR_PRECEDENCE[op]:
+                self.reduce_operation(output=output, pending=pending)
+            pending.append(op)
+            output.append(operand)
+        while pending:
+            self.reduce_operation(output=output, pending=pending)
+        return output[0]
+
+    def reduce_operation(self, output: list[ASTNode], pending: list[str]) -> None:
+        right: ASTNode = output.pop()
+        output[-1] = self.operation_node(left=output[-1], op=pending.pop(), right=right)
 
     @staticmethod
-    def separate_arguments(expression: str) -> list[str]:
-        tokens: list[str] = []
-        expression: str = expression.strip()
-        level: int = 0
-        start_index: int = 0
-        in_quote: bool = False
-        quote_char: str = ''
-        for i, char in enumerate(expression):
-            if char in ['"', "'"]:
-                if in_quote and char == quote_char:
-                    in_quote: bool = False
-                elif not in_quote:
-                    in_quote: bool = True
-                    quote_char: str = char
-            elif char in ['(', '{', '[']:
-                if not in_quote:
-                    level += 1
-            elif char in [')', '}', ']']:
-                if not in_quote:
-                    level -= 1
-            elif char == ',' and level == 0 and not in_quote:
-                tokens.append(expression[start_index:i].strip())
-                start_index: int = i + 1
-        tokens.append(expression[start_index:].strip())
-
-        return [token.strip() for token in tokens if token.strip()]
-
-    def parse_expression(self, tokens: list[str]) -> ASTNode:
-        if len(tokens) == 0:
-            return NullNode()
-        elif len(tokens) == 1:
-            return self.parse_term(tokens[0])
-
-        op_pos: int | None = None
-        highest_precedence: int = 0
-        for i, token in reversed(list(enumerate(tokens))):
-            if token in self.OPERATOR_PRECEDENCE and self.OPERATOR_PRECEDENCE[token] > highest_precedence:
-                highest_precedence: int = self.OPERATOR_PRECEDENCE[token]
-                op_pos: int = i
-
-        if op_pos is not None:
-            if op_pos == 0:
-                raise OQSUnexpectedCharacterError(
-                    message=f"Cannot process an operator without something in front of it: {tokens[op_pos]}."
-                )
-            elif op_pos + 2 > len(tokens):
+    def operation_node(left: ASTNode, op: str, right: ASTNode) -> ASTNode:
+        if op in OQSParser.COMPARISON_OPERATORS:
+            return ComparisonOpNode(left=left, op=op, right=right)
+        elif op in OQSParser.BINARY_OPERATORS:
+            return BinaryOpNode(left=left, op=op, right=right)
+        else:
+            raise OQSSyntaxError(f"Invalid Operator: '{op}'")
+
+    def parse_operand(self, position: int, end: int) -> tuple[ASTNode, int]:
+        token: Token = self.tokens[position]
+        if token.type == TTS.NUMBER:
+            try:
+                return NumberNode(value=int(token.text)), position + 1
+            except ValueError:
+                return NumberNode(value=float(token.text)), position + 1
+        elif token.type == TTS.STRING:
+            return StringNode(value=token.text[1:-1]), position + 1
+        elif token.type == TTS.NAME:
+            if position + 1 < end and self.tokens[position + 1].text == '(':
+                return self.parse_function_call(position=position, end=end)
+            elif token.text in ['true', 'false']:
+                return BooleanNode(value=token.text == 'true'), position + 1
+            elif token.text == 'null':
+                return NullNode(), position + 1
+            return VariableNode(name=token.text), position + 1
+        elif token.type == TTS.OPEN:
+            closing_position: int = self.closing_position(position=position, end=end)
+            if token.text == '(':
+                node: ASTNode = self.parse_expression(start=position + 1, end=closing_position)
+            elif token.text == '[':
+                node: ASTNode = ListNode(elements=self.parse_list(start=position + 1, end=closing_position))
+            else:
+                node: ASTNode = KVSNode(key_value_store=self.parse_kvs(start=position + 1, end=closing_position))
+            return node, closing_position + 1
+        elif token.type == TTS.OPERATOR:
+            if position + 1 >= end:
                 raise OQSMissingExpectedCharacterError(
-                    message=f"Missing expected value after operator: {tokens[op_pos]}."
+                    message=f"There must be something following an operator: "
+                            f"There is nothing following your '{token.text}' operator."
                 )
-            left_tokens: list[str] = tokens[:op_pos]
-            right_tokens: list[str] = tokens[op_pos + 1:]
+            node, next_position = self.parse_operand(position=position + 1, end=end)
+            return PackedNode(expression=self.source(position + 1, next_position), node=node), next_position
+        raise_invalid_token(token=token, expression=self.expression)
 
-            left_subtree: ASTNode = self.parse_expression(left_tokens)
-            right_subtree: ASTNode = self.parse_expression(right_tokens)
-
-            op: str = tokens[op_pos]
+    def parse_element(self, start: int, end: int) -> ASTNode:
+        if self.is_unpacking_operator(start):
+            if start + 1 >= end:
+                raise OQSMissingExpectedCharacterError(
+                    message=f"There must be something following an operator: "
+                            f"There is nothing following your '{OQSParser.UNPACKING_OPERATOR}' operator."
+                )
+            return PackedNode(
+                expression=self.source(start + 1, end), node=self.parse_expression(start=start + 1, end=end)
+            )
+        return self.parse_expression(start=start, end=end)
 
-            if op in ['==', '!=', '<', '<=', '>', '>=', '===', '!==', '&', '|']:
-                return ComparisonOpNode(left=left_subtree, op=op, right=right_subtree)
-            elif op in ['+', '-', '*', '/', '%', '**']:
-                return BinaryOpNode(left=left_subtree, op=op, right=right_subtree)
-            else:
-                raise OQSSyntaxError(f"Invalid Operator: '{op}'")
+    def parse_function_call(self, position: int, end: int) -> tuple[FunctionNode, int]:
+        closing_position: int = self.closing_position(position=position + 1, end=end)
+        args: list[ASTNode] = []
+        for arg_start, arg_end in self.split_elements(start=position + 2, end=closing_position):
+            args.append(self.parse_argument(start=arg_start, end=arg_end))
+        return FunctionNode(name=self.tokens[position].text, args=args), closing_position + 1
 
-    def parse_term(self, token: str) -> ASTNode:
+    def parse_argument(self, start: int, end: int) -> ASTNode:
+        if not self.eager:
+            if self.is_unpacking_operator(start):
+                return PackedNode(expression=self.source(start + 1, end) if start + 1 < end else '')
+            return UnparsedNode(token=self.source(start, end))
         try:
-            return NumberNode(value=int(token))
-        except ValueError:
-            try:
-                return NumberNode(value=float(token))
-            except ValueError:
-                pass
-        if token in ['true', 'false']:
-            return BooleanNode(value=token == 'true')
-        elif token == 'null':
-            return NullNode()
-        elif token.startswith('"') and token.endswith('"') or token.startswith("'") and token.endswith("'"):
-            return StringNode(value=token[1:-1])
-        elif token.startswith('{') and token.endswith('}'):
-            kvs: dict[ASTNode, ASTNode] = self.parse_kvs(token[1:-1])
-            return KVSNode(key_value_store=kvs)
-        elif token.startswith('[') and token.endswith(']'):
-            elements: list[ASTNode] = self.parse_list(args_str=token[1:-1])
-            return ListNode(elements=elements)
-        elif token.startswith('(') and token.endswith(')'):
-            return self.parse(expression=token[1:-1])
-        elif token.startswith('***'):
-            return PackedNode(expression=token.lstrip('***'))
-        elif '(' in token and token.endswith(')'):
-            return self.parse_function_call(token)
-        else:
-            return VariableNode(name=token)
-
-    def parse_function_call(self, token: str) -> FunctionNode:
-        function_name, args_str = token[:-1].split('(', 1)
-        args_tokens: list[str] = self.separate_arguments(expression=args_str)
-        args: list[ASTNode] = [
-            self.parse_term(arg)
-            if arg.startswith('***') else UnparsedNode(token=arg) for arg in args_tokens
-        ]
-        return FunctionNode(name=function_name, args=args)
+            return self.parse_element(start=start, end=end)
+        except OQSBaseError:
+            return UnparsedNode(token=self.source(start, end))
 
-    def parse_list(self, args_str: str) -> list[ASTNode]:
-        if not args_str.strip():
-            return []
-        args_tokens: list[str] = self.separate_arguments(expression=args_str)
-        return [self.parse_expression(tokens=[token]) for token in args_tokens]
+    def parse_list(self, start: int, end: int) -> list[ASTNode]:
+        return [
+            self.parse_element(start=element_start, end=element_end)
+            for element_start, element_end in self.split_elements(start=start, end=end)
+        ]
 
-    def parse_kvs(self, kvs_str: str) -> dict[ASTNode, ASTNode]:
-        kvs_tokens: list[str] = self.separate_arguments(expression=kvs_str)
+    def parse_kvs(self, start: int, end: int) -> dict[ASTNode, ASTNode]:
         kvs: dict[ASTNode, ASTNode] = {}
-        for i, token in enumerate(kvs_tokens):
-            if token.startswith('***'):
-                key: str = f'"PACKED_TOKEN__{i}"'
-                value: str = token
-            else:
-                key, value = self.split_key_value_pair(token)
-            kvs[self.parse_expression([key])] = self.parse_expression([value])
+        for i, (pair_start, pair_end) in enumerate(self.split_elements(start=start, end=end)):
+            if self.is_unpacking_operator(pair_start):
+                kvs[StringNode(value=f"PACKED_TOKEN__{i}")] = self.parse_element(start=pair_start, end=pair_end)
+                continue
+            colon_position: int | None = self.find_colon(start=pair_start, end=pair_end)
+            if colon_position is None or colon_position == pair_start or colon_position + 1 >= pair_end:
+                raise OQSSyntaxError(F"Invalid KVS pair {self.source(pair_start, pair_end)}")
+            key: ASTNode = self.parse_expression(start=pair_start, end=colon_position)
+            value: ASTNode = self.parse_element(start=colon_position + 1, end=pair_end)
+            kvs[key] = value
         return kvs
 
-    @staticmethod
-    def split_key_value_pair(token: str) -> tuple[str, str]:
-        colon_index: int = -1
-        level: int = 0
-        in_string: bool = False
-        string_char: str = ''
-        for i, char in enumerate(token):
-            if char in ['"', "'"]:
-                if in_string and char == string_char:
-                    in_string: bool = False
-                elif not in_string:
-                    in_string: bool = True
-                    string_char: str = char
-            elif char == ":" and level == 0 and not in_string:
-                colon_index: int = i
-                break
-            elif char in ['{', '[', '(']:
-                level += 1
-            elif char in ['}', '[', ')']:
-                level -= 1
-        if colon_index == -1:
-            raise OQSSyntaxError(F"Invalid KVS pair {token}")
-        key: str = token[:colon_index].strip()
-        value: str = token[colon_index + 1:].strip()
-        return key, value
+
+def raise_invalid_token(token: Token, expression: str) -> None:
+    if token.message is not None:
+        raise token.error_class(message=token.message)
+    raise OQSUnexpectedCharacterError(
+        message=f"The character '{token.text}' is not recognized in this setting: {expression}"
+    )
@@ -0,0 +1,122 @@
+import time
+from typing import (Callable, Iterable, Iterator)
+from .governor import allocation_size
+from .interpreter import OQSInterpreter
+from .nodes import (
+    ASTNode,
+    BinaryOpNode,
+    ComparisonOpNode,
+    FunctionNode,
+    KVSNode,
+    ListNode,
+    PackedNode,
+    UnparsedNode,
+    VariableNode
+)
+
+
+def node_label(node: ASTNode) -> str:
+    if isinstance(node, FunctionNode):
+        return node.key
+    elif isinstance(node, (BinaryOpNode, ComparisonOpNode)):
+        return OQSInterpreter.OPERATORS.get(node.op, node.op)
+    elif isinstance(node, ListNode):
+        return "List"
+    elif isinstance(node, KVSNode):
+        return "KVS"
+    elif isinstance(node, VariableNode):
+        return f"Variable:{node.name}"
+    elif isinstance(node, (PackedNode, UnparsedNode)):
+        return "Expression"
+    return "Literal"
+
+
+class NodeProfile:
+    __slots__ = ("calls", "inclusive_ns", "exclusive_ns", "allocations")
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.inclusive_ns: int = 0
+        self.exclusive_ns: int = 0
+        self.allocations: int = 0
+
+    def record(self, inclusive_ns: int, exclusive_ns: int, allocations: int) -> None:
+        self.calls += 1
+        self.inclusive_ns += inclusive_ns
+        self.exclusive_ns += exclusive_ns
+        self.allocations += allocations
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "inclusive_ns": self.inclusive_ns,
+            "exclusive_ns": self.exclusive_ns,
+            "allocations": self.allocations
+        }
+
+
+class OQSProfiler:
+    def __init__(self) -> None:
+        self.stack: list[str] = []
+        self.child_times: list[int] = []
+        self.nodes: dict[str, NodeProfile] = {}
+        self.functions: dict[str, NodeProfile] = {}
+        self.total_ns: int = 0
+
+    def measure(self, node: ASTNode, function: Callable[[any], any], argument: any, fresh: bool) -> any:
+        label: str = node_label(node)
+        self.stack.append(label)
+        path: str = ";".join(self.stack)
+        self.child_times.append(0)
+        allocations: int = 0
+        start: int = time.perf_counter_ns()
+        try:
+            value: any = function(argument)
+            if fresh:
+                allocations: int = allocation_size(value)
+            return value
+        finally:
+            elapsed: int = time.perf_counter_ns() - start
+            child_time: int = self.child_times.pop()
+            self.stack.pop()
+            if self.child_times:
+                self.child_times[-1] += elapsed
+            else:
+                self.total_ns += elapsed
+            self.nodes.setdefault(path, NodeProfile()).record(
+                inclusive_ns=elapsed, exclusive_ns=elapsed - child_time, allocations=allocations
+            )
+            if isinstance(node, (FunctionNode, BinaryOpNode, ComparisonOpNode)):
+                self.functions.setdefault(label, NodeProfile()).record(
+                    inclusive_ns=elapsed, exclusive_ns=elapsed - child_time, allocations=allocations
+                )
+
+    def stream(self, node: ASTNode, iterable: Iterable) -> Iterator:
+        iterator: Iterator = iter(iterable)
+        while True:
+            try:
+                item: any = self.measure(node=node, function=next, argument=iterator, fresh=False)
+            except StopIteration:
+                return
+            yield item
+
+    def collapsed_stacks(self) -> str:
+        return "\n".join(
+            f"{path} {profile.exclusive_ns}" for path, profile in sorted(self.nodes.items()) if profile.exclusive_ns
+        )
+
+    def summary(self) -> dict[str, any]:
+        return {
+            "total_ns": self.total_ns,
+            "nodes": [
+                {"path": path, **profile.to_dict()}
+                for path, profile in sorted(self.nodes.items(), key=lambda item: -item[1].inclusive_ns)
+            ],
+            "functions": {
+                name: profile.to_dict()
+                for name, profile in sorted(self.functions.items(), key=lambda item: -item[1].inclusive_ns)
+            }
+        }
+
+    def report(self) -> dict[str, any]:
+        return {**self.summary(), "collapsed_stacks": self.collapsed_stacks()}
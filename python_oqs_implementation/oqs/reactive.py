@@ -0,0 +1,235 @@
+import copy
+from typing import Callable
+from .analysis import (
+    BINDING_FUNCTIONS,
+    IMPURE_FUNCTIONS,
+    bound_variables,
+    called_functions,
+    child_nodes,
+    is_opaque,
+    walk
+)
+from .engine import capture_results
+from .interpreter import OQSInterpreter
+from .nodes import (
+    ASTNode,
+    BinaryOpNode,
+    ComparisonOpNode,
+    FunctionNode,
+    KVSNode,
+    ListNode,
+    NumberNode,
+    StringNode,
+    VariableNode
+)
+from .parser import OQSParser
+from .registry import OQSFunctionRegistry
+
+
+Path = tuple[str | int | float, ...]
+MISSING: object = object()
+MEMOIZED_NODES: tuple[type[ASTNode], ...] = (FunctionNode, BinaryOpNode, ComparisonOpNode, ListNode, KVSNode)
+
+
+def resolve_path(variables: dict[str, any], path: Path) -> any:
+    value: any = variables.get(path[0], MISSING)
+    for key in path[1:]:
+        if isinstance(value, dict):
+            value: any = value.get(key, MISSING)
+        elif isinstance(value, list) and isinstance(key, int) and 0 <= key < len(value):
+            value: any = value[key]
+        else:
+            return MISSING
+    return value
+
+
+def same_value(left: any, right: any) -> bool:
+    if left is right:
+        return True
+    elif type(left) is not type(right):
+        return False
+    elif isinstance(left, list):
+        return len(left) == len(right) and all(same_value(item, other) for item, other in zip(left, right))
+    elif isinstance(left, dict):
+        return len(left) == len(right) and all(
+            same_value(key, other_key) and same_value(item, other_item)
+            for (key, item), (other_key, other_item) in zip(left.items(), right.items())
+        )
+    return left == right
+
+
+class OQSReactiveInterpreter(OQSInterpreter):
+    def __init__(
+            self,
+            expression: str,
+            graph: 'OQSReactiveGraph',
+            ast: ASTNode,
+            registry: OQSFunctionRegistry | None = None
+    ) -> None:
+        super().__init__(expression=expression, variables=graph.variables, ast=ast, registry=registry)
+        self.graph: OQSReactiveGraph = graph
+
+    def is_fresh(self, node: ASTNode) -> bool:
+        return False
+
+    def evaluate_sequence(self, node: ASTNode) -> any:
+        value: any = self.graph.memo.get(node, MISSING)
+        if value is not MISSING:
+            return value
+        return super().evaluate_sequence(node)
+
+    def evaluate(self, node: ASTNode) -> any:
+        if node not in self.graph.dependencies:
+            return super().evaluate(node)
+        value: any = self.graph.memo.get(node, MISSING)
+        if value is MISSING:
+            value: any = super().evaluate(node)
+            self.graph.memo[node] = value
+        return value
+
+
+class OQSReactiveGraph:
+    def __init__(
+            self,
+            expressions: dict[str, str] | None = None,
+            variables: dict[str, any] | None = None,
+            additional_functions: list[tuple[str, Callable]] | None = None,
+            registry: OQSFunctionRegistry | None = None,
+            defer_undefined_functions: bool = False
+    ) -> None:
+        self.variables: dict[str, any] = copy.deepcopy(dict(variables)) if variables else {}
+        self.registry: OQSFunctionRegistry = (registry if registry is not None else OQSInterpreter.REGISTRY).extend(
+            additional_functions
+        )
+        self.defer_undefined_functions: bool = defer_undefined_functions
+        self.parser: OQSParser = OQSParser(eager=True)
+        self.expressions: dict[str, str] = {}
+        self.asts: dict[str, ASTNode] = {}
+        self.called_functions: dict[str, dict[str, str]] = {}
+        self.expression_dependencies: dict[str, frozenset[Path] | None] = {}
+        self.dependencies: dict[ASTNode, frozenset[Path]] = {}
+        self.dependents: dict[str, set[ASTNode]] = {}
+        self.memo: dict[ASTNode, any] = {}
+        self.results: dict[str, dict[str, any]] = {}
+        self.dirty: set[str] = set()
+        for name, expression in (expressions or {}).items():
+            self.add(name=name, expression=expression)
+
+    def add(self, name: str, expression: str) -> None:
+        self.expressions[name] = expression
+        self.dirty.add(name)
+        try:
+            ast: ASTNode = self.parser.parse(expression=expression)
+        except Exception:
+            self.asts.pop(name, None)
+            self.expression_dependencies[name] = frozenset()
+            return
+        self.asts[name] = ast
+        self.called_functions[name] = called_functions(ast)
+        bound_names: set[str] | None = bound_variables(ast)
+        node_dependencies: dict[ASTNode, frozenset[Path] | None] = {}
+        paths: dict[ASTNode, Path] = {}
+        for node in reversed(walk(ast)):
+            dependencies: frozenset[Path] | None = self.node_dependencies(
+                node=node, known=node_dependencies, paths=paths
+            )
+            node_dependencies[node] = dependencies
+            if (
+                    dependencies is not None
+                    and bound_names is not None
+                    and isinstance(node, MEMOIZED_NODES)
+                    and not any(path[0] in bound_names for path in dependencies)
+            ):
+                self.dependencies[node] = dependencies
+                for path in dependencies:
+                    self.dependents.setdefault(path[0], set()).add(node)
+        self.expression_dependencies[name] = node_dependencies[ast]
+
+    def node_dependencies(
+            self, node: ASTNode, known: dict[ASTNode, frozenset[Path] | None], paths: dict[ASTNode, Path]
+    ) -> frozenset[Path] | None:
+        if isinstance(node, VariableNode):
+            paths[node] = (node.name,)
+            return frozenset({paths[node]})
+        elif is_opaque(node):
+            return None
+        elif isinstance(node, FunctionNode) and (
+                node.key in IMPURE_FUNCTIONS
+                or node.packed
+                or self.registry.functions.get(node.key) is not OQSInterpreter.FUNCTIONS.get(node.key, MISSING)
+        ):
+            return None
+        children: list[ASTNode] = child_nodes(node)
+        if (
+                isinstance(node, FunctionNode)
+                and node.key == "ACCESS"
+                and len(children) in (2, 3)
+                and children[0] in paths
+                and isinstance(children[1], (StringNode, NumberNode))
+        ):
+            path: Path = paths[children[0]] + (children[1].value,)
+            if len(children) == 2:
+                paths[node] = path
+                return frozenset({path})
+            elif known[children[2]] is not None:
+                return frozenset({path}) | known[children[2]]
+            return None
+        bound_name: str | None = None
+        if isinstance(node, FunctionNode) and node.key in BINDING_FUNCTIONS and len(children) >= 2 and isinstance(
+                children[1], StringNode
+        ):
+            bound_name: str = children[1].value
+        dependencies: set[Path] = set()
+        for index, child in enumerate(children):
+            if known[child] is None:
+                return None
+            dependencies.update(path for path in known[child] if index < 2 or path[0] != bound_name)
+        return frozenset(dependencies)
+
+    def evaluate(self, name: str) -> dict[str, any]:
+        ast: ASTNode | None = self.asts.get(name)
+        if ast is None:
+            return capture_results(lambda: self.parser.parse(expression=self.expressions[name]))
+        interpreter: OQSReactiveInterpreter = OQSReactiveInterpreter(
+            expression=self.expressions[name], graph=self, ast=ast, registry=self.registry
+        )
+
+        def results() -> any:
+            if not self.defer_undefined_functions:
+                interpreter.check_functions(functions=self.called_functions[name])
+            return interpreter.results()
+
+        return copy.deepcopy(capture_results(results))
+
+    def refresh(self) -> dict[str, dict[str, any]]:
+        recomputed: dict[str, dict[str, any]] = {}
+        for name in self.expressions:
+            if name in self.dirty:
+                recomputed[name] = self.results[name] = self.evaluate(name=name)
+        self.dirty.clear()
+        return copy.deepcopy(recomputed)
+
+    def evaluate_all(self) -> dict[str, dict[str, any]]:
+        self.refresh()
+        return copy.deepcopy(self.results)
+
+    def update(self, changed_variables: dict[str, any]) -> dict[str, dict[str, any]]:
+        previous: dict[str, any] = dict(self.variables)
+        self.variables.update(copy.deepcopy(changed_variables))
+        changed_paths: dict[Path, bool] = {}
+
+        def changed(path: Path) -> bool:
+            if path not in changed_paths:
+                changed_paths[path] = path[0] in changed_variables and not same_value(
+                    resolve_path(variables=previous, path=path), resolve_path(variables=self.variables, path=path)
+                )
+            return changed_paths[path]
+
+        for variable_name in changed_variables:
+            for node in self.dependents.get(variable_name, ()):
+                if node in self.memo and any(changed(path) for path in self.dependencies[node]):
+                    del self.memo[node]
+        for name, dependencies in self.expression_dependencies.items():
+            if dependencies is None or any(changed(path) for path in dependencies):
+                self.dirty.add(name)
+        return self.refresh()
@@ -0,0 +1,39 @@
+import threading
+from types import MappingProxyType
+from typing import (Callable, Hashable, Iterable, Mapping)
+from .constants.values import MAX_CACHED_REGISTRY_OVERLAYS
+
+
+class OQSFunctionRegistry:
+    __slots__ = ("functions", "overlays", "lock")
+
+    def __init__(self, functions: Mapping[str, Callable]) -> None:
+        self.functions: Mapping[str, Callable] = MappingProxyType(
+            {function_name.upper(): function for function_name, function in functions.items()}
+        )
+        self.overlays: dict[Hashable, OQSFunctionRegistry] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def __reduce__(self) -> tuple[type, tuple[dict[str, Callable]]]:
+        return OQSFunctionRegistry, (dict(self.functions),)
+
+    def extend(self, additional_functions: Iterable[tuple[str, Callable]] | None) -> 'OQSFunctionRegistry':
+        key: tuple[tuple[str, Callable], ...] = tuple(
+            (function_name.upper(), function) for function_name, function in additional_functions or ()
+        )
+        if not key:
+            return self
+        try:
+            registry: OQSFunctionRegistry | None = self.overlays.get(key)
+        except TypeError:
+            return OQSFunctionRegistry(functions={**self.functions, **dict(key)})
+        if registry is not None:
+            return registry
+        with self.lock:
+            registry: OQSFunctionRegistry | None = self.overlays.get(key)
+            if registry is None:
+                registry: OQSFunctionRegistry = OQSFunctionRegistry(functions={**self.functions, **dict(key)})
+                while len(self.overlays) >= MAX_CACHED_REGISTRY_OVERLAYS:
+                    del self.overlays[next(iter(self.overlays))]
+                self.overlays[key] = registry
+            return registry
@@ -0,0 +1,188 @@
+import copy
+from typing import (Callable, Hashable, Iterable, Iterator)
+from .analysis import (bound_variables, called_functions, child_nodes, scoped_free_variables)
+from .engine import (capture_results, error_results)
+from .interpreter import OQSInterpreter
+from .nodes import (
+    ASTNode,
+    BinaryOpNode,
+    BooleanNode,
+    ComparisonOpNode,
+    FunctionNode,
+    KVSNode,
+    ListNode,
+    NullNode,
+    NumberNode,
+    PackedNode,
+    StringNode,
+    UnparsedNode,
+    VariableNode
+)
+from .parser import OQSParser
+from .registry import OQSFunctionRegistry
+
+
+MISSING: object = object()
+SHARED_NODES: tuple[type[ASTNode], ...] = (FunctionNode, BinaryOpNode, ComparisonOpNode, ListNode, KVSNode)
+
+
+class OQSRuleSetInterpreter(OQSInterpreter):
+    def __init__(
+            self,
+            variables: dict[str, any] | None,
+            shared: frozenset[ASTNode],
+            registry: OQSFunctionRegistry | None = None
+    ) -> None:
+        super().__init__(expression="", variables=variables, ast=NullNode(), registry=registry)
+        self.shared: frozenset[ASTNode] = shared
+        self.memo: dict[ASTNode, any] = {}
+
+    def is_fresh(self, node: ASTNode) -> bool:
+        return node not in self.shared and super().is_fresh(node)
+
+    def evaluate_sequence(self, node: ASTNode) -> any:
+        if node in self.shared:
+            return self.evaluate(node)
+        return super().evaluate_sequence(node)
+
+    def evaluate(self, node: ASTNode) -> any:
+        if node not in self.shared:
+            return super().evaluate(node)
+        value: any = self.memo.get(node, MISSING)
+        if value is MISSING:
+            value: any = super().evaluate(node)
+            self.memo[node] = value
+        return value
+
+
+class RuleSet:
+    def __init__(
+            self,
+            rules: dict[str, str],
+            additional_functions: list[tuple[str, Callable]] | None = None,
+            registry: OQSFunctionRegistry | None = None,
+            defer_undefined_functions: bool = False
+    ) -> None:
+        self.rules: dict[str, str] = dict(rules)
+        self.registry: OQSFunctionRegistry = (registry if registry is not None else OQSInterpreter.REGISTRY).extend(
+            additional_functions
+        )
+        self.defer_undefined_functions: bool = defer_undefined_functions
+        self.nodes: dict[Hashable, ASTNode] = {}
+        self.roots: dict[str, ASTNode] = {}
+        self.errors: dict[str, dict[str, any]] = {}
+        self.called_functions: dict[str, dict[str, str]] = {}
+        parser: OQSParser = OQSParser(eager=True)
+        unsafe_roots: list[ASTNode] = []
+        bound_names: set[str] = set()
+        for name, expression in self.rules.items():
+            try:
+                ast: ASTNode = parser.parse(expression=expression)
+            except Exception as e:
+                self.errors[name] = error_results(error=e)
+                continue
+            self.called_functions[name] = called_functions(ast)
+            self.roots[name] = self.intern(ast)
+            rule_bound_names: set[str] | None = bound_variables(ast)
+            if rule_bound_names is None:
+                unsafe_roots.append(self.roots[name])
+            else:
+                bound_names.update(rule_bound_names)
+        self.shared: frozenset[ASTNode] = self.find_shared(bound_names=bound_names, unsafe_roots=unsafe_roots)
+
+    def intern(self, node: ASTNode) -> ASTNode:
+        if isinstance(node, (BinaryOpNode, ComparisonOpNode)):
+            left: ASTNode = self.intern(node.left)
+            right: ASTNode = self.intern(node.right)
+            key: Hashable = (type(node), node.op, left, right)
+            build: Callable[[], ASTNode] = lambda: type(node)(left=left, op=node.op, right=right)
+        elif isinstance(node, FunctionNode):
+            args: list[ASTNode] = [self.intern(arg) for arg in node.args]
+            key: Hashable = (FunctionNode, node.key, tuple(args))
+            build: Callable[[], ASTNode] = lambda: FunctionNode(name=node.name, args=args)
+        elif isinstance(node, ListNode):
+            elements: list[ASTNode] = [self.intern(element) for element in node.elements]
+            key: Hashable = (ListNode, tuple(elements))
+            build: Callable[[], ASTNode] = lambda: ListNode(elements=elements)
+        elif isinstance(node, KVSNode):
+            key_value_store: dict[ASTNode, ASTNode] = {
+                self.intern(key): self.intern(value) for key, value in node.key_value_store.items()
+            }
+            key: Hashable = (KVSNode, tuple(key_value_store.items()))
+            build: Callable[[], ASTNode] = lambda: KVSNode(key_value_store=key_value_store)
+        elif isinstance(node, PackedNode):
+            inner: ASTNode | None = self.intern(node.node) if node.node is not None else None
+            key: Hashable = (PackedNode, node.expression, inner)
+            build: Callable[[], ASTNode] = lambda: PackedNode(expression=node.expression, node=inner)
+        elif isinstance(node, (NumberNode, StringNode, BooleanNode)):
+            key: Hashable = (type(node), type(node.value), repr(node.value))
+            build: Callable[[], ASTNode] = lambda: node
+        elif isinstance(node, VariableNode):
+            key: Hashable = (VariableNode, node.name)
+            build: Callable[[], ASTNode] = lambda: node
+        elif isinstance(node, UnparsedNode):
+            key: Hashable = (UnparsedNode, node.token)
+            build: Callable[[], ASTNode] = lambda: node
+        elif isinstance(node, NullNode):
+            key: Hashable = (NullNode,)
+            build: Callable[[], ASTNode] = lambda: node
+        else:
+            key: Hashable = (type(node), id(node))
+            build: Callable[[], ASTNode] = lambda: node
+        canonical: ASTNode | None = self.nodes.get(key)
+        if canonical is None:
+            canonical: ASTNode = build()
+            self.nodes[key] = canonical
+        return canonical
+
+    def is_pure(self, node: FunctionNode) -> bool:
+        return self.registry.functions.get(node.key) in OQSInterpreter.PURE_FUNCTIONS
+
+    def find_shared(self, bound_names: set[str], unsafe_roots: list[ASTNode]) -> frozenset[ASTNode]:
+        references: dict[ASTNode, int] = dict.fromkeys(self.nodes.values(), 0)
+        for root in self.roots.values():
+            references[root] += 1
+        for node in self.nodes.values():
+            for child in child_nodes(node):
+                references[child] += 1
+        unsafe: set[ASTNode] = set()
+        pending: list[ASTNode] = list(unsafe_roots)
+        while pending:
+            node: ASTNode = pending.pop()
+            if node not in unsafe:
+                unsafe.add(node)
+                pending.extend(child_nodes(node))
+        free_names: dict[ASTNode, frozenset[str] | None] = {}
+        for node in self.nodes.values():
+            scoped_free_variables(node=node, is_pure=self.is_pure, known=free_names)
+        return frozenset(
+            node for node, count in references.items()
+            if count > 1
+            and isinstance(node, SHARED_NODES)
+            and node not in unsafe
+            and free_names[node] is not None
+            and not free_names[node] & bound_names
+        )
+
+    def evaluate(self, variables: dict[str, any] | None = None) -> dict[str, dict[str, any]]:
+        interpreter: OQSRuleSetInterpreter = OQSRuleSetInterpreter(
+            variables=variables, shared=self.shared, registry=self.registry
+        )
+        results: dict[str, dict[str, any]] = {}
+        for name in self.rules:
+            root: ASTNode | None = self.roots.get(name)
+            if root is None:
+                results[name] = self.errors[name]
+                continue
+
+            def evaluate_rule() -> any:
+                if not self.defer_undefined_functions:
+                    interpreter.check_functions(functions=self.called_functions[name])
+                value: any = interpreter.evaluate(root)
+                return copy.deepcopy(value) if interpreter.memo else value
+
+            results[name] = capture_results(evaluate_rule)
+        return results
+
+    def evaluate_many(self, rows: Iterable[dict[str, any] | None]) -> Iterator[dict[str, dict[str, any]]]:
+        return (self.evaluate(variables=row) for row in rows)
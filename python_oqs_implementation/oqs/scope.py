@@ -0,0 +1,23 @@
+from typing import Mapping
+from .nodes import ASTNode
+
+
+class OQSScope(dict):
+    __slots__ = ("parent", "invariants", "invariant_values")
+
+    def __init__(self, parent: Mapping[str, any], invariants: frozenset[ASTNode] = frozenset()) -> None:
+        super().__init__()
+        self.parent: Mapping[str, any] = parent
+        self.invariants: frozenset[ASTNode] = invariants
+        self.invariant_values: dict[ASTNode, any] = {}
+
+    def __missing__(self, key: str) -> any:
+        if key in self.parent:
+            return self.parent[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self.parent
+
+    def get(self, key: str, default: any = None) -> any:
+        return self[key] if key in self else default
@@ -0,0 +1,46 @@
+import itertools
+from collections.abc import Sized
+from typing import (Iterable, Iterator)
+from .governor import OQSGovernor
+
+
+class LazyList:
+    __slots__ = ("iterable",)
+
+    def __init__(self, iterable: Iterable) -> None:
+        self.iterable: Iterable = iterable
+
+    def __iter__(self) -> Iterator:
+        return iter(self.iterable)
+
+    def count(self) -> int:
+        if isinstance(self.iterable, Sized):
+            return len(self.iterable)
+        return sum(1 for _ in self.iterable)
+
+
+class RepeatedList:
+    __slots__ = ("items", "times")
+
+    def __init__(self, items: list[any], times: int) -> None:
+        self.items: list[any] = items
+        self.times: int = max(times, 0)
+
+    def __iter__(self) -> Iterator:
+        return itertools.chain.from_iterable(itertools.repeat(self.items, self.times))
+
+    def __len__(self) -> int:
+        return len(self.items) * self.times
+
+
+def materialize(value: any, governor: OQSGovernor | None = None) -> any:
+    if governor is not None and isinstance(value, LazyList):
+        if isinstance(value.iterable, Sized):
+            governor.reserve(count=len(value.iterable))
+        if governor.limits.max_elements is None or not isinstance(value.iterable, Sized):
+            return list(governor.reserving(value.iterable))
+    if isinstance(value, LazyList) and isinstance(value.iterable, RepeatedList):
+        return value.iterable.items * value.iterable.times
+    elif isinstance(value, LazyList):
+        return list(value.iterable)
+    return value
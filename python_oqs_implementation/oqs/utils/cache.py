@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+from typing import (Hashable, NamedTuple)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    MISSING: object = object()
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[Hashable, any] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: Hashable) -> any:
+        if not self.enabled:
+            return self.MISSING
+        with self._lock:
+            value: any = self._entries.get(key, self.MISSING)
+            if value is self.MISSING:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize: int = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits: int = 0
+            self.misses: int = 0
+            self.evictions: int = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._entries)
+            )
+
+    def _evict(self) -> None:
+        while len(self._entries) > max(self.maxsize, 0):
+            self._entries.popitem(last=False)
+            self.evictions += 1
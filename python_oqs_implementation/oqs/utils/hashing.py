@@ -0,0 +1,60 @@
+from typing import (Hashable, Iterable)
+
+
+LIST_KEY: object = object()
+KVS_KEY: object = object()
+
+
+def hashable_key(value: any) -> Hashable:
+    if isinstance(value, list):
+        return LIST_KEY, tuple(hashable_key(item) for item in value)
+    elif isinstance(value, dict):
+        return KVS_KEY, frozenset((key, hashable_key(item)) for key, item in value.items())
+    hash(value)
+    return value
+
+
+class ValueSet:
+    __slots__ = ("keys", "unhashable")
+
+    def __init__(self, values: Iterable = ()) -> None:
+        self.keys: set[Hashable] = set()
+        self.unhashable: list[any] = []
+        if isinstance(values, list):
+            try:
+                self.keys: set[Hashable] = set(values)
+                return
+            except TypeError:
+                pass
+        for value in values:
+            self.add(value)
+
+    def add(self, value: any) -> bool:
+        try:
+            key: Hashable = hashable_key(value)
+        except TypeError:
+            if value in self.unhashable:
+                return False
+            self.unhashable.append(value)
+            return True
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        return True
+
+    def __contains__(self, value: any) -> bool:
+        try:
+            return hashable_key(value) in self.keys
+        except TypeError:
+            return value in self.unhashable
+
+    def __len__(self) -> int:
+        return len(self.keys) + len(self.unhashable)
+
+
+def unique(values: list[any]) -> list[any]:
+    try:
+        return list(dict.fromkeys(values))
+    except TypeError:
+        seen: ValueSet = ValueSet()
+        return [value for value in values if seen.add(value)]
@@ -0,0 +1,140 @@
+import datetime
+import re
+from typing import Callable
+from ..constants.values import TEMPORAL_FORMAT_CACHE_SIZE
+from .cache import LRUCache
+
+
+TemporalParser = Callable[[str], datetime.datetime | None]
+DURATION_PATTERN: re.Pattern = re.compile(r"(\d+)\s+(\d+):(\d+):(\d+)")
+ISO_DATETIME_PATTERN: re.Pattern = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}")
+ISO_DATE_PATTERN: re.Pattern = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+ISO_TIME_PATTERN: re.Pattern = re.compile(r"[0-9]{2}:[0-9]{2}:[0-9]{2}")
+REGEX_CHARACTERS_PATTERN: re.Pattern = re.compile(r"([\\.^$*+?\(\){}\[\]|])")
+WHITESPACE_PATTERN: re.Pattern = re.compile(r"\s+")
+DIRECTIVE_PATTERNS: dict[str, str] = {
+    'd': r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    'f': r"(?P<f>[0-9]{1,6})",
+    'H': r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    'm': r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    'M': r"(?P<M>[0-5]\d|\d)",
+    'S': r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    'y': r"(?P<y>\d\d)",
+    'Y': r"(?P<Y>\d\d\d\d)",
+    '%': '%'
+}
+
+
+def two_digit_year(value: str) -> int:
+    year: int = int(value)
+    return year + 2000 if year <= 68 else year + 1900
+
+
+def microseconds(value: str) -> int:
+    return int(value + "0" * (6 - len(value)))
+
+
+DIRECTIVE_FIELDS: dict[str, tuple[int, Callable[[str], int]]] = {
+    'y': (0, two_digit_year),
+    'Y': (0, int),
+    'm': (1, int),
+    'd': (2, int),
+    'H': (3, int),
+    'M': (4, int),
+    'S': (5, int),
+    'f': (6, microseconds)
+}
+TEMPORAL_PARSER_CACHE: LRUCache = LRUCache(maxsize=TEMPORAL_FORMAT_CACHE_SIZE)
+
+
+def parse_iso_datetime(string: str) -> datetime.datetime | None:
+    if ISO_DATETIME_PATTERN.fullmatch(string) is None:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(string)
+    except ValueError:
+        return None
+
+
+def parse_iso_date(string: str) -> datetime.datetime | None:
+    if ISO_DATE_PATTERN.fullmatch(string) is None:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(string)
+    except ValueError:
+        return None
+
+
+def parse_iso_time(string: str) -> datetime.datetime | None:
+    if ISO_TIME_PATTERN.fullmatch(string) is None:
+        return None
+    try:
+        return datetime.datetime.fromisoformat("1900-01-01T" + string)
+    except ValueError:
+        return None
+
+
+ISO_PARSERS: dict[str, TemporalParser] = {
+    "%Y-%m-%dT%H:%M:%S": parse_iso_datetime,
+    "%Y-%m-%d": parse_iso_date,
+    "%H:%M:%S": parse_iso_time
+}
+
+
+def compile_temporal_format(format_str: str) -> TemporalParser | None:
+    if format_str in ISO_PARSERS:
+        return ISO_PARSERS[format_str]
+    escaped_format: str = WHITESPACE_PATTERN.sub(r"\\s+", REGEX_CHARACTERS_PATTERN.sub(r"\\\1", format_str))
+    pattern_parts: list[str] = []
+    position: int = 0
+    index: int = escaped_format.find('%')
+    while index != -1:
+        directive: str = escaped_format[index + 1:index + 2]
+        if directive not in DIRECTIVE_PATTERNS:
+            return None
+        pattern_parts.extend([escaped_format[position:index], DIRECTIVE_PATTERNS[directive]])
+        position: int = index + 2
+        index: int = escaped_format.find('%', position)
+    pattern_parts.append(escaped_format[position:])
+    try:
+        pattern: re.Pattern = re.compile("".join(pattern_parts), re.IGNORECASE)
+    except re.error:
+        return None
+    fields: list[tuple[int, int, Callable[[str], int]]] = sorted(
+        (index, *DIRECTIVE_FIELDS[group]) for group, index in pattern.groupindex.items()
+    )
+
+    def parse(string: str) -> datetime.datetime | None:
+        found: re.Match | None = pattern.match(string)
+        if found is None or found.end() != len(string):
+            return None
+        values: list[int] = [1900, 1, 1, 0, 0, 0, 0]
+        for index, position, convert in fields:
+            values[position] = convert(found.group(index))
+        try:
+            return datetime.datetime(*values)
+        except ValueError:
+            return None
+
+    return parse
+
+
+def parse_datetime(string: str, format_str: str) -> datetime.datetime:
+    parser: TemporalParser | None = ISO_PARSERS.get(format_str)
+    if parser is None:
+        parser: TemporalParser | None = TEMPORAL_PARSER_CACHE.get(format_str)
+        if parser is TEMPORAL_PARSER_CACHE.MISSING:
+            parser: TemporalParser | None = compile_temporal_format(format_str=format_str)
+            TEMPORAL_PARSER_CACHE.put(format_str, parser)
+    parsed: datetime.datetime | None = parser(string) if parser is not None else None
+    if parsed is None:
+        return datetime.datetime.strptime(string, format_str)
+    return parsed
+
+
+def parse_duration(string: str) -> datetime.timedelta:
+    duration_match: re.Match | None = DURATION_PATTERN.match(string)
+    if duration_match is None:
+        raise ValueError("Invalid duration format")
+    days, hours, minutes, seconds = map(int, duration_match.groups())
+    return datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
@@ -0,0 +1,148 @@
+from typing import (Callable, Mapping)
+from .analysis import (free_variables, walk)
+from .compiler import BUILT_IN_FUNCTIONS
+from .constants.types import ValueTypeStrings as VTS
+from .interpreter import OQSInterpreter
+from .nodes import (ASTNode, BinaryOpNode, ComparisonOpNode, EvaluatedNode, NumberNode, VariableNode)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+MAX_EXACT_INTEGER: int = 2 ** 53
+MAX_SAFE_INTEGER: int = 2 ** 62
+ARITHMETIC_OPERATORS: frozenset[str] = frozenset({'+', '-', '*', '/'})
+COMPARISON_OPERATORS: frozenset[str] = frozenset({'<', '>', '<=', '>=', '==', '!='})
+
+
+class OQSVectorizationUnsupported(Exception):
+    pass
+
+
+class VectorColumn:
+    __slots__ = ("values", "kind")
+
+    def __init__(self, values: 'numpy.ndarray', kind: str) -> None:
+        self.values: numpy.ndarray = values
+        self.kind: str = kind
+
+
+class OQSVectorizer:
+    def __init__(self, ast: ASTNode) -> None:
+        self.ast: ASTNode = ast
+        self.is_vectorizable: bool = numpy is not None and self.supports(ast=ast)
+        self.variables: list[str] = sorted(free_variables(ast)) if self.is_vectorizable else []
+
+    @staticmethod
+    def supports(ast: ASTNode) -> bool:
+        for node in walk(ast):
+            if isinstance(node, (BinaryOpNode, ComparisonOpNode)):
+                if node.op not in ARITHMETIC_OPERATORS and node.op not in COMPARISON_OPERATORS:
+                    return False
+            elif isinstance(node, (NumberNode, EvaluatedNode)):
+                if type(node.value) not in (int, float) or (
+                        type(node.value) is int and abs(node.value) >= MAX_SAFE_INTEGER
+                ):
+                    return False
+            elif not isinstance(node, VariableNode):
+                return False
+        return True
+
+    @staticmethod
+    def uses_built_in_operators(functions: Mapping[str, Callable]) -> bool:
+        return all(
+            functions.get(OQSInterpreter.OPERATORS[op]) is BUILT_IN_FUNCTIONS[OQSInterpreter.OPERATORS[op]]
+            for op in ARITHMETIC_OPERATORS | COMPARISON_OPERATORS
+        )
+
+    def evaluate(self, rows: list[dict[str, any]]) -> tuple[list[any], list[bool]]:
+        fallback: numpy.ndarray = numpy.zeros(len(rows), dtype=bool)
+        columns: dict[str, VectorColumn] = {
+            name: self.column(name=name, rows=rows, fallback=fallback) for name in self.variables
+        }
+        with numpy.errstate(all="ignore"):
+            result: VectorColumn = self.evaluate_node(node=self.ast, columns=columns, fallback=fallback)
+        return result.values.tolist(), fallback.tolist()
+
+    @staticmethod
+    def column(name: str, rows: list[dict[str, any]], fallback: 'numpy.ndarray') -> VectorColumn:
+        column_type: type | None = None
+        values: list[int | float] = []
+        for index, row in enumerate(rows):
+            value: any = row.get(name) if row else None
+            if column_type is None and type(value) in (int, float):
+                column_type: type = type(value)
+            if type(value) is column_type and (column_type is float or abs(value) < MAX_SAFE_INTEGER):
+                values.append(value)
+            else:
+                fallback[index] = True
+                values.append(0)
+        if column_type is float:
+            return VectorColumn(values=numpy.array(values, dtype=numpy.float64), kind=VTS.DECIMAL)
+        return VectorColumn(values=numpy.array(values, dtype=numpy.int64), kind=VTS.INTEGER)
+
+    def evaluate_node(
+            self, node: ASTNode, columns: dict[str, VectorColumn], fallback: 'numpy.ndarray'
+    ) -> VectorColumn:
+        if isinstance(node, VariableNode):
+            return columns[node.name]
+        elif isinstance(node, (NumberNode, EvaluatedNode)):
+            if type(node.value) is float:
+                return VectorColumn(values=numpy.full(len(fallback), node.value, numpy.float64), kind=VTS.DECIMAL)
+            return VectorColumn(values=numpy.full(len(fallback), node.value, numpy.int64), kind=VTS.INTEGER)
+        left: VectorColumn = self.evaluate_node(node=node.left, columns=columns, fallback=fallback)
+        right: VectorColumn = self.evaluate_node(node=node.right, columns=columns, fallback=fallback)
+        if node.op in COMPARISON_OPERATORS:
+            return self.compare(op=node.op, left=left, right=right, fallback=fallback)
+        return self.arithmetic(op=node.op, left=left, right=right, fallback=fallback)
+
+    @staticmethod
+    def as_number(column: VectorColumn) -> VectorColumn:
+        if column.kind == VTS.BOOLEAN:
+            return VectorColumn(values=column.values.astype(numpy.int64), kind=VTS.INTEGER)
+        return column
+
+    @staticmethod
+    def flag_inexact_integers(column: VectorColumn, fallback: 'numpy.ndarray') -> None:
+        if column.kind == VTS.INTEGER:
+            fallback |= numpy.abs(column.values) > MAX_EXACT_INTEGER
+
+    def compare(
+            self, op: str, left: VectorColumn, right: VectorColumn, fallback: 'numpy.ndarray'
+    ) -> VectorColumn:
+        if VTS.DECIMAL in (left.kind, right.kind):
+            self.flag_inexact_integers(column=left, fallback=fallback)
+            self.flag_inexact_integers(column=right, fallback=fallback)
+        comparisons: dict[str, Callable] = {
+            '<': numpy.less,
+            '>': numpy.greater,
+            '<=': numpy.less_equal,
+            '>=': numpy.greater_equal,
+            '==': numpy.equal,
+            '!=': numpy.not_equal
+        }
+        return VectorColumn(values=comparisons[op](left.values, right.values), kind=VTS.BOOLEAN)
+
+    def arithmetic(
+            self, op: str, left: VectorColumn, right: VectorColumn, fallback: 'numpy.ndarray'
+    ) -> VectorColumn:
+        left: VectorColumn = self.as_number(column=left)
+        right: VectorColumn = self.as_number(column=right)
+        kind: str = VTS.DECIMAL if VTS.DECIMAL in (left.kind, right.kind) else VTS.INTEGER
+        if op == '/':
+            if kind == VTS.INTEGER:
+                raise OQSVectorizationUnsupported("Integer division can yield an Integer or a Decimal per row")
+            fallback |= right.values == 0
+            return VectorColumn(values=numpy.true_divide(left.values, right.values), kind=VTS.DECIMAL)
+        if kind == VTS.INTEGER:
+            if op == '*':
+                fallback |= (
+                    numpy.abs(left.values.astype(numpy.float64)) * numpy.abs(right.values.astype(numpy.float64))
+                ) >= MAX_SAFE_INTEGER
+            else:
+                fallback |= numpy.abs(left.values) >= MAX_SAFE_INTEGER
+                fallback |= numpy.abs(right.values) >= MAX_SAFE_INTEGER
+        operations: dict[str, Callable] = {'+': numpy.add, '-': numpy.subtract, '*': numpy.multiply}
+        return VectorColumn(values=operations[op](left.values, right.values), kind=kind)
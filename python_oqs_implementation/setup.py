@@ -22,5 +22,6 @@ setup(
         'Operating System :: OS Independent',
     ],
     python_requires='>=3.10',
+    extras_require={'numpy': ['numpy']},
     license_files=('../LICENSE.md',),
 )
@@ -0,0 +1,140 @@
+import unittest
+from unittest import mock
+from python_oqs_implementation.oqs import engine
+from python_oqs_implementation.oqs.constants.values import WORKER_COMPILED_EXPRESSION_CACHE_SIZE
+from python_oqs_implementation.oqs.engine import (
+    TEMPLATE_CACHE,
+    WORKER_COMPILED_EXPRESSIONS,
+    CompiledExpression,
+    ExpressionInput,
+    evaluate_batch,
+    evaluate_expression,
+    oqs_engine,
+    reset_worker_compiled_expressions
+)
+from python_oqs_implementation.oqs.nodes import FunctionNode
+from python_oqs_implementation.oqs.utils.cache import LRUCache
+
+
+def double(interpreter, node: FunctionNode) -> any:
+    return interpreter.evaluate(node.args[0]) * 2
+
+
+def build_inputs(count: int) -> list[ExpressionInput]:
+    expression_inputs: list[ExpressionInput] = []
+    for index in range(count):
+        if index % 7 == 0:
+            expression_inputs.append(ExpressionInput(expression="x / 0", variables={"x": index}))
+        elif index % 5 == 0:
+            expression_inputs.append(ExpressionInput(expression="missing + 1"))
+        elif index % 3 == 0:
+            expression_inputs.append(
+                ExpressionInput(expression="Total: <{x * 2}>", variables={"x": index}, string_embedded=True)
+            )
+        else:
+            expression_inputs.append(ExpressionInput(expression="x + 1", variables={"x": index}))
+    return expression_inputs
+
+
+class TestBatchEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.expression_inputs: list[ExpressionInput] = build_inputs(count=60)
+        self.expected: list[dict[str, any]] = [
+            evaluate_expression(expression=expression_input) for expression_input in self.expression_inputs
+        ]
+
+    def test_sequential_matches_individual_evaluation(self):
+        results: dict[str, any] = oqs_engine(evaluate_multiple=True, expression_inputs=self.expression_inputs)
+        self.assertEqual(results["results"], self.expected)
+
+    def test_thread_pool_preserves_order_and_errors(self):
+        for chunk_size in (None, 1, 7, 100):
+            with self.subTest(chunk_size=chunk_size):
+                results: dict[str, any] = oqs_engine(
+                    evaluate_multiple=True,
+                    expression_inputs=self.expression_inputs,
+                    workers=4,
+                    chunk_size=chunk_size
+                )
+                self.assertEqual(results["results"], self.expected)
+
+    def test_process_pool_preserves_order_and_errors(self):
+        results: dict[str, any] = oqs_engine(
+            evaluate_multiple=True, expression_inputs=self.expression_inputs, workers=2, executor="process"
+        )
+        self.assertEqual(results["results"], self.expected)
+
+    def test_additional_functions_apply_to_batch_items(self):
+        expression_inputs: list[ExpressionInput] = [
+            ExpressionInput(expression="DOUBLE(x)", variables={"x": value}) for value in range(10)
+        ]
+        for workers, executor in ((1, "thread"), (3, "thread"), (2, "process")):
+            with self.subTest(workers=workers, executor=executor):
+                results: dict[str, any] = oqs_engine(
+                    evaluate_multiple=True,
+                    expression_inputs=expression_inputs,
+                    additional_functions=[("DOUBLE", double)],
+                    workers=workers,
+                    executor=executor
+                )
+                self.assertEqual(
+                    [result["results"]["value"] for result in results["results"]], [value * 2 for value in range(10)]
+                )
+
+    def test_each_distinct_expression_is_compiled_once(self):
+        compiled_expressions: dict[str, CompiledExpression] = {}
+        results: list[dict[str, any]] = evaluate_batch(
+            expression_inputs=self.expression_inputs, compiled_expressions=compiled_expressions
+        )
+        self.assertEqual(results, self.expected)
+        self.assertEqual(set(compiled_expressions), {"x / 0", "missing + 1", "x + 1"})
+        self.assertIsNot(TEMPLATE_CACHE.get(("Total: <{x * 2}>", True)), LRUCache.MISSING)
+
+    def test_threads_share_compiled_expressions(self):
+        expression_inputs: list[ExpressionInput] = [
+            ExpressionInput(expression=f"x + {index % 3}", variables={"x": index}) for index in range(30)
+        ]
+        with (
+            mock.patch.object(engine, "compile_expression", wraps=engine.compile_expression) as compile_mock,
+            mock.patch.object(engine, "evaluate_batch", wraps=engine.evaluate_batch) as batch_mock
+        ):
+            results: dict[str, any] = oqs_engine(
+                evaluate_multiple=True, expression_inputs=expression_inputs, workers=3, chunk_size=1
+            )
+        caches: list[any] = [call.kwargs["compiled_expressions"] for call in batch_mock.call_args_list]
+        self.assertEqual(len(caches), 30)
+        self.assertIsInstance(caches[0], LRUCache)
+        self.assertTrue(all(cache is caches[0] for cache in caches))
+        self.assertEqual(caches[0].info().maxsize, WORKER_COMPILED_EXPRESSION_CACHE_SIZE)
+        self.assertEqual(
+            [result["results"]["value"] for result in results["results"]], [index + index % 3 for index in range(30)]
+        )
+        self.assertLessEqual(compile_mock.call_count, 3 * 3)
+        self.assertEqual(
+            {call.kwargs["expression"] for call in compile_mock.call_args_list}, {"x + 0", "x + 1", "x + 2"}
+        )
+
+    def test_worker_cache_is_bounded(self):
+        reset_worker_compiled_expressions()
+        WORKER_COMPILED_EXPRESSIONS.resize(maxsize=2)
+        try:
+            results: list[dict[str, any]] = evaluate_batch(
+                expression_inputs=[ExpressionInput(expression=f"x + {index}", variables={"x": 1}) for index in range(5)]
+            )
+            self.assertEqual([result["results"]["value"] for result in results], [1, 2, 3, 4, 5])
+            self.assertEqual(WORKER_COMPILED_EXPRESSIONS.info().currsize, 2)
+            self.assertIsNot(WORKER_COMPILED_EXPRESSIONS.get("x + 4"), LRUCache.MISSING)
+        finally:
+            WORKER_COMPILED_EXPRESSIONS.resize(maxsize=WORKER_COMPILED_EXPRESSION_CACHE_SIZE)
+            reset_worker_compiled_expressions()
+
+    def test_empty_batch(self):
+        self.assertEqual(oqs_engine(evaluate_multiple=True, workers=4), {"results": []})
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            oqs_engine(evaluate_multiple=True, expression_inputs=self.expression_inputs, executor="fiber")
+        with self.assertRaises(ValueError):
+            oqs_engine(evaluate_multiple=True, expression_inputs=self.expression_inputs, workers=0)
+        with self.assertRaises(ValueError):
+            oqs_engine(evaluate_multiple=True, expression_inputs=self.expression_inputs, workers=2, chunk_size=0)
@@ -0,0 +1,83 @@
+import copy
+import json
+import os
+import unittest
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression, oqs_engine)
+from python_oqs_implementation.oqs.errors import OQSSyntaxError
+from python_oqs_implementation.oqs.utils.conversion import OQSJSONEncoder
+
+
+TESTS_JSON_PATH: str = os.path.join(os.path.dirname(__file__), '..', '..', 'tests.json')
+
+
+def load_conformance_cases() -> list[dict[str, any]]:
+    with open(TESTS_JSON_PATH) as file:
+        test_classes_data: dict[str, dict[str, list[dict[str, any]]]] = json.load(file)
+    return [
+        case["input"]
+        for test_data in test_classes_data.values()
+        for cases in test_data.values()
+        for case in cases
+        if not case["input"]["string_embedded"]
+    ]
+
+
+def normalize(results: dict[str, any]) -> dict[str, any]:
+    return json.loads(json.dumps(results, cls=OQSJSONEncoder))
+
+
+class TestCompiledExpression(unittest.TestCase):
+    def test_compile_returns_compiled_expression(self):
+        self.assertIsInstance(compile_expression("1 + 2"), CompiledExpression)
+
+    def test_reuse_with_different_variables(self):
+        compiled: CompiledExpression = compile_expression("a * 2 + LEN(b)")
+        self.assertEqual({"results": {"value": 5, "type": "Integer"}}, compiled.evaluate({"a": 1, "b": "abc"}))
+        self.assertEqual({"results": {"value": 21, "type": "Integer"}}, compiled.evaluate({"a": 10, "b": "a"}))
+        self.assertEqual("Undefined Variable Error", compiled.evaluate({"a": 10})["error"]["type"])
+
+    def test_reuse_with_additional_functions(self):
+        compiled: CompiledExpression = compile_expression("DOUBLE(x)")
+
+        def double(interpreter, node) -> any:
+            return interpreter.evaluate(node.args[0]) * 2
+
+        self.assertEqual(8, compiled.results(variables={"x": 4}, additional_functions=[("double", double)]))
+        self.assertEqual(3.0, compiled.results(variables={"x": 1.5}, additional_functions=[("double", double)]))
+
+    def test_arguments_are_not_parsed_again(self):
+        compiled: CompiledExpression = compile_expression('MAP(items, "x", x * 2) + [***items]')
+        self.assertEqual([2, 4, 1, 2], compiled.results(variables={"items": [1, 2]}))
+        self.assertEqual([6, 3], compiled.results(variables={"items": [3]}))
+        self.assertEqual({}, compiled.parsed_expressions)
+
+    def test_argument_syntax_errors_are_deferred(self):
+        compiled: CompiledExpression = compile_expression('IF(flag, 1, 1 +)')
+        self.assertEqual(1, compiled.results(variables={"flag": True}))
+        self.assertEqual("Missing Expected Character Error", compiled.evaluate({"flag": False})["error"]["type"])
+
+    def test_syntax_errors_raise_on_compile(self):
+        with self.assertRaises(OQSSyntaxError):
+            compile_expression("1 +")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            compile_expression("1 + 2", backend="unknown")
+
+    def test_conformance_with_engine(self):
+        for backend in CompiledExpression.BACKENDS:
+            for case in load_conformance_cases():
+                with self.subTest(backend=backend, expression=case["expression"]):
+                    expected: dict[str, any] = oqs_engine(
+                        expression=case["expression"], variables=copy.deepcopy(case["variables"])
+                    )
+                    try:
+                        compiled: CompiledExpression = compile_expression(case["expression"], backend=backend)
+                    except OQSSyntaxError:
+                        self.assertIn("error", expected)
+                        continue
+                    for _ in range(2):
+                        self.assertEqual(
+                            normalize(expected),
+                            normalize(compiled.evaluate(variables=copy.deepcopy(case["variables"])))
+                        )
@@ -0,0 +1,115 @@
+import unittest
+from python_oqs_implementation.oqs.compiler import (CompiledNode, OQSClosureCompiler, OQSClosureInterpreter)
+from python_oqs_implementation.oqs.constants.types import BackendTypeStrings as BTS
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import (ASTNode, FunctionNode)
+from python_oqs_implementation.oqs.parser import OQSParser
+
+
+class TestClosureCompiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.compiler: OQSClosureCompiler = OQSClosureCompiler()
+
+    def compile(self, expression: str) -> CompiledNode:
+        return self.compiler.compile(OQSParser(eager=True).parse(expression))
+
+    def results(self, expression: str, variables: dict[str, any] | None = None) -> any:
+        return OQSClosureInterpreter(expression=expression, variables=variables, ast=self.compile(expression)).results()
+
+    def test_compiled_nodes_are_not_recompiled(self):
+        compiled: CompiledNode = self.compile("1 + 2")
+        self.assertIs(compiled, self.compiler.compile(compiled))
+
+    def test_function_nodes_are_built_once(self):
+        compiled: CompiledNode = self.compile("ECHO(1) + ECHO(2)")
+        seen: list[FunctionNode] = []
+
+        def echo(interpreter: OQSInterpreter, node: FunctionNode) -> any:
+            seen.append(node)
+            return interpreter.evaluate(node.args[0])
+
+        interpreter: OQSClosureInterpreter = OQSClosureInterpreter(expression="", ast=compiled)
+        interpreter.add_additional_function(function_name="echo", function=echo)
+        self.assertEqual(3, interpreter.results())
+        self.assertEqual(3, interpreter.results())
+        self.assertIs(seen[0], seen[2])
+        self.assertIs(seen[1], seen[3])
+
+    def test_values(self):
+        self.assertEqual(
+            [1, "a", True, None, {"k": 2}, 3, 4, 5],
+            self.results('[1, "a", true, null, {"k": x}, ***y, ***LIST(5)]', {"x": 2, "y": [3, 4]})
+        )
+        self.assertEqual({"a": 1, "b": 2}, self.results('{"a": 1, ***kvs}', {"kvs": {"b": 2}}))
+
+    def test_packed_function_arguments(self):
+        self.assertEqual(6, self.results("ADD(***items)", {"items": [1, 2, 3]}))
+
+    def test_lazy_arguments_are_not_evaluated(self):
+        self.assertEqual(1, self.results("IF(true, 1, RAISE(\"Value Error\", \"unreachable\"))"))
+        self.assertEqual(1, self.results("IF(true, 1, 1 +)"))
+
+    def test_unparsed_arguments_are_compiled_once(self):
+        compiled: CompiledExpression = compile_expression("IF(flag, 1, 1 +)", backend=BTS.CLOSURE)
+        compiled.evaluate({"flag": False})
+        self.assertEqual({}, compiled.parsed_expressions)
+        compiled: CompiledExpression = compile_expression("MAP(items, \"x\", x * 2)", backend=BTS.CLOSURE)
+        self.assertEqual([2, 4], compiled.results({"items": [1, 2]}))
+        self.assertIsInstance(compiled.ast, CompiledNode)
+
+    def test_errors(self):
+        for expression, error_type in [
+            ("undefined", "Undefined Variable Error"),
+            ("UNDEFINED(1)", "Undefined Function Error"),
+            ("ADD(***1)", "Type Error"),
+            ("[***1]", "Type Error"),
+            ("{***1}", "Type Error"),
+            ("REMOVE([1], 5)", "Function Evaluation Error"),
+        ]:
+            with self.subTest(expression=expression):
+                compiled: CompiledExpression = compile_expression(expression, backend=BTS.CLOSURE)
+                self.assertEqual(error_type, compiled.evaluate()["error"]["type"])
+
+    def test_uncompiled_nodes_fall_back_to_the_interpreter(self):
+        interpreter: OQSClosureInterpreter = OQSClosureInterpreter(expression="1")
+        node: ASTNode = OQSParser(eager=True).parse("2 * 3")
+        self.assertEqual(6, interpreter.evaluate(node))
+
+    def test_operators_match_the_interpreter(self):
+        variables: dict[str, any] = {"i": 7, "f": 2.5, "b": True, "s": "ab", "l": [1], "k": {"a": 1}, "z": 0}
+        for expression in [
+            'i + f', 'i - b', 'b + b', 's + s', 'l + l', 'k + k', 'i * s', 'l * 2', 'i / 2', 'i / 7', 'f / i',
+            'i / z', 'i / b', 'i % 4', 'f % 2', 'i % z', 'b % 2', 'i ** 2', 'f ** z', 'i < f', 's < s', 'b < i',
+            'i < s', 'i == 7.0', 'b == 1', 'l == [1]', 'i != s', 'i === 7.0', 'z & undefined', 'i | undefined',
+            'IF(z, 1, i > 5, 2, 3)', 'IF(z, 1)', 'AND(i, f, z)', 'OR(z, "", s)', 'IF(1 / 0, 1, 2)', 'l - l',
+        ]:
+            expected: dict[str, any] = compile_expression(expression, optimize=False).evaluate(variables=variables)
+            with self.subTest(expression=expression):
+                self.assertEqual(
+                    expected,
+                    compile_expression(expression, backend=BTS.CLOSURE, optimize=False).evaluate(variables=variables)
+                )
+
+    def test_functions_are_checked_for_each_registry(self):
+        compiled: CompiledExpression = compile_expression("ECHO(1)", backend=BTS.CLOSURE)
+        echo: tuple[str, any] = ("echo", lambda interpreter, node: interpreter.evaluate(node.args[0]))
+        self.assertEqual(1, compiled.results(additional_functions=[echo]))
+        self.assertEqual("Undefined Function Error", compiled.evaluate()["error"]["type"])
+        self.assertEqual(1, compiled.results(additional_functions=[echo]))
+
+    def test_unpacking_outside_arguments_is_a_syntax_error(self):
+        variables: dict[str, any] = {"xs": [1, 2, 3], "kvs": {"a": 1}}
+        for expression in ['***xs', '(***xs)', '***xs + 1', '1 == ***xs', 'ADD(***xs)', '[***xs, 4]', '{***kvs}']:
+            for backend in CompiledExpression.BACKENDS:
+                with self.subTest(expression=expression, backend=backend):
+                    expected: dict[str, any] = compile_expression(expression, optimize=False).evaluate(
+                        variables=variables
+                    )
+                    result: dict[str, any] = compile_expression(expression, backend=backend).evaluate(
+                        variables=variables
+                    )
+                    self.assertEqual(expected.get("results"), result.get("results"))
+                    self.assertEqual(expected.get("error", {}).get("type"), result.get("error", {}).get("type"))
+        result: dict[str, any] = compile_expression('***xs', backend=BTS.NATIVE).evaluate(variables=variables)
+        self.assertEqual("Syntax Error", result["error"]["type"])
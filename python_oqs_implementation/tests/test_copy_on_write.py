@@ -0,0 +1,81 @@
+import copy
+import unittest
+from python_oqs_implementation.oqs.compiler import OQSClosureInterpreter
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.parser import OQSParser
+
+
+class TestCopyOnWrite(unittest.TestCase):
+    def setUp(self):
+        self.variables: dict[str, any] = {
+            "items": [1, 2, 3],
+            "kvs": {"a": 1, "b": 2},
+            "nested": {"inner": {"k": 0}, "list": [[1], [2]]},
+            "rows": [[1], [2, 3]]
+        }
+
+    def assert_results(self, expression: str, expected: any) -> None:
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(expression=expression, backend=backend):
+                original: dict[str, any] = copy.deepcopy(self.variables)
+                compiled: CompiledExpression = compile_expression(expression=expression, backend=backend)
+                self.assertEqual(compiled.results(variables=self.variables), expected)
+                self.assertEqual(self.variables, original)
+
+    def test_add_does_not_modify_inputs(self):
+        self.assert_results('ADD(items, [4])', [1, 2, 3, 4])
+        self.assert_results('items + [4] + [5]', [1, 2, 3, 4, 5])
+        self.assert_results('ADD(kvs, {"c": 3})', {"a": 1, "b": 2, "c": 3})
+        self.assert_results('kvs + {"a": 0} + {"d": 4}', {"a": 0, "b": 2, "d": 4})
+        self.assert_results('[ADD(items, items), items]', [[1, 2, 3, 1, 2, 3], [1, 2, 3]])
+
+    def test_append_does_not_modify_inputs(self):
+        self.assert_results('APPEND(items, 4)', [1, 2, 3, 4])
+        self.assert_results('APPEND(APPEND(APPEND(items, 4), 5), 6)', [1, 2, 3, 4, 5, 6])
+        self.assert_results('[APPEND(items, 4), items]', [[1, 2, 3, 4], [1, 2, 3]])
+        self.assert_results('MAP(rows, "row", APPEND(row, 0))', [[1, 0], [2, 3, 0]])
+        self.assert_results('APPEND(ACCESS(nested, "list"), [3])', [[1], [2], [3]])
+        self.assert_results('APPEND(IF(true, items, []), 4)', [1, 2, 3, 4])
+
+    def test_update_does_not_modify_inputs(self):
+        self.assert_results('UPDATE(items, 0, 9)', [9, 2, 3])
+        self.assert_results('UPDATE(kvs, "c", 3)', {"a": 1, "b": 2, "c": 3})
+        self.assert_results('UPDATE(ACCESS(nested, "inner"), "k", 1)', {"k": 1})
+        self.assert_results('UPDATE(UPDATE(kvs, "a", 5), "b", 6)', {"a": 5, "b": 6})
+
+    def test_remove_does_not_modify_inputs(self):
+        self.assert_results('REMOVE(items, 0)', [2, 3])
+        self.assert_results('REMOVE(kvs, "a")', {"b": 2})
+        self.assert_results('REMOVE(kvs, "missing")', {"a": 1, "b": 2})
+        self.assert_results('REMOVE_ITEM(kvs, "b")', {"a": 1})
+        self.assert_results('REMOVE_ITEM(items, 2)', [1, 3])
+
+    def test_missing_keys_do_not_alias_inputs(self):
+        self.assert_results('UPDATE(REMOVE(kvs, "zz"), "a", 99)', {"a": 99, "b": 2})
+        self.assert_results('REMOVE(REMOVE_ITEM(kvs, "zz"), "a")', {"b": 2})
+        self.assert_results('ADD(REMOVE(kvs, "zz"), {"q": 1})', {"a": 1, "b": 2, "q": 1})
+
+    def test_repeated_evaluation_is_stable(self):
+        compiled: CompiledExpression = compile_expression(expression='APPEND(items, LEN(items))')
+        for _ in range(3):
+            self.assertEqual(compiled.results(variables=self.variables), [1, 2, 3, 3])
+
+    def test_is_fresh(self):
+        parser: OQSParser = OQSParser(eager=True)
+        for interpreter_class in (OQSInterpreter, OQSClosureInterpreter):
+            interpreter: OQSInterpreter = interpreter_class(expression="1")
+            for expression, fresh in (
+                    ("[1]", True),
+                    ('{"a": 1}', True),
+                    ("APPEND(x, 1)", True),
+                    ("x + [1]", True),
+                    ('MAP(x, "y", y)', True),
+                    ("x", False),
+                    ("ACCESS(x, 0)", False),
+                    ("IF(true, x, [])", False),
+                    ("CUSTOM(x)", False)
+            ):
+                with self.subTest(interpreter=interpreter_class.__name__, expression=expression):
+                    node: any = interpreter.prepare_ast(ast=parser.parse(expression=expression))
+                    self.assertEqual(interpreter.is_fresh(node), fresh)
@@ -0,0 +1,94 @@
+import unittest
+from python_oqs_implementation.oqs.built_in_functions import lazy_filter
+from python_oqs_implementation.oqs.engine import evaluate_expression
+from python_oqs_implementation.oqs.governor import (OQSGovernor, ResourceLimits)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import FunctionNode
+from python_oqs_implementation.oqs.sequences import LazyList
+
+
+def build_orders(count: int) -> list[dict[str, any]]:
+    return [{"id": index, "status": "open" if index % 50 == 0 else "closed"} for index in range(count)]
+
+
+def build_order_kvs(count: int) -> dict[str, dict[str, any]]:
+    return {f"order_{order['id']}": order for order in build_orders(count=count)}
+
+
+class TestFilter(unittest.TestCase):
+    def test_removes_rejected_elements(self):
+        result: dict[str, any] = evaluate_expression(
+            'FILTER(items, "x", TYPE(x) == "Decimal")', variables={"items": [1.0, 1, 1.0]}
+        )
+        self.assertEqual(result, {"results": {"value": [1.0, 1.0], "type": "List"}})
+        self.assertEqual([type(item) for item in result["results"]["value"]], [float, float])
+
+    def test_keeps_order(self):
+        result: dict[str, any] = evaluate_expression(
+            'FILTER(items, "x", x % 2 == 1)', variables={"items": [5, 2, 3, 3, 8, 1]}
+        )
+        self.assertEqual(result["results"]["value"], [5, 3, 3, 1])
+        result: dict[str, any] = evaluate_expression(
+            'FILTER(items, "x", x > 1)', variables={"items": {"c": 3, "a": 1, "b": 2}}
+        )
+        self.assertEqual(list(result["results"]["value"].items()), [("c", 3), ("b", 2)])
+
+    def test_does_not_modify_input(self):
+        items: list[int] = [1, 2, 3]
+        kvs: dict[str, int] = {"a": 1, "b": 2}
+        evaluate_expression('FILTER(items, "x", x > 1)', variables={"items": items})
+        evaluate_expression('FILTER(kvs, "x", x > 1)', variables={"kvs": kvs})
+        self.assertEqual(items, [1, 2, 3])
+        self.assertEqual(kvs, {"a": 1, "b": 2})
+
+
+class TestFilterWork(unittest.TestCase):
+    EXPRESSION: str = 'FILTER(orders, "order", ACCESS(order, "status") == "open")'
+
+    def setUp(self):
+        self.checked: list[dict[str, any]] = []
+
+    def check(self, interpreter: OQSInterpreter, node: FunctionNode) -> bool:
+        order: dict[str, any] = interpreter.evaluate(node.args[0])
+        self.checked.append(order)
+        return order["status"] == "open"
+
+    def interpreter(self, expression: str, orders: any, governor: OQSGovernor | None = None) -> OQSInterpreter:
+        return OQSInterpreter(
+            expression=expression,
+            variables={"orders": orders},
+            governor=governor,
+            registry=OQSInterpreter.REGISTRY.extend([("CHECK", self.check)])
+        )
+
+    def usage(self, orders: any) -> dict[str, int]:
+        governor: OQSGovernor = OQSGovernor(limits=ResourceLimits())
+        self.interpreter(expression=self.EXPRESSION, orders=orders, governor=governor).results()
+        return governor.usage()
+
+    def test_predicate_runs_once_per_element(self):
+        orders: list[dict[str, any]] = build_orders(count=10_000)
+        for collection in (orders, {f"order_{order['id']}": order for order in orders}):
+            self.checked.clear()
+            result: any = self.interpreter(
+                expression='FILTER(orders, "order", CHECK(order))', orders=collection
+            ).results()
+            kept: list[dict[str, any]] = list(result.values()) if isinstance(result, dict) else result
+            self.assertEqual(len(self.checked), 10_000)
+            self.assertEqual(len(kept), 200)
+            self.assertTrue(all(order is expected for order, expected in zip(kept, orders[::50])))
+
+    def test_work_grows_linearly(self):
+        for build in (build_orders, build_order_kvs):
+            empty, small, large = (self.usage(orders=build(count=count)) for count in (0, 10_000, 100_000))
+            self.assertEqual(large["steps"] - empty["steps"], (small["steps"] - empty["steps"]) * 10)
+            self.assertLessEqual(large["elements"], 100_000 // 50)
+
+    def test_lists_are_filtered_lazily(self):
+        interpreter: OQSInterpreter = self.interpreter(
+            expression='FILTER(orders, "order", CHECK(order))', orders=build_orders(count=1_000)
+        )
+        filtered: LazyList = lazy_filter(interpreter=interpreter, node=interpreter.original_ast)
+        self.assertEqual(self.checked, [])
+        self.assertEqual(next(iter(filtered))["id"], 0)
+        self.assertEqual(len(self.checked), 1)
@@ -0,0 +1,113 @@
+import unittest
+from python_oqs_implementation.oqs.engine import (
+    CompiledExpression, compile_expression, evaluate_expression, evaluate_many, oqs_engine
+)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import (BinaryOpNode, FunctionNode)
+from python_oqs_implementation.oqs.parser import OQSParser
+
+
+class TestFunctionResolution(unittest.TestCase):
+    def test_function_names_are_folded_when_parsed(self):
+        node: FunctionNode = OQSParser(eager=True).parse('Add(1, 2)')
+        self.assertEqual(node.name, "Add")
+        self.assertEqual(node.key, "ADD")
+        self.assertFalse(node.packed)
+        self.assertTrue(OQSParser(eager=True).parse('ADD(***[1, 2])').packed)
+
+    def test_function_names_are_case_insensitive(self):
+        def double(interpreter: OQSInterpreter, node: FunctionNode) -> int:
+            return interpreter.evaluate(node.args[0]) * 2
+
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(backend=backend):
+                compiled: CompiledExpression = compile_expression('add(1, Double(2))', backend=backend)
+                self.assertEqual(compiled.results(additional_functions=[("DOUBLE", double)]), 5)
+
+    def test_undefined_functions_are_reported_up_front(self):
+        for backend in CompiledExpression.BACKENDS:
+            for expression, function_name in [
+                ('IF(flag, 1, Unknown(2))', "Unknown"),
+                ('TRY(UNKNOWN(1), "Undefined Function Error", 0)', "UNKNOWN"),
+                ('IF(true, 1, missing())', "missing"),
+            ]:
+                with self.subTest(backend=backend, expression=expression):
+                    compiled: CompiledExpression = compile_expression(expression, backend=backend)
+                    self.assertEqual(
+                        compiled.evaluate(variables={"flag": True})["error"],
+                        {
+                            "type": "Undefined Function Error",
+                            "message": f"The function '{function_name}' is not a valid function."
+                        }
+                    )
+
+    def test_undefined_functions_can_be_deferred(self):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(backend=backend):
+                compiled: CompiledExpression = compile_expression(
+                    'TRY(UNKNOWN(1), "Undefined Function Error", 0) + IF(true, 1, UNKNOWN(2))',
+                    backend=backend,
+                    defer_undefined_functions=True
+                )
+                self.assertEqual(compiled.results(), 1)
+
+    def test_engine_defers_undefined_functions_by_default(self):
+        for expression, expected in [
+            ('IF(true, 1, UNKNOWN())', {"results": {"value": 1, "type": "Integer"}}),
+            ('TRY(UNKNOWN(1), "Undefined Function Error", 0)', {"results": {"value": 0, "type": "Integer"}}),
+            ('<{IF(true, 1, UNKNOWN())}>', {"results": {"value": "1", "type": "String"}}),
+        ]:
+            with self.subTest(expression=expression):
+                string_embedded: bool = expression.startswith("<{")
+                self.assertEqual(oqs_engine(expression=expression, string_embedded=string_embedded), expected)
+                self.assertEqual(
+                    evaluate_expression(expression=expression, string_embedded=string_embedded), expected
+                )
+                self.assertIn(
+                    "error",
+                    oqs_engine(expression=expression, string_embedded=string_embedded, defer_undefined_functions=False)
+                )
+        self.assertEqual(
+            list(evaluate_many(expression='IF(flag, 1, UNKNOWN())', rows=[{"flag": True}, {"flag": False}])),
+            [
+                {"results": {"value": 1, "type": "Integer"}},
+                {
+                    "error": {
+                        "type": "Undefined Function Error",
+                        "message": "The function 'UNKNOWN' is not a valid function."
+                    }
+                }
+            ]
+        )
+        self.assertEqual(oqs_engine(expression='UNKNOWN()')["error"]["type"], "Undefined Function Error")
+
+    def test_additional_functions_are_resolved_before_evaluation(self):
+        compiled: CompiledExpression = compile_expression('IF(true, 1, custom(2))')
+        self.assertEqual(compiled.evaluate()["error"]["type"], "Undefined Function Error")
+        self.assertEqual(compiled.results(additional_functions=[("custom", lambda interpreter, node: 2)]), 1)
+
+    def test_function_nodes_are_not_rebuilt_per_call(self):
+        received: list[FunctionNode] = []
+
+        def record(interpreter: OQSInterpreter, node: FunctionNode) -> int:
+            received.append(node)
+            return 1
+
+        compiled: CompiledExpression = compile_expression('RECORD()', optimize=False)
+        compiled.results(additional_functions=[("record", record)])
+        compiled.results(additional_functions=[("record", record)])
+        self.assertIs(received[0], compiled.ast)
+        self.assertIs(received[1], compiled.ast)
+
+    def test_operator_function_nodes_are_built_once(self):
+        compiled: CompiledExpression = compile_expression('a + b', optimize=False)
+        self.assertEqual(compiled.results(variables={"a": 1, "b": 2}), 3)
+        self.assertIsInstance(compiled.ast, BinaryOpNode)
+        function_node: FunctionNode = compiled.ast.function_node
+        self.assertEqual(function_node.key, "ADD")
+        self.assertEqual(compiled.results(variables={"a": 3, "b": 4}), 7)
+        self.assertIs(compiled.ast.function_node, function_node)
+
+
+if __name__ == '__main__':
+    unittest.main()
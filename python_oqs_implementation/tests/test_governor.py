@@ -0,0 +1,150 @@
+import time
+import tracemalloc
+import unittest
+from python_oqs_implementation.oqs.engine import (
+    CompiledExpression,
+    ExpressionInput,
+    compile_expression,
+    evaluate_many,
+    oqs_engine
+)
+from python_oqs_implementation.oqs.errors import OQSResourceLimitError
+from python_oqs_implementation.oqs.governor import (OQSGovernor, ResourceLimits)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+
+
+class TestGovernor(unittest.TestCase):
+    def evaluate_all_backends(
+            self, expression: str, limits: ResourceLimits, variables: dict[str, any] = None
+    ) -> dict[str, dict[str, any]]:
+        return {
+            backend: compile_expression(expression=expression, backend=backend, optimize=False).evaluate(
+                variables=variables, limits=limits
+            )
+            for backend in CompiledExpression.BACKENDS
+        }
+
+    def assert_limited(self, expression: str, limits: ResourceLimits, variables: dict[str, any] = None):
+        for backend, result in self.evaluate_all_backends(
+                expression=expression, limits=limits, variables=variables
+        ).items():
+            with self.subTest(expression=expression, backend=backend):
+                self.assertEqual(result["error"]["type"], "Resource Limit Error")
+
+    def assert_within_limits(
+            self, expression: str, limits: ResourceLimits, expected: any, variables: dict[str, any] = None
+    ):
+        for backend, result in self.evaluate_all_backends(
+                expression=expression, limits=limits, variables=variables
+        ).items():
+            with self.subTest(expression=expression, backend=backend):
+                self.assertEqual(result["results"]["value"], expected)
+
+    def test_step_budget(self):
+        self.assert_within_limits('1 + 2', ResourceLimits(max_steps=3), 3)
+        self.assert_limited('1 + 2', ResourceLimits(max_steps=2))
+        self.assert_limited('MAP(RANGE(1000), "x", MAP(RANGE(1000), "y", x * y))', ResourceLimits(max_steps=10_000))
+        self.assert_within_limits(
+            'MAP(xs, "x", x * 2)', ResourceLimits(max_steps=100), [2, 4], variables={"xs": [1, 2]}
+        )
+
+    def test_step_budget_covers_nested_expressions(self):
+        self.assert_limited('ADD(***[***[1, 2, 3], 4])', ResourceLimits(max_steps=5))
+        self.assert_within_limits('ADD(***[***[1, 2, 3], 4])', ResourceLimits(max_steps=100), 10)
+
+    def test_element_budget(self):
+        self.assert_within_limits('LEN(RANGE(100))', ResourceLimits(max_elements=100), 100)
+        self.assert_limited('SUM(RANGE(0, 1000000000))', ResourceLimits(max_elements=10_000))
+        self.assert_limited('[1, 2, 3] * 1000', ResourceLimits(max_elements=1_000))
+        self.assert_limited('RANGE(100000)', ResourceLimits(max_elements=1_000))
+        self.assert_limited(
+            'MAP(xs, "x", [x, x])', ResourceLimits(max_elements=100), variables={"xs": list(range(100))}
+        )
+
+    def test_sequences_are_limited_before_materializing(self):
+        for expression, limits in [
+            ('RANGE(0, 1000000000)', ResourceLimits(max_elements=1_000)),
+            ('RANGE(0, 5000000)', ResourceLimits(max_elements=1_000, timeout=0.05)),
+            ('RANGE(0, 1000000000)', ResourceLimits(timeout=0.05)),
+            ('MAP(RANGE(0, 1000000000), "x", x)', ResourceLimits(max_elements=1_000)),
+            ('FILTER(RANGE(0, 1000000000), "x", true)', ResourceLimits(max_elements=1_000)),
+            ('[1, 2] * 1000000', ResourceLimits(max_elements=1_000)),
+        ]:
+            tracemalloc.start()
+            try:
+                self.assert_limited(expression, limits)
+                peak: int = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            with self.subTest(expression=expression):
+                self.assertLess(peak, 10_000_000)
+
+    def test_deadline(self):
+        start: float = time.monotonic()
+        self.assert_limited('SUM(RANGE(0, 1000000000))', ResourceLimits(timeout=0.05))
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_try_cannot_catch_limits(self):
+        self.assert_limited('TRY(SUM(RANGE(100000)), "OQS Base Error", 0)', ResourceLimits(max_elements=10))
+        self.assert_limited('TRY(SUM(RANGE(100000)), "Resource Limit Error", 0)', ResourceLimits(max_elements=10))
+        self.assert_within_limits(
+            'TRY(RAISE("Value Error", "bad"), "Value Error", 0)', ResourceLimits(max_steps=100), 0
+        )
+
+    def test_unlimited_evaluation_is_unchanged(self):
+        compiled: CompiledExpression = compile_expression(expression='SUM(RANGE(100000))', backend="closure")
+        self.assertEqual(compiled.results(limits=ResourceLimits()), 4_999_950_000)
+        self.assertEqual(compiled.results(), 4_999_950_000)
+        self.assertEqual(compiled.results(limits=ResourceLimits(max_steps=10)), 4_999_950_000)
+
+    def test_each_evaluation_has_its_own_budget(self):
+        compiled: CompiledExpression = compile_expression(expression='SUM(MAP(xs, "x", x))')
+        limits: ResourceLimits = ResourceLimits(max_steps=50)
+        for _ in range(3):
+            self.assertEqual(compiled.results(variables={"xs": list(range(10))}, limits=limits), 45)
+
+    def test_engine_entry_points(self):
+        limits: ResourceLimits = ResourceLimits(max_elements=100)
+        self.assertEqual(
+            oqs_engine(expression="LEN(RANGE(1000))", limits=limits)["error"]["type"], "Resource Limit Error"
+        )
+        self.assertEqual(
+            oqs_engine(expression="<{LEN(RANGE(10))}> items", string_embedded=True, limits=limits),
+            {"results": {"value": "10 items", "type": "String"}}
+        )
+        results: list[dict[str, any]] = oqs_engine(
+            evaluate_multiple=True,
+            expression_inputs=[ExpressionInput("SUM(RANGE(10))"), ExpressionInput("SUM(RANGE(1000))")],
+            limits=limits,
+            workers=2
+        )["results"]
+        self.assertEqual(results[0]["results"]["value"], 45)
+        self.assertEqual(results[1]["error"]["type"], "Resource Limit Error")
+        rows: list[dict[str, any]] = list(
+            evaluate_many(expression="LEN(RANGE(n))", rows=[{"n": 10}, {"n": 1000}], limits=limits)
+        )
+        self.assertEqual(rows[0]["results"]["value"], 10)
+        self.assertEqual(rows[1]["error"]["type"], "Resource Limit Error")
+
+    def test_governor(self):
+        governor: OQSGovernor = OQSGovernor(limits=ResourceLimits(max_steps=2, max_elements=5))
+        governor.start()
+        governor.step()
+        governor.allocate(5)
+        self.assertEqual(governor.usage(), {"steps": 1, "elements": 5})
+        with self.assertRaises(OQSResourceLimitError):
+            governor.allocate(1)
+        governor.start()
+        self.assertEqual(list(governor.meter([1, 2, 3])), [1, 2, 3])
+        self.assertEqual(governor.usage(), {"steps": 0, "elements": 3})
+        self.assertEqual(list(governor.reserving([1, 2])), [1, 2])
+        self.assertEqual(governor.usage(), {"steps": 0, "elements": 3})
+        with self.assertRaises(OQSResourceLimitError):
+            list(governor.reserving(range(3)))
+
+    def test_interpreter_governor(self):
+        interpreter: OQSInterpreter = OQSInterpreter(
+            expression="SUM(RANGE(100))", governor=OQSGovernor(limits=ResourceLimits(max_elements=50))
+        )
+        with self.assertRaises(OQSResourceLimitError):
+            interpreter.results()
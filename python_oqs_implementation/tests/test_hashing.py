@@ -0,0 +1,86 @@
+import datetime
+import time
+import unittest
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.utils.hashing import (ValueSet, hashable_key, unique)
+
+
+class TestHashing(unittest.TestCase):
+    def assert_all_backends(self, expression: str, expected: any, variables: dict[str, any] = None):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(expression=expression, backend=backend):
+                compiled: CompiledExpression = compile_expression(expression=expression, backend=backend)
+                self.assertEqual(compiled.results(variables=variables), expected)
+
+    def test_hashable_key(self):
+        self.assertEqual(hashable_key([1, {"a": [2]}]), hashable_key([1.0, {"a": [2.0]}]))
+        self.assertEqual(hashable_key({"a": 1, "b": 2}), hashable_key({"b": 2, "a": 1}))
+        self.assertNotEqual(hashable_key([1, 2]), hashable_key([2, 1]))
+        self.assertNotEqual(hashable_key([]), hashable_key({}))
+        self.assertEqual(hashable_key(datetime.date(2024, 1, 1)), datetime.date(2024, 1, 1))
+        with self.assertRaises(TypeError):
+            hashable_key({1, 2})
+
+    def test_value_set(self):
+        values: ValueSet = ValueSet([1, "a", [1, 2], {"k": [3]}, datetime.timedelta(days=1), {9}])
+        self.assertIn(1.0, values)
+        self.assertIn([1, 2], values)
+        self.assertIn({"k": [3]}, values)
+        self.assertIn(datetime.timedelta(hours=24), values)
+        self.assertIn({9}, values)
+        self.assertNotIn([2, 1], values)
+        self.assertNotIn({"k": 3}, values)
+        self.assertEqual(len(values), 6)
+        self.assertFalse(values.add([1, 2]))
+        self.assertTrue(values.add([2, 1]))
+
+    def test_unique_preserves_order(self):
+        self.assertEqual(unique([3, 1, 3, 2, 1]), [3, 1, 2])
+        self.assertEqual(unique([{"a": 1}, [1], {"a": 1}, [1], 1]), [{"a": 1}, [1], 1])
+        self.assert_all_backends('UNIQUE([3, 1, 3, 2, 1])', [3, 1, 2])
+        self.assert_all_backends('UNIQUE([{"a": 1}, {"a": 1}, {"a": 2}])', [{"a": 1}, {"a": 2}])
+        self.assert_all_backends('UNIQUE([[1, 2], [1, 2], [2, 1]])', [[1, 2], [2, 1]])
+
+    def test_subtract(self):
+        self.assert_all_backends('[1, 2, 3, 2] - [2]', [1, 3])
+        self.assert_all_backends('[{"id": 1}, {"id": 2}] - [{"id": 2}]', [{"id": 1}])
+        self.assert_all_backends('[[1], [2], 3] - [[2], 3.0]', [[1]])
+
+    def test_in(self):
+        variables: dict[str, any] = {"ids": list(range(20)), "rows": [{"id": n} for n in range(20)]}
+        self.assert_all_backends('IN({"id": 3}, rows)', True, variables=variables)
+        self.assert_all_backends('IN({"id": 30}, rows)', False, variables=variables)
+        self.assert_all_backends('IN([1], [[1], [2]])', True)
+        self.assert_all_backends('IN([1], {"a": 1})', False)
+        self.assert_all_backends(
+            'FILTER(RANGE(25), "n", IN(n, ids) & IN({"id": n}, rows))', list(range(20)), variables=variables
+        )
+        self.assert_all_backends('MAP([1, 99], "n", IN(n, ids))', [True, False], variables=variables)
+
+    def test_lookup_sets_are_built_once_per_list(self):
+        ids: list[int] = list(range(20))
+        interpreter: OQSInterpreter = OQSInterpreter(expression='IN(3, ids)', variables={"ids": ids})
+        self.assertTrue(interpreter.results())
+        [(collection, size, values)] = interpreter.value_sets.values()
+        self.assertIs(collection, ids)
+        self.assertEqual(size, 20)
+        self.assertIsInstance(values, ValueSet)
+        interpreter: OQSInterpreter = OQSInterpreter(
+            expression='LEN(FILTER(RANGE(1000), "n", IN(n, ids + [999])))', variables={"ids": ids}
+        )
+        self.assertEqual(interpreter.results(), 21)
+        self.assertEqual(len(interpreter.value_sets), 1)
+        self.assertEqual(OQSInterpreter(expression='IN(1, [true, 2, 3, 4, 5, 6, 7, 8])').results(), True)
+
+    def test_reconciliation_scales_linearly(self):
+        variables: dict[str, any] = {
+            "left": [f"id-{n}" for n in range(100_000)],
+            "right": [f"id-{n}" for n in range(50_000, 150_000)]
+        }
+        start: float = time.perf_counter()
+        self.assert_all_backends('LEN(left - right)', 50_000, variables=variables)
+        self.assert_all_backends(
+            'LEN(FILTER(left, "id", IN(id, right)))', 50_000, variables=variables
+        )
+        self.assertLess(time.perf_counter() - start, 10)
@@ -0,0 +1,163 @@
+import unittest
+from python_oqs_implementation.oqs.analysis import loop_invariants
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression, evaluate_expression)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import (ASTNode, FunctionNode)
+from python_oqs_implementation.oqs.parser import OQSParser
+from python_oqs_implementation.oqs.profiler import OQSProfiler
+
+
+VARIABLES: dict[str, any] = {
+    "items": [1, 2, 3, 4],
+    "config_list": [10, 20],
+    "cutoff": "2024-01-01T00:00:00",
+    "base": [0],
+    "x": 100
+}
+
+
+def is_pure(node: FunctionNode) -> bool:
+    return OQSInterpreter.FUNCTIONS.get(node.key) in OQSInterpreter.PURE_FUNCTIONS
+
+
+class TestLoopInvariants(unittest.TestCase):
+    def test_invariant_sub_trees_are_found(self):
+        for expression, select in [
+            ('x > LEN(config_list)', lambda body: {body.right}),
+            ('x * 2', lambda body: set()),
+            ('LEN(config_list) + 1', lambda body: {body.left}),
+            ('LEN(config_list)', lambda body: set()),
+            ('IF(x, APPEND(base, 1), [APPEND(base, 2)])', lambda body: set()),
+            ('IF(x, LEN(APPEND(base, 1)), 0)', lambda body: {body.args[1].args[0]}),
+            ('x > PARSE_TEMPORAL(cutoff, "DateTime")', lambda body: {body.right}),
+            ('x > TYPE(NOW())', lambda body: set()),
+            ('MAP(items, "y", y + x + LEN(base))', lambda body: {body.args[2].right}),
+            ('MAP(items, "y", y + 1)', lambda body: set()),
+            ('LEN(MAP(items, "y", y + 1))', lambda body: {body.args[0]}),
+            ('MAP(items, name, LEN(base) + x)', lambda body: set()),
+            ('x + [1, 2]', lambda body: set()),
+            ('x + [LEN(base), 2]', lambda body: {body.right.elements[0]}),
+        ]:
+            with self.subTest(expression=expression):
+                body: ASTNode = OQSParser(eager=True).parse(expression=expression)
+                self.assertEqual(loop_invariants(body=body, variable_name="x", is_pure=is_pure), select(body))
+
+    def test_invariants_are_evaluated_once_per_loop(self):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(backend=backend):
+                profiler: OQSProfiler = OQSProfiler()
+                results: any = compile_expression(
+                    expression='LEN(FILTER(items, "x", x * 10 > SUM(config_list) - LEN(base) * 10))',
+                    backend=backend,
+                    optimize=False
+                ).results(variables=VARIABLES, profiler=profiler)
+                self.assertEqual(results, 2)
+                functions: dict[str, dict[str, int]] = profiler.summary()["functions"]
+                self.assertEqual(functions["SUM"]["calls"], 1)
+                self.assertEqual(functions["LEN"]["calls"], 2)
+                self.assertEqual(functions["MULTIPLY"]["calls"], 5)
+
+    def test_nested_loops_reuse_outer_invariants(self):
+        profiler: OQSProfiler = OQSProfiler()
+        results: any = compile_expression(
+            expression='MAP(items, "x", SUM(MAP(config_list, "y", y + x + LEN(base))))', optimize=False
+        ).results(variables=VARIABLES, profiler=profiler)
+        self.assertEqual(results, [34, 36, 38, 40])
+        self.assertEqual(profiler.summary()["functions"]["LEN"]["calls"], 1)
+        self.assertEqual(profiler.summary()["functions"]["SUM"]["calls"], 4)
+
+    def test_results_are_unchanged(self):
+        for expression in [
+            'FILTER(items, "x", x > LEN(config_list))',
+            'MAP(items, "x", APPEND([1], x))',
+            'MAP(items, "x", APPEND(APPEND(base, 1), x))',
+            'MAP(items, "x", [1, 2])',
+            'MAP(items, "x", MAP(items, "x", x * 2))',
+            'MAP(items, "y", x + y)',
+            'MAP(items, "x", IF(x > 2, 1 / 0, LEN(base)))',
+            'MAP(items, "x", IF(x > 9, 1 / 0, LEN(base)))',
+            'SORT(items, "x", LEN(config_list) - x)',
+            'FILTER({"a": 1, "b": 5}, "x", x > LEN(config_list))',
+            'MAP(items, "x", PARSE_TEMPORAL(cutoff, "DateTime") > DATETIME(2020, 1, 1, 0, 0, 0))',
+            'MAP(items, "x", MAP(config_list, "y", x + y * LEN(base)))',
+            'MAP(items, "x", MAP(items, name, x + LEN(base)))',
+            'MAP(items, "x", TYPE(NOW()))',
+            'SUM(MAP(RANGE(100000), "x", x * LEN(config_list)))',
+        ]:
+            expected: dict[str, any] = evaluate_expression(expression=expression, variables={**VARIABLES, "name": "y"})
+            for backend in CompiledExpression.BACKENDS:
+                with self.subTest(expression=expression, backend=backend):
+                    self.assertEqual(
+                        compile_expression(expression=expression, backend=backend).evaluate(
+                            variables={**VARIABLES, "name": "y"}
+                        ),
+                        expected
+                    )
+
+    def test_invariant_values_are_not_mutated(self):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    compile_expression(
+                        expression='MAP(items, "x", APPEND(APPEND([0], 1), x))', backend=backend, optimize=False
+                    ).results(variables=VARIABLES),
+                    [[0, 1, 1], [0, 1, 2], [0, 1, 3], [0, 1, 4]]
+                )
+
+    def test_container_results_are_not_shared(self):
+        def append_nine(interpreter: OQSInterpreter, node: FunctionNode) -> list[int]:
+            values: list[int] = interpreter.evaluate(node.args[0])
+            values.append(9)
+            return values
+
+        for backend in CompiledExpression.BACKENDS:
+            for expression, expected in [
+                ('MAP(RANGE(3), "x", [1, 2])', [[1, 2], [1, 2], [1, 2]]),
+                ('MAP(RANGE(3), "x", APPEND(base, 1))', [[0, 1], [0, 1], [0, 1]]),
+                ('MAP(RANGE(3), "x", [[LEN(base)]])', [[[1]], [[1]], [[1]]]),
+                ('MAP(RANGE(3), "x", [APPEND(base, 1)])', [[[0, 1]], [[0, 1]], [[0, 1]]]),
+                ('MAP(RANGE(3), "x", IF(true, APPEND(base, 1), x))', [[0, 1], [0, 1], [0, 1]]),
+            ]:
+                with self.subTest(expression=expression, backend=backend):
+                    results: list[any] = compile_expression(expression=expression, backend=backend).results(
+                        variables=VARIABLES
+                    )
+                    self.assertEqual(results, expected)
+                    results[0][0] = 7
+                    self.assertEqual(results[1:], expected[1:])
+            with self.subTest(function="APPEND_NINE", backend=backend):
+                self.assertEqual(
+                    compile_expression(
+                        expression='MAP(RANGE(3), "x", APPEND_NINE(APPEND([], 1)))', backend=backend
+                    ).results(additional_functions=[("APPEND_NINE", append_nine)]),
+                    [[1, 9], [1, 9], [1, 9]]
+                )
+
+    def test_invariant_containers_are_not_copied_per_iteration(self):
+        for backend in CompiledExpression.BACKENDS:
+            seen: list[list[int]] = []
+
+            def record(interpreter: OQSInterpreter, node: FunctionNode) -> bool:
+                values: list[int] = interpreter.evaluate(node.args[0])
+                seen.append(values)
+                return interpreter.evaluate(node.args[1]) in values
+
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    compile_expression(
+                        expression='LEN(FILTER(RANGE(1000), "x", RECORD(config_list + [1], x)))', backend=backend
+                    ).results(variables=VARIABLES, additional_functions=[("RECORD", record)]),
+                    3
+                )
+                self.assertEqual(len(seen), 1_000)
+                self.assertTrue(all(values is seen[0] for values in seen))
+                self.assertEqual(
+                    compile_expression(
+                        expression='LEN(FILTER(RANGE(1000), "x", IN(x, config_list + [1])))', backend=backend
+                    ).results(variables=VARIABLES),
+                    3
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
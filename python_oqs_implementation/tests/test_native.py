@@ -0,0 +1,58 @@
+import unittest
+from python_oqs_implementation.oqs.compiler import CompiledNode
+from python_oqs_implementation.oqs.constants.types import BackendTypeStrings as BTS
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.native import (MAX_NATIVE_BLOCK_DEPTH, OQSNativeCompiler)
+from python_oqs_implementation.oqs.parser import OQSParser
+
+
+class TestNativeBackend(unittest.TestCase):
+    VARIABLES: dict[str, any] = {
+        "a": 7, "b": 2, "f": 1.5, "t": True, "s": "text", "items": [1, 2, 3], "kvs": {"k": 1}, "zero": 0
+    }
+
+    def assertMatchesInterpreter(self, expression: str) -> None:
+        expected: dict[str, any] = compile_expression(expression).evaluate(variables=dict(self.VARIABLES))
+        compiled: CompiledExpression = compile_expression(expression, backend=BTS.NATIVE)
+        self.assertEqual(expected, compiled.evaluate(variables=dict(self.VARIABLES)))
+
+    def test_operators_match_interpreter(self):
+        for expression in [
+            "a + b", "a - f", "a * b", "a / b", "a / 7", "f / b", "a % b", "a ** b", "f ** b",
+            "t + 1", "t * 2", "t % 1", "s + s", "s * b", "items + items", "items - [1]", "kvs + kvs",
+            "a / zero", "s / 2", "a % zero", "f % 2", "s - 1",
+            "a < b", "a > f", "a <= 7", "a >= 8", "s < 1", "t < 2",
+            "a == 7", "a == 7.0", "a != b", "a === 7.0", "a !== 7.0", "items == [1, 2, 3]",
+            "a & 0", "0 | a", "t & s", "0 & undefined", "1 | undefined", "1 & undefined",
+        ]:
+            with self.subTest(expression=expression):
+                self.assertMatchesInterpreter(expression)
+
+    def test_functions_match_interpreter(self):
+        for expression in [
+            "IF(a > b, s, items)", "IF(a < b, 1)", "IF(false, 1, false, 2, 3)", "IF(a)", "IF(a < b, undefined, 5)",
+            "IF(true, a % zero, 1)", "AND(1, 2, 0)", "OR(0, null, a)", "AND(1)", "OR(0, undefined % 2)",
+            "ADD(a, b, f)", "LEN(s) + SUM(items)", "MAP(items, \"x\", x * a)", "FILTER(items, \"x\", x % 2 == 1)",
+            "TRY(a / zero, \"Division By Zero Error\", -1)", "ADD(***items)", "IF(***items)",
+        ]:
+            with self.subTest(expression=expression):
+                self.assertMatchesInterpreter(expression)
+
+    def test_values_match_interpreter(self):
+        for expression in [
+            "[a, s, [f, null, true], {\"k\": b}]", "[***items, a]", "[***a]", "{\"a\": a, ***kvs}", "{***items}",
+            "{s: a}", "undefined", "items",
+        ]:
+            with self.subTest(expression=expression):
+                self.assertMatchesInterpreter(expression)
+
+    def test_deep_nesting_is_split_across_functions(self):
+        expression: str = "a"
+        for i in range(MAX_NATIVE_BLOCK_DEPTH * 4):
+            expression: str = f"IF(a > {i}, {expression}, {i})"
+        self.assertMatchesInterpreter(expression)
+        self.assertMatchesInterpreter(" + ".join(["a * b"] * 200))
+
+    def test_compiles_to_native_code(self):
+        compiled: CompiledNode = OQSNativeCompiler().compile(OQSParser(eager=True).parse("a + 1"))
+        self.assertEqual("<oqs-native>", compiled.closure.__code__.co_filename)
@@ -0,0 +1,132 @@
+import datetime
+import unittest
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.governor import ResourceLimits
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import (
+    ASTNode, BinaryOpNode, EvaluatedNode, FunctionNode, ListNode, NullNode, VariableNode
+)
+from python_oqs_implementation.oqs.optimizer import OQSOptimizer
+from python_oqs_implementation.oqs.parser import OQSParser
+from python_oqs_implementation.oqs.registry import OQSFunctionRegistry
+
+
+class TestConstantFolding(unittest.TestCase):
+    def optimize(self, expression: str, known_variables: dict[str, any] | None = None) -> ASTNode:
+        return OQSOptimizer(known_variables=known_variables).optimize(OQSParser(eager=True).parse(expression))
+
+    def test_pure_functions_are_folded(self):
+        for expression, expected in [
+            ('DURATION(0, 1, 0, 0)', datetime.timedelta(hours=1)),
+            ('"prefix" + "suffix"', "prefixsuffix"),
+            ('PARSE_TEMPORAL("10:00:00", "Time")', datetime.time(10)),
+            ('IF(2 > 1, LEN("abc"), 0)', 3),
+            ('TRY(1 / 0, "Division By Zero Error", 0)', 0),
+        ]:
+            with self.subTest(expression=expression):
+                node: ASTNode = self.optimize(expression)
+                self.assertIsInstance(node, EvaluatedNode)
+                self.assertEqual(expected, node.value)
+
+    def test_containers_are_materialized_as_literals(self):
+        node: ASTNode = self.optimize("RANGE(0, 3)")
+        self.assertIsInstance(node, ListNode)
+        self.assertEqual([0, 1, 2], [element.value for element in node.elements])
+        compiled: CompiledExpression = compile_expression("APPEND(RANGE(0, 3), 9)")
+        self.assertEqual([0, 1, 2, 9], compiled.results())
+        self.assertEqual([0, 1, 2, 9], compiled.results())
+
+    def test_impure_and_raising_expressions_are_left_alone(self):
+        self.assertIsInstance(self.optimize("NOW()"), FunctionNode)
+        self.assertIsInstance(self.optimize('FORMAT_TEMPORAL(TODAY(), "%Y")'), FunctionNode)
+        self.assertIsInstance(self.optimize("1 / 0"), BinaryOpNode)
+        self.assertIsInstance(self.optimize('RAISE("Value Error", "no")'), FunctionNode)
+        self.assertIsInstance(self.optimize("UNKNOWN(1)"), FunctionNode)
+
+    def test_only_constant_subtrees_are_folded(self):
+        node: ASTNode = self.optimize("a + (1 + 2)")
+        self.assertIsInstance(node.left, VariableNode)
+        self.assertEqual(3, node.right.value)
+        node: ASTNode = self.optimize("a + 1 + 2")
+        self.assertIsInstance(node.left, BinaryOpNode)
+
+    def test_constant_conditions_are_resolved(self):
+        self.assertEqual(["IF", True, "a"], self.describe(self.optimize("IF(false, b, true, a, c)")))
+        self.assertEqual(["IF", True, "c"], self.describe(self.optimize("IF(false, b, 0, a, c)")))
+        self.assertIsInstance(self.optimize("IF(false, b)"), NullNode)
+        self.assertEqual(["IF", "flag", "a"], self.describe(self.optimize("IF(flag, a)")))
+
+    def test_expensive_expressions_are_left_alone(self):
+        self.assertIsInstance(self.optimize("SUM(RANGE(0, 3000000))"), FunctionNode)
+        self.assertIsInstance(self.optimize('LEN(MAP(RANGE(0, 100000), "x", x))'), FunctionNode)
+        self.assertIsInstance(self.optimize("SUM(RANGE(0, 3000))"), EvaluatedNode)
+
+    def test_limits_apply_to_folded_expressions(self):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(backend=backend):
+                compiled: CompiledExpression = compile_expression("SUM(RANGE(0, 3000))", backend=backend)
+                self.assertEqual(4_498_500, compiled.results())
+                self.assertEqual(
+                    "Resource Limit Error",
+                    compiled.evaluate(limits=ResourceLimits(max_elements=100))["error"]["type"]
+                )
+
+    def test_overridden_built_ins_are_not_folded(self):
+        def concatenate(interpreter: OQSInterpreter, node: FunctionNode) -> str:
+            return "".join(str(interpreter.evaluate(arg)) for arg in node.args)
+
+        registry: OQSFunctionRegistry = OQSInterpreter.REGISTRY.extend([("ADD", concatenate)])
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(backend=backend):
+                for expression in ("ADD(1, 2)", "1 + 2", "LEN(ADD(1, 2))"):
+                    self.assertEqual(
+                        compile_expression(expression, backend=backend, optimize=False).results(registry=registry),
+                        compile_expression(expression, backend=backend, registry=registry).results()
+                    )
+        self.assertIsInstance(compile_expression("MULTIPLY(2, 3)", registry=registry).ast, EvaluatedNode)
+
+    def test_cached_trees_are_not_modified(self):
+        parsed: ASTNode = OQSParser(eager=True).parse("a + (1 + 2)")
+        OQSOptimizer().optimize(parsed)
+        self.assertIsInstance(parsed.right, BinaryOpNode)
+
+    @staticmethod
+    def describe(node: FunctionNode) -> list[any]:
+        return [node.name] + [arg.name if isinstance(arg, VariableNode) else arg.value for arg in node.args]
+
+
+class TestPartialEvaluation(unittest.TestCase):
+    def test_known_variables_are_baked_in(self):
+        compiled: CompiledExpression = compile_expression(
+            "IF(premium, rate * 2, rate) * amount", known_variables={"premium": True, "rate": 3}
+        )
+        self.assertIsInstance(compiled.ast.left, EvaluatedNode)
+        self.assertEqual(6, compiled.ast.left.value)
+        self.assertEqual(60, compiled.results(variables={"amount": 10}))
+
+    def test_loop_variables_are_not_substituted(self):
+        compiled: CompiledExpression = compile_expression(
+            'MAP(items, "x", x * factor)', known_variables={"x": 100, "factor": 2}
+        )
+        self.assertEqual([2, 4], compiled.results(variables={"items": [1, 2]}))
+
+    def test_large_containers_stay_variables(self):
+        compiled: CompiledExpression = compile_expression(
+            "LEN(values) + SUM(values)", known_variables={"values": list(range(5_000))}
+        )
+        self.assertIsInstance(compiled.ast, EvaluatedNode)
+        compiled: CompiledExpression = compile_expression(
+            "IN(value, values)", known_variables={"values": list(range(5_000))}
+        )
+        self.assertIsInstance(compiled.ast.args[1], VariableNode)
+        self.assertTrue(compiled.results(variables={"value": 4_999}))
+
+    def test_known_variables_are_not_mutated(self):
+        known_variables: dict[str, any] = {"items": [1, 2]}
+        compiled: CompiledExpression = compile_expression("LEN(APPEND(items, 3))", known_variables=known_variables)
+        self.assertIsInstance(compiled.ast, EvaluatedNode)
+        self.assertEqual({"items": [1, 2]}, known_variables)
+
+    def test_unoptimized_compilation(self):
+        self.assertIsInstance(compile_expression("1 + 2", optimize=False).ast, BinaryOpNode)
+        self.assertIsInstance(compile_expression("1 + 2").ast, EvaluatedNode)
@@ -1,25 +1,37 @@
 import unittest
 from typing import Callable
+from python_oqs_implementation.oqs.engine import evaluate_expression
 from python_oqs_implementation.oqs.errors import (
     OQSSyntaxError, OQSUnexpectedCharacterError, OQSMissingExpectedCharacterError
 )
-from python_oqs_implementation.oqs.parser import OQSParser
+from python_oqs_implementation.oqs.lexer import (OQSLexer, Token)
+from python_oqs_implementation.oqs.nodes import (
+    ASTNode, BinaryOpNode, ComparisonOpNode, FunctionNode, KVSNode, ListNode, NumberNode, PackedNode, StringNode, UnparsedNode
+)
+from python_oqs_implementation.oqs.parser import (
+    OQSParser, PARSE_CACHE, TokenParser, clear_parse_cache, configure_parse_cache, parse_cache_info
+)
+from python_oqs_implementation.oqs.utils.cache import (CacheInfo, LRUCache)
 
 
-class TestSingleTokenizer(unittest.TestCase):
+class TestLexerTokens(unittest.TestCase):
     def setUp(self) -> None:
-        self._parser: OQSParser = OQSParser()
-        self.tokenize: Callable = self._parser.tokenize_expression
+        self.parse: Callable = OQSParser(eager=True).parse
+
+    @staticmethod
+    def tokenize(expression: str) -> list[str]:
+        return [token.text for token in OQSLexer.tokenize(expression)]
 
     def test_string(self):
         self.assertEqual(['"string"'], self.tokenize('"string"'))
         self.assertEqual(["'string'"], self.tokenize("'string'"))
+        self.assertEqual(['"a, (b"'], self.tokenize('"a, (b"'))
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('"string".')
+            self.parse('"string".')
 
         with self.assertRaises(OQSSyntaxError):
-            self.tokenize('"string" "string"')
+            self.parse('"string" "string"')
 
     def test_variable(self):
         self.assertEqual(['variable'], self.tokenize('variable'))
@@ -29,10 +41,16 @@ class TestSingleTokenizer(unittest.TestCase):
         self.assertEqual(['variable_'], self.tokenize('variable_'))
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('variable.')
+            self.parse('variable.')
 
-        with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('variable variable')
+        with self.assertRaises(OQSUnexpectedCharacterError):
+            self.parse('5, 5')
+
+        with self.assertRaises(OQSUnexpectedCharacterError):
+            self.parse('variable, variable')
+
+        with self.assertRaises(OQSUnexpectedCharacterError):
+            self.parse('anything, ')
 
     def test_integer(self):
         self.assertEqual(['5'], self.tokenize('5'))
@@ -41,10 +59,10 @@ class TestSingleTokenizer(unittest.TestCase):
         self.assertEqual(['5555555'], self.tokenize('5_555_555'))
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('5s5')
+            self.parse('5s5')
 
         with self.assertRaises(OQSSyntaxError):
-            self.tokenize('5 5')
+            self.parse('5 5')
 
     def test_decimal(self):
         self.assertEqual(['5.5'], self.tokenize('5.5'))
@@ -54,127 +72,133 @@ class TestSingleTokenizer(unittest.TestCase):
         self.assertEqual(['555555.5'], self.tokenize('555_555.5'))
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('.')
+            self.parse('.')
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('55.5s')
+            self.parse('55.5s')
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('555.5_5')
+            self.parse('555.5_5')
 
         with self.assertRaises(OQSSyntaxError):
-            self.tokenize('555.55 5.55')
+            self.parse('555.55 5.55')
 
     def test_function(self):
-        self.assertEqual(['ADD()'], self.tokenize('ADD()'))
-        self.assertEqual(['ADD(variable)'], self.tokenize('ADD(variable)'))
-        self.assertEqual(['ADD(variable, variable,variable)'], self.tokenize('ADD(variable, variable,variable)'))
-        self.assertEqual(['ADD("string")'], self.tokenize('ADD("string")'))
-        self.assertEqual(['ADD(555)'], self.tokenize('ADD(555)'))
-        self.assertEqual(['ADD(5.5)'], self.tokenize('ADD(5.5)'))
-        self.assertEqual(['ADD(5 5 5 5 )'], self.tokenize('ADD(5 5 5 5 )'))
-        self.assertEqual(['ADD(5 + 5)'], self.tokenize('ADD(5 + 5)'))
+        self.assertEqual(['ADD', '(', ')'], self.tokenize('ADD()'))
+        self.assertEqual(['ADD', '(', 'variable', ')'], self.tokenize('ADD(variable)'))
+        self.assertEqual(
+            ['ADD', '(', 'variable', ',', 'variable', ',', 'variable', ')'],
+            self.tokenize('ADD(variable, variable,variable)')
+        )
+        self.assertEqual(['ADD', '(', '"string"', ')'], self.tokenize('ADD("string")'))
+        self.assertEqual(['ADD', '(', '555', ')'], self.tokenize('ADD(555)'))
+        self.assertEqual(['ADD', '(', '5.5', ')'], self.tokenize('ADD(5.5)'))
+        self.assertEqual(['ADD', '(', '5', '5', '5', '5', ')'], self.tokenize('ADD(5 5 5 5 )'))
+        self.assertEqual(['ADD', '(', '5', '+', '5', ')'], self.tokenize('ADD(5 + 5)'))
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('ADD(')
+            self.parse('ADD(')
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('ADD(5')
+            self.parse('ADD(5')
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('ADD(5).')
+            self.parse('ADD(5).')
 
         with self.assertRaises(OQSSyntaxError):
-            self.tokenize('ADD(5) 5')
+            self.parse('ADD(5) 5')
 
     def test_nested_function(self):
-        self.assertEqual(['ADD(ADD(5, ADD(5, 2, 5)), 2)'], self.tokenize('ADD(ADD(5, ADD(5, 2, 5)), 2)'))
-        self.assertEqual(['ADD({{{{)'], self.tokenize('ADD({{{{)'))
-        self.assertEqual(['ADD([[[[)'], self.tokenize('ADD([[[[)'))
+        self.assertEqual(
+            ['ADD', '(', 'ADD', '(', '5', ',', 'ADD', '(', '5', ',', '2', ')', ')', ',', '2', ')'],
+            self.tokenize('ADD(ADD(5, ADD(5, 2)), 2)')
+        )
+        self.assertEqual(['ADD', '(', '{', '{', '{', '{', ')'], self.tokenize('ADD({{{{)'))
+        self.assertEqual(['ADD', '(', '[', '[', '[', '[', ')'], self.tokenize('ADD([[[[)'))
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('ADD((()')
+            self.parse('ADD((()')
 
     def test_list(self):
         self.assertEqual(
-            ['[5, 5, "string"' + ", 'string', 4, ADD(3, 4), 2]"],
-            self.tokenize('[5, 5, "string"' + ", 'string', 4, ADD(3, 4), 2]"),
+            ['[', '5', ',', '"string"', ',', "'string'", ',', 'ADD', '(', '3', ',', '4', ')', ']'],
+            self.tokenize('[5, "string"' + ", 'string', ADD(3, 4)]")
         )
-        self.assertEqual(['[]'], self.tokenize('[]'))
+        self.assertEqual(['[', ']'], self.tokenize('[]'))
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('[')
+            self.parse('[')
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('[5')
+            self.parse('[5')
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('[5].')
+            self.parse('[5].')
 
         with self.assertRaises(OQSSyntaxError):
-            self.tokenize('[5] 5')
+            self.parse('[5] 5')
 
     def test_nested_list(self):
-        self.assertEqual(['[5, [5, 2], [5, 2, [5, 2, [5, 2]]]]'], self.tokenize('[5, [5, 2], [5, 2, [5, 2, [5, 2]]]]'))
-        self.assertEqual(['[((((]'], self.tokenize('[((((]'))
-        self.assertEqual(['[{{{{]'], self.tokenize('[{{{{]'))
+        self.assertEqual(
+            ['[', '5', ',', '[', '5', ',', '2', ']', ',', '[', '[', ']', ']', ']'], self.tokenize('[5, [5, 2], [[]]]')
+        )
+        self.assertEqual(['[', '(', '(', '(', '(', ']'], self.tokenize('[((((]'))
+        self.assertEqual(['[', '{', '{', '{', '{', ']'], self.tokenize('[{{{{]'))
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('[[[]')
+            self.parse('[[[]')
 
     def test_kvs(self):
-        self.assertEqual(['{anything}'], self.tokenize('{anything}'))
+        self.assertEqual(['{', 'anything', '}'], self.tokenize('{anything}'))
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('{')
+            self.parse('{')
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('{"string": variable')
+            self.parse('{"string": variable')
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('{"string": variable}.')
+            self.parse('{"string": variable}.')
 
         with self.assertRaises(OQSSyntaxError):
-            self.tokenize('{"string": variable} 5')
+            self.parse('{"string": variable} 5')
 
     def test_nested_kvs(self):
         self.assertEqual(
-            ['{"string": variable, "string2": {"string": variable}}'],
+            ['{', '"string"', ':', 'variable', ',', '"string2"', ':', '{', '"string"', ':', 'variable', '}', '}'],
             self.tokenize('{"string": variable, "string2": {"string": variable}}')
         )
-        self.assertEqual(['{[[[[}'], self.tokenize('{[[[[}'))
-        self.assertEqual(['{((((}'], self.tokenize('{((((}'))
+        self.assertEqual(['{', '[', '[', '[', '[', '}'], self.tokenize('{[[[[}'))
+        self.assertEqual(['{', '(', '(', '(', '(', '}'], self.tokenize('{((((}'))
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize('{{}')
+            self.parse('{{}')
 
     def test_unpacking(self):
-        self.assertEqual(['***variable'], self.tokenize('***variable'))
-        self.assertEqual(['***{}'], self.tokenize('***{}'))
-        self.assertEqual(['***{variable_1:variable_2}'], self.tokenize('***{variable_1:variable_2}'))
-        self.assertEqual(['***[]'], self.tokenize('***[]'))
-        self.assertEqual(['***[variable]'], self.tokenize('***[variable]'))
-        self.assertEqual(['***()'], self.tokenize('***()'))
-        self.assertEqual(['***(variable_1)'], self.tokenize('***(variable_1)'))
-
-        with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('***"string"')
-
-        with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize("***'string'")
-
-        with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('***1')
+        self.assertEqual(['***', 'variable'], self.tokenize('***variable'))
+        self.assertEqual(['***', '{', '}'], self.tokenize('***{}'))
+        self.assertEqual(
+            ['***', '{', 'variable_1', ':', 'variable_2', '}'], self.tokenize('***{variable_1:variable_2}')
+        )
+        self.assertEqual(['***', '[', ']'], self.tokenize('***[]'))
+        self.assertEqual(['***', '[', 'variable', ']'], self.tokenize('***[variable]'))
+        self.assertEqual(['***', '(', ')'], self.tokenize('***()'))
+        self.assertEqual(['***', '(', 'variable_1', ')'], self.tokenize('***(variable_1)'))
 
-        with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('***1.0')
+        for packed in ['***"string"', "***'string'", '***1', '***1.0']:
+            with self.subTest(packed=packed):
+                self.assertEqual(
+                    "Type Error", evaluate_expression(expression=f'ADD({packed})')["error"]["type"]
+                )
 
     def operator_test(self, operator: str):
-        self.assertEqual(['5', operator,  '3'], self.tokenize(f'5 {operator} 3'))
-        self.assertEqual(['"string"', operator,  '3'], self.tokenize(f'"string" {operator} 3'))
+        self.assertEqual(['5', operator, '3'], self.tokenize(f'5 {operator} 3'))
+        self.assertEqual(['"string"', operator, '3'], self.tokenize(f'"string" {operator} 3'))
         self.assertEqual(['variable', operator, '3'], self.tokenize(f'variable {operator} 3'))
-        self.assertEqual(['[]', operator,  '3'], self.tokenize(f'[] {operator} 3'))
-        self.assertEqual([f'(5 {operator} 5)', operator,  '3'], self.tokenize(f'(5 {operator} 5) {operator} 3'))
+        self.assertEqual(['[', ']', operator, '3'], self.tokenize(f'[] {operator} 3'))
+        self.assertEqual(
+            ['(', '5', operator, '5', ')', operator, '3'], self.tokenize(f'(5 {operator} 5) {operator} 3')
+        )
         self.assertEqual(['anything', operator, 'anything'], self.tokenize(f'anything {operator} anything'))
         self.assertEqual(['anything', operator, 'anything'], self.tokenize(f'anything{operator}anything'))
         self.assertEqual(
@@ -184,13 +208,13 @@ class TestSingleTokenizer(unittest.TestCase):
         self.assertEqual(['anything', operator*4, 'anything'], self.tokenize(f'anything {operator*4} anything'))
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize(f'5 {operator} ')
+            self.parse(f'5 {operator} ')
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize(f'5 {operator} 5 {operator}')
+            self.parse(f'5 {operator} 5 {operator}')
 
         with self.assertRaises(OQSMissingExpectedCharacterError):
-            self.tokenize(f'{operator} 5')
+            self.parse(f'{operator} 5')
 
     def test_addition(self):
         self.operator_test(operator="+")
@@ -236,19 +260,23 @@ class TestSingleTokenizer(unittest.TestCase):
 
     def test_commas(self):
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('5, 5')
+            self.parse('5, 5')
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('variable, variable')
+            self.parse('variable, variable')
 
         with self.assertRaises(OQSUnexpectedCharacterError):
-            self.tokenize('anything, ')
+            self.parse('anything, ')
 
 
-class TestSeparatorTokenizer(unittest.TestCase):
-    def setUp(self) -> None:
-        self._parser: OQSParser = OQSParser()
-        self.separate: Callable = self._parser.separate_arguments
+class TestElementSeparator(unittest.TestCase):
+    @staticmethod
+    def separate(expression: str) -> list[str]:
+        parser: TokenParser = TokenParser(expression=expression, eager=True)
+        return [
+            parser.source(start=start, end=end)
+            for start, end in parser.split_elements(start=0, end=len(parser.tokens))
+        ]
 
     def test_no_commas(self):
         self.assertEqual(['5 + 5'], self.separate("5 + 5"))
@@ -297,3 +325,186 @@ class TestSeparatorTokenizer(unittest.TestCase):
         self.assertEqual(
             ['ADD(5, 4, 3)', 'ADD(5, 4, 3)', 'ADD(5, 4, 3)'], self.separate('ADD(5, 4, 3), ADD(5, 4, 3), ADD(5, 4, 3),')
         )
+
+
+class TestLexer(unittest.TestCase):
+    def test_token_positions(self):
+        tokens: list[Token] = OQSLexer.tokenize('ADD(x,\t1.5) >= "a b"')
+        self.assertEqual(
+            [
+                ('name', 'ADD', 0, 3),
+                ('open', '(', 3, 4),
+                ('name', 'x', 4, 5),
+                ('comma', ',', 5, 6),
+                ('number', '1.5', 7, 10),
+                ('close', ')', 10, 11),
+                ('operator', '>=', 12, 14),
+                ('string', '"a b"', 15, 20)
+            ],
+            [(token.type, token.text, token.start, token.end) for token in tokens]
+        )
+
+    def test_brackets_are_matched(self):
+        tokens: list[Token] = OQSLexer.tokenize('[(1), {"]": 2}]')
+        self.assertEqual(10, tokens[0].match)
+        self.assertEqual(0, tokens[10].match)
+        self.assertEqual(3, tokens[1].match)
+        self.assertEqual(9, tokens[5].match)
+
+    def test_unclosed_brackets_are_unmatched(self):
+        tokens: list[Token] = OQSLexer.tokenize('ADD({{{{)')
+        self.assertEqual(6, tokens[1].match)
+        self.assertTrue(all(token.match is None for token in tokens[2:6]))
+
+    def test_numbers_are_normalized(self):
+        self.assertEqual(['0.5', '5.0', '1000'], [token.text for token in OQSLexer.tokenize('.5 5. 1_000')])
+
+    def test_invalid_characters_become_invalid_tokens(self):
+        tokens: list[Token] = OQSLexer.tokenize('1 + $ + "open')
+        self.assertEqual(['number', 'operator', 'invalid', 'operator', 'invalid'], [token.type for token in tokens])
+        self.assertIs(OQSMissingExpectedCharacterError, tokens[-1].error_class)
+
+
+class TestTokenParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parse: Callable = OQSParser(eager=True).parse
+
+    def test_list_elements_are_expressions(self):
+        node: ASTNode = self.parse('[1 + 2, "a"]')
+        self.assertIsInstance(node.elements[0], BinaryOpNode)
+        self.assertIsInstance(node.elements[1], StringNode)
+
+    def test_brackets_inside_strings(self):
+        node: ASTNode = self.parse('ADD(")", "]")')
+        self.assertEqual([')', ']'], [arg.value for arg in node.args])
+
+    def test_whitespace_is_ignored(self):
+        node: ASTNode = self.parse('1\t+\n2')
+        self.assertIsInstance(node, BinaryOpNode)
+        self.assertIsInstance(node.right, NumberNode)
+
+    def test_operator_precedence_and_associativity(self):
+        def render(node: ASTNode) -> str:
+            if isinstance(node, BinaryOpNode | ComparisonOpNode):
+                return f"({render(node.left)} {node.op} {render(node.right)})"
+            return node.name
+
+        for expression, expected in [
+            ('a - b + c', '((a - b) + c)'),
+            ('a + b * c', '(a + (b * c))'),
+            ('a * b + c', '((a * b) + c)'),
+            ('a ** b ** c', '((a ** b) ** c)'),
+            ('a - b * c ** d / e == f & g', '(((a - ((b * (c ** d)) / e)) == f) & g)'),
+        ]:
+            with self.subTest(expression=expression):
+                self.assertEqual(expected, render(self.parse(expression)))
+
+    def test_long_operator_chains(self):
+        node: ASTNode = self.parse(' + '.join(f'a{i}' for i in range(5_000)))
+        self.assertEqual('a4999', node.right.name)
+        self.assertEqual('a4998', node.left.right.name)
+
+    def test_syntax_errors(self):
+        for expression, error in [
+            ('1 +', OQSMissingExpectedCharacterError),
+            ('+ 1', OQSMissingExpectedCharacterError),
+            ('1 2', OQSMissingExpectedCharacterError),
+            ('ADD(1', OQSMissingExpectedCharacterError),
+            ('"open', OQSMissingExpectedCharacterError),
+            ('1 $ 2', OQSUnexpectedCharacterError),
+            ('1 +* 2', OQSSyntaxError),
+            ('{"a"}', OQSSyntaxError),
+            ('{:1}', OQSSyntaxError),
+            ('{ : 1}', OQSSyntaxError),
+            ('{"a": 1, :2}', OQSSyntaxError),
+            ('{"a":}', OQSSyntaxError)
+        ]:
+            with self.subTest(expression=expression):
+                with self.assertRaises(error):
+                    self.parse(expression)
+        self.assertEqual("Syntax Error", evaluate_expression(expression="{:1}")["error"]["type"])
+
+
+class TestEagerParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parse: Callable = OQSParser(eager=True).parse
+
+    def test_function_arguments_are_parsed(self):
+        node: ASTNode = self.parse('ADD(1 + 2, MAP(items, "x", x * 2))')
+        self.assertIsInstance(node, FunctionNode)
+        self.assertIsInstance(node.args[0], BinaryOpNode)
+        self.assertIsInstance(node.args[1], FunctionNode)
+        self.assertIsInstance(node.args[1].args[2], BinaryOpNode)
+
+    def test_packed_nodes_are_parsed(self):
+        node: ASTNode = self.parse('[***ADD(a, b), {***kvs}, LIST(***REVERSE(c))]')
+        self.assertIsInstance(node, ListNode)
+        self.assertIsInstance(node.elements[0], PackedNode)
+        self.assertIsInstance(node.elements[0].node, FunctionNode)
+        self.assertIsInstance(node.elements[1], KVSNode)
+        self.assertIsInstance(list(node.elements[1].key_value_store.values())[0].node, ASTNode)
+        self.assertIsInstance(node.elements[2].args[0].node, FunctionNode)
+
+    def test_invalid_arguments_stay_unparsed(self):
+        node: ASTNode = self.parse('IF(true, 1, 1 +)')
+        self.assertIsInstance(node.args[2], UnparsedNode)
+        self.assertEqual('1 +', node.args[2].token)
+
+    def test_lazy_parser_keeps_arguments_unparsed(self):
+        node: ASTNode = OQSParser().parse('ADD(1 + 2, ***items)')
+        self.assertIsInstance(node.args[0], UnparsedNode)
+        self.assertIsNone(node.args[1].node)
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._original_maxsize: int = PARSE_CACHE.maxsize
+        configure_parse_cache(maxsize=2)
+        clear_parse_cache()
+
+    def tearDown(self) -> None:
+        configure_parse_cache(maxsize=self._original_maxsize)
+        clear_parse_cache()
+
+    def test_repeated_expressions_are_served_from_cache(self):
+        parser: OQSParser = OQSParser(eager=True)
+        first: ASTNode = parser.parse('1 + 2')
+        self.assertIs(first, parser.parse('1 + 2'))
+        self.assertIs(first, OQSParser(eager=True).parse('1 + 2'))
+        self.assertEqual(CacheInfo(hits=2, misses=1, evictions=0, maxsize=2, currsize=1), parse_cache_info())
+
+    def test_lazy_and_eager_trees_are_cached_separately(self):
+        self.assertIsNot(OQSParser().parse('ADD(x)'), OQSParser(eager=True).parse('ADD(x)'))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        parser: OQSParser = OQSParser()
+        parser.parse('1')
+        parser.parse('2')
+        parser.parse('1')
+        parser.parse('3')
+        self.assertEqual(1, parse_cache_info().evictions)
+        parser.parse('1')
+        parser.parse('2')
+        self.assertEqual(CacheInfo(hits=2, misses=4, evictions=2, maxsize=2, currsize=2), parse_cache_info())
+
+    def test_cache_can_be_disabled(self):
+        configure_parse_cache(maxsize=0)
+        parser: OQSParser = OQSParser()
+        self.assertIsNot(parser.parse('x'), parser.parse('x'))
+        self.assertEqual(CacheInfo(hits=0, misses=0, evictions=0, maxsize=0, currsize=0), parse_cache_info())
+
+    def test_syntax_errors_are_not_cached(self):
+        with self.assertRaises(OQSSyntaxError):
+            OQSParser().parse('1 +')
+        self.assertEqual(0, parse_cache_info().currsize)
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_resize_evicts_oldest_entries(self):
+        cache: LRUCache = LRUCache(maxsize=3)
+        for key in 'abc':
+            cache.put(key, key.upper())
+        cache.resize(maxsize=1)
+        self.assertIs(LRUCache.MISSING, cache.get('a'))
+        self.assertEqual('C', cache.get('c'))
+        self.assertEqual(CacheInfo(hits=1, misses=1, evictions=2, maxsize=1, currsize=1), cache.info())
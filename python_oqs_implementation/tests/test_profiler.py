@@ -0,0 +1,102 @@
+import json
+import unittest
+from python_oqs_implementation.oqs.engine import (CompiledExpression, ExpressionInput, compile_expression, oqs_engine)
+from python_oqs_implementation.oqs.governor import ResourceLimits
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import (FunctionNode, ListNode, NumberNode, VariableNode)
+from python_oqs_implementation.oqs.profiler import (OQSProfiler, node_label)
+
+
+class TestProfiler(unittest.TestCase):
+    def profile_all_backends(self, expression: str, variables: dict[str, any] = None) -> dict[str, OQSProfiler]:
+        profilers: dict[str, OQSProfiler] = {}
+        for backend in CompiledExpression.BACKENDS:
+            profilers[backend] = OQSProfiler()
+            compile_expression(expression=expression, backend=backend, optimize=False).results(
+                variables=variables, profiler=profilers[backend]
+            )
+        return profilers
+
+    def test_call_counts(self):
+        for backend, profiler in self.profile_all_backends(
+                expression='SUM(MAP(items, "x", x * 2)) + LEN([1, 2])', variables={"items": [1, 2, 3]}
+        ).items():
+            with self.subTest(backend=backend):
+                functions: dict[str, dict[str, int]] = profiler.summary()["functions"]
+                self.assertEqual(functions["ADD"]["calls"], 1)
+                self.assertEqual(functions["SUM"]["calls"], 1)
+                self.assertEqual(functions["MULTIPLY"]["calls"], 3)
+                self.assertEqual(functions["LEN"]["calls"], 1)
+                nodes: dict[str, dict[str, int]] = {node["path"]: node for node in profiler.summary()["nodes"]}
+                self.assertEqual(nodes["ADD;SUM;MAP;MULTIPLY;Variable:x"]["calls"], 3)
+                self.assertEqual(nodes["ADD;LEN;List"]["allocations"], 2)
+
+    def test_times_are_consistent(self):
+        for backend, profiler in self.profile_all_backends(expression='SUM(RANGE(1000)) + LEN(RANGE(10))').items():
+            with self.subTest(backend=backend):
+                nodes: list[dict[str, int]] = profiler.summary()["nodes"]
+                for node in nodes:
+                    self.assertGreaterEqual(node["inclusive_ns"], node["exclusive_ns"])
+                    self.assertGreaterEqual(node["exclusive_ns"], 0)
+                self.assertEqual(profiler.total_ns, sum(node["exclusive_ns"] for node in nodes))
+                self.assertEqual(nodes[0]["path"], "ADD")
+
+    def test_lazy_pipelines_are_attributed_to_each_step(self):
+        for backend, profiler in self.profile_all_backends(
+                expression='SUM(MAP(FILTER(RANGE(10), "y", y > 4), "x", x * 2))'
+        ).items():
+            with self.subTest(backend=backend):
+                paths: set[str] = {node["path"] for node in profiler.summary()["nodes"]}
+                self.assertIn("SUM;MAP;MULTIPLY", paths)
+                self.assertIn("SUM;MAP;FILTER;GREATER_THAN", paths)
+                self.assertIn("SUM;MAP;FILTER;RANGE", paths)
+
+    def test_collapsed_stacks(self):
+        profiler: OQSProfiler = self.profile_all_backends(expression='MAP(RANGE(3), "x", x + 1)')["interpreter"]
+        for line in profiler.collapsed_stacks().splitlines():
+            path, value = line.rsplit(" ", 1)
+            self.assertTrue(path.startswith("MAP"))
+            self.assertGreater(int(value), 0)
+
+    def test_errors_still_record(self):
+        profiler: OQSProfiler = OQSProfiler()
+        result: dict[str, any] = compile_expression(expression='1 + LEN(5)').evaluate(profiler=profiler)
+        self.assertEqual(result["error"]["type"], "Type Error")
+        self.assertEqual(profiler.summary()["functions"]["LEN"]["calls"], 1)
+        self.assertEqual(profiler.stack, [])
+
+    def test_engine_report(self):
+        result: dict[str, any] = oqs_engine(expression='SUM([1, 2, 3])', profile=True)
+        self.assertEqual(result["results"]["value"], 6)
+        self.assertEqual(set(result["profile"]), {"total_ns", "nodes", "functions", "collapsed_stacks"})
+        json.dumps(result)
+        self.assertNotIn("profile", oqs_engine(expression='SUM([1, 2, 3])'))
+        embedded: dict[str, any] = oqs_engine(
+            expression='<{LEN("ab")}> and <{LEN("c")}>', string_embedded=True, profile=True
+        )
+        self.assertEqual(embedded["profile"]["functions"]["LEN"]["calls"], 2)
+        results: list[dict[str, any]] = oqs_engine(
+            evaluate_multiple=True, expression_inputs=[ExpressionInput("1 + 1"), ExpressionInput("2 * 2")], profile=True
+        )["results"]
+        self.assertEqual([list(result["profile"]["functions"]) for result in results], [["ADD"], ["MULTIPLY"]])
+
+    def test_profiler_with_limits(self):
+        profiler: OQSProfiler = OQSProfiler()
+        compiled: CompiledExpression = compile_expression(
+            expression='SUM(RANGE(1000))', backend="closure", optimize=False
+        )
+        result: dict[str, any] = compiled.evaluate(limits=ResourceLimits(max_elements=10), profiler=profiler)
+        self.assertEqual(result["error"]["type"], "Resource Limit Error")
+        self.assertEqual(profiler.stack, [])
+
+    def test_disabled_profiler_leaves_evaluate_untouched(self):
+        interpreter: OQSInterpreter = OQSInterpreter(expression="1")
+        self.assertNotIn("evaluate", vars(interpreter))
+        profiled: OQSInterpreter = OQSInterpreter(expression="1", profiler=OQSProfiler())
+        self.assertIn("evaluate", vars(profiled))
+
+    def test_node_label(self):
+        self.assertEqual(node_label(FunctionNode(name="sum", args=[])), "SUM")
+        self.assertEqual(node_label(ListNode(elements=[])), "List")
+        self.assertEqual(node_label(VariableNode(name="x")), "Variable:x")
+        self.assertEqual(node_label(NumberNode(value=1)), "Literal")
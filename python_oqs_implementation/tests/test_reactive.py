@@ -0,0 +1,182 @@
+import random
+import unittest
+from python_oqs_implementation.oqs.engine import evaluate_expression
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import (ASTNode, BinaryOpNode, FunctionNode)
+from python_oqs_implementation.oqs.reactive import (MISSING, OQSReactiveGraph, resolve_path, same_value)
+
+
+RULES: dict[str, str] = {
+    "total": 'SUM(MAP(ACCESS(order, "items"), "item", ACCESS(item, "price") * ACCESS(item, "quantity"))) * rate',
+    "gold": 'ACCESS(ACCESS(order, "customer"), "tier") == "gold"',
+    "count": 'LEN(ACCESS(order, "items")) + LEN(config)',
+    "flagged": 'FILTER(ACCESS(order, "items"), "item", ACCESS(item, "price") > threshold)',
+    "label": 'IF(ACCESS(order, "status", "new") == "paid", "Paid", "Open")',
+    "error": 'ACCESS(order, "missing") + 1',
+    "sorted": 'APPEND(SORT(config, "value", value), threshold)',
+}
+
+
+def build_variables() -> dict[str, any]:
+    return {
+        "order": {
+            "items": [{"price": 2, "quantity": 3}, {"price": 5, "quantity": 1}],
+            "customer": {"tier": "gold"},
+            "status": "paid"
+        },
+        "rate": 2,
+        "threshold": 3,
+        "config": [3, 1, 2]
+    }
+
+
+class TestReactiveGraph(unittest.TestCase):
+    def assert_matches_fresh_evaluation(self, graph: OQSReactiveGraph):
+        for name, expression in graph.expressions.items():
+            with self.subTest(name=name):
+                self.assertEqual(
+                    graph.results[name], evaluate_expression(expression=expression, variables=graph.variables)
+                )
+
+    def test_initial_results(self):
+        graph: OQSReactiveGraph = OQSReactiveGraph(expressions=RULES, variables=build_variables())
+        self.assertEqual(set(graph.evaluate_all()), set(RULES))
+        self.assert_matches_fresh_evaluation(graph)
+
+    def test_only_affected_expressions_are_recomputed(self):
+        graph: OQSReactiveGraph = OQSReactiveGraph(expressions=RULES, variables=build_variables())
+        graph.evaluate_all()
+        self.assertEqual(set(graph.update({"rate": 3})), {"total"})
+        self.assertEqual(set(graph.update({"threshold": 1})), {"flagged", "sorted"})
+        self.assertEqual(set(graph.update({"unused": 1})), set())
+        self.assert_matches_fresh_evaluation(graph)
+
+    def test_access_paths_limit_recomputation(self):
+        graph: OQSReactiveGraph = OQSReactiveGraph(expressions=RULES, variables=build_variables())
+        graph.evaluate_all()
+        order: dict[str, any] = build_variables()["order"]
+        order["customer"] = {"tier": "silver"}
+        self.assertEqual(set(graph.update({"order": order})), {"gold"})
+        order: dict[str, any] = {**order, "status": "new"}
+        self.assertEqual(set(graph.update({"order": order})), {"label"})
+        order: dict[str, any] = {**order, "items": [{"price": 4, "quantity": 1}]}
+        self.assertEqual(set(graph.update({"order": order})), {"total", "count", "flagged"})
+        self.assert_matches_fresh_evaluation(graph)
+
+    def test_unchanged_sub_trees_are_reused(self):
+        graph: OQSReactiveGraph = OQSReactiveGraph(expressions=RULES, variables=build_variables())
+        graph.evaluate_all()
+        total: BinaryOpNode = graph.asts["total"]
+        sum_node: FunctionNode = total.left
+        memoized: any = graph.memo[sum_node]
+        graph.update({"rate": 5})
+        self.assertIs(graph.memo[sum_node], memoized)
+        sort_node: FunctionNode = graph.asts["sorted"].args[0]
+        sorted_config: list[int] = graph.memo[sort_node]
+        graph.update({"threshold": 10})
+        self.assertIs(graph.memo[sort_node], sorted_config)
+        self.assertEqual(sorted_config, [1, 2, 3])
+        self.assertEqual(graph.results["sorted"]["results"]["value"], [1, 2, 3, 10])
+
+    def test_in_place_mutations_are_detected(self):
+        xs: list[int] = [1, 2]
+        order: dict[str, any] = {"status": "new"}
+        graph: OQSReactiveGraph = OQSReactiveGraph(
+            expressions={"tripled": 'MAP(xs, "x", x * 3)', "status": 'ACCESS(order, "status")'},
+            variables={"xs": xs, "order": order}
+        )
+        graph.evaluate_all()
+        xs.append(9)
+        order["status"] = "paid"
+        self.assertEqual(graph.update({"xs": xs}), {"tripled": {"results": {"value": [3, 6, 27], "type": "List"}}})
+        self.assertEqual(graph.update({"order": order}), {"status": {"results": {"value": "paid", "type": "String"}}})
+        self.assertEqual(graph.update({"xs": xs, "order": order}), {})
+
+    def test_returned_results_are_copies(self):
+        graph: OQSReactiveGraph = OQSReactiveGraph(
+            expressions={
+                "sorted": 'SORT(config, "value", value)', "first": 'SLICE(SORT(config, "value", value), 0, 1)'
+            },
+            variables={"config": [3, 1, 2], "threshold": 1}
+        )
+        graph.evaluate_all()["sorted"]["results"]["value"].append(99)
+        self.assertEqual(graph.update({"threshold": 2}), {})
+        graph.update({"config": [3, 1, 2, 0]})["sorted"]["results"]["value"].clear()
+        self.assertEqual(graph.results["sorted"], {"results": {"value": [0, 1, 2, 3], "type": "List"}})
+        graph.add(name="last", expression='SLICE(SORT(config, "value", value), 3)')
+        self.assertEqual(graph.update({"threshold": 3}), {"last": {"results": {"value": [3], "type": "List"}}})
+        self.assertEqual(graph.memo[graph.asts["sorted"]], [0, 1, 2, 3])
+        self.assert_matches_fresh_evaluation(graph)
+
+    def test_loop_variables_are_not_memoized(self):
+        graph: OQSReactiveGraph = OQSReactiveGraph(
+            expressions={"doubled": 'MAP(items, "x", x * factor)'}, variables={"items": [1, 2], "factor": 2}
+        )
+        graph.evaluate_all()
+        memoized_nodes: list[ASTNode] = list(graph.dependencies)
+        self.assertEqual([type(node) for node in memoized_nodes], [FunctionNode])
+        self.assertEqual(graph.update({"factor": 3}), {"doubled": {"results": {"value": [3, 6], "type": "List"}}})
+
+    def test_impure_and_custom_functions_are_always_recomputed(self):
+        calls: list[int] = []
+
+        def counter(interpreter: OQSInterpreter, node: FunctionNode) -> int:
+            calls.append(1)
+            return len(calls)
+
+        graph: OQSReactiveGraph = OQSReactiveGraph(
+            expressions={"counter": 'COUNTER() + a', "now": 'TYPE(NOW())', "plain": 'a + 1'},
+            variables={"a": 0},
+            additional_functions=[("counter", counter)]
+        )
+        graph.evaluate_all()
+        self.assertEqual(set(graph.update({"b": 1})), {"counter", "now"})
+        self.assertEqual(graph.results["counter"]["results"]["value"], 2)
+
+    def test_errors_and_new_expressions(self):
+        graph: OQSReactiveGraph = OQSReactiveGraph(variables={"a": 1})
+        graph.add(name="sum", expression='a + b')
+        graph.add(name="invalid", expression='a +')
+        results: dict[str, dict[str, any]] = graph.evaluate_all()
+        self.assertEqual(results["sum"]["error"]["type"], "Undefined Variable Error")
+        self.assertIn("error", results["invalid"])
+        self.assertEqual(graph.update({"b": 2}), {"sum": {"results": {"value": 3, "type": "Integer"}}})
+
+    def test_random_updates_match_fresh_evaluation(self):
+        generator: random.Random = random.Random(7)
+        graph: OQSReactiveGraph = OQSReactiveGraph(expressions=RULES, variables=build_variables())
+        graph.evaluate_all()
+        for _ in range(50):
+            order: dict[str, any] = dict(graph.variables["order"])
+            choice: int = generator.randrange(5)
+            if choice == 0:
+                order["items"] = [
+                    {"price": generator.randrange(6), "quantity": generator.randrange(3)}
+                    for _ in range(generator.randrange(4))
+                ]
+                changes: dict[str, any] = {"order": order}
+            elif choice == 1:
+                order["status"] = generator.choice(["paid", "new", 1])
+                changes: dict[str, any] = {"order": order}
+            elif choice == 2:
+                changes: dict[str, any] = {"rate": generator.choice([1, 2, 2.0, True])}
+            elif choice == 3:
+                changes: dict[str, any] = {"threshold": generator.randrange(6)}
+            else:
+                changes: dict[str, any] = {"config": [generator.randrange(5) for _ in range(generator.randrange(4))]}
+            graph.update(changes)
+            self.assert_matches_fresh_evaluation(graph)
+
+    def test_paths_and_values(self):
+        variables: dict[str, any] = {"order": {"items": [{"price": 1}]}}
+        self.assertEqual(resolve_path(variables=variables, path=("order", "items", 0, "price")), 1)
+        self.assertIs(resolve_path(variables=variables, path=("order", "items", 1)), MISSING)
+        self.assertIs(resolve_path(variables=variables, path=("order", "items", "price")), MISSING)
+        self.assertTrue(same_value([1, {"a": 2}], [1, {"a": 2}]))
+        self.assertFalse(same_value(1, True))
+        self.assertFalse(same_value(2, 2.0))
+        self.assertFalse(same_value({"a": 1, "b": 2}, {"b": 2, "a": 1}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from python_oqs_implementation.oqs.constants.values import MAX_CACHED_REGISTRY_OVERLAYS
+from python_oqs_implementation.oqs.engine import (
+    CompiledExpression,
+    ExpressionInput,
+    compile_expression,
+    evaluate_multiple_expressions,
+    oqs_engine
+)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import FunctionNode
+from python_oqs_implementation.oqs.registry import OQSFunctionRegistry
+
+
+def tenant_a(interpreter: OQSInterpreter, node: FunctionNode) -> str:
+    return "a"
+
+
+def tenant_b(interpreter: OQSInterpreter, node: FunctionNode) -> str:
+    return "b"
+
+
+class UnhashableFunction:
+    __hash__ = None
+
+    def __call__(self, interpreter: OQSInterpreter, node: FunctionNode) -> str:
+        return "unhashable"
+
+
+class TestFunctionRegistry(unittest.TestCase):
+    def test_built_in_functions_are_immutable(self):
+        with self.assertRaises(TypeError):
+            OQSInterpreter.FUNCTIONS["TENANT"] = tenant_a
+        with self.assertRaises(TypeError):
+            OQSInterpreter.REGISTRY.functions["TENANT"] = tenant_a
+
+    def test_additional_functions_do_not_leak(self):
+        interpreter: OQSInterpreter = OQSInterpreter(expression="TENANT()")
+        interpreter.add_additional_function(function_name="tenant", function=tenant_a)
+        self.assertEqual(interpreter.results(), "a")
+        self.assertEqual(
+            oqs_engine(expression="TENANT()", additional_functions=[("tenant", tenant_b)]),
+            {"results": {"value": "b", "type": "String"}}
+        )
+        self.assertNotIn("TENANT", OQSInterpreter.FUNCTIONS)
+        self.assertIs(OQSInterpreter(expression="1").registry, OQSInterpreter.REGISTRY)
+        self.assertEqual(oqs_engine(expression="TENANT()")["error"]["type"], "Undefined Function Error")
+
+    def test_overlays_are_built_once(self):
+        registry: OQSFunctionRegistry = OQSFunctionRegistry(functions={"base": tenant_a})
+        self.assertIs(registry.extend([]), registry)
+        self.assertIs(registry.extend(None), registry)
+        overlay: OQSFunctionRegistry = registry.extend([("tenant", tenant_b)])
+        self.assertIs(registry.extend([("TENANT", tenant_b)]), overlay)
+        self.assertIsNot(registry.extend([("tenant", tenant_a)]), overlay)
+        self.assertEqual(dict(overlay.functions), {"BASE": tenant_a, "TENANT": tenant_b})
+        self.assertEqual(dict(registry.functions), {"BASE": tenant_a})
+
+    def test_overlay_cache_is_bounded(self):
+        registry: OQSFunctionRegistry = OQSFunctionRegistry(functions={})
+        for index in range(MAX_CACHED_REGISTRY_OVERLAYS + 10):
+            registry.extend([(f"f{index}", tenant_a)])
+        self.assertEqual(len(registry.overlays), MAX_CACHED_REGISTRY_OVERLAYS)
+
+    def test_unhashable_functions_are_not_cached(self):
+        overlay: OQSFunctionRegistry = OQSInterpreter.REGISTRY.extend([("tenant", UnhashableFunction())])
+        self.assertEqual(compile_expression("TENANT()", registry=overlay).results(), "unhashable")
+
+    def test_engine_registries(self):
+        registry: OQSFunctionRegistry = OQSInterpreter.REGISTRY.extend([("tenant", tenant_a)])
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(backend=backend):
+                compiled: CompiledExpression = compile_expression(
+                    'TENANT() + OTHER()', backend=backend, registry=registry
+                )
+                self.assertEqual(compiled.results(additional_functions=[("other", tenant_b)]), "ab")
+                self.assertEqual(compiled.evaluate()["error"]["type"], "Undefined Function Error")
+        self.assertEqual(
+            oqs_engine(expression="TENANT()", registry=registry), {"results": {"value": "a", "type": "String"}}
+        )
+        self.assertEqual(
+            evaluate_multiple_expressions(
+                expression_inputs=[ExpressionInput(expression="TENANT()")] * 4, workers=2, registry=registry
+            ),
+            [{"results": {"value": "a", "type": "String"}}] * 4
+        )
+
+    def test_concurrent_tenants(self):
+        registries: dict[str, OQSFunctionRegistry] = {
+            "a": OQSInterpreter.REGISTRY.extend([("tenant", tenant_a)]),
+            "b": OQSInterpreter.REGISTRY.extend([("tenant", tenant_b)])
+        }
+        compiled: CompiledExpression = compile_expression('MAP(RANGE(50), "x", TENANT())')
+
+        def evaluate(tenant: str) -> bool:
+            return compiled.results(registry=registries[tenant]) == [tenant] * 50
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertTrue(all(pool.map(evaluate, ["a", "b"] * 200)))
+
+    def test_registries_can_be_pickled(self):
+        registry: OQSFunctionRegistry = OQSInterpreter.REGISTRY.extend([("tenant", tenant_a)])
+        restored: OQSFunctionRegistry = pickle.loads(pickle.dumps(registry))
+        self.assertEqual(dict(restored.functions), dict(registry.functions))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.sequences import (LazyList, RepeatedList, materialize)
+
+
+class TestRepetition(unittest.TestCase):
+    def assert_all_backends(self, expression: str, expected: any, variables: dict[str, any] = None):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(expression=expression, backend=backend):
+                compiled: CompiledExpression = compile_expression(expression=expression, backend=backend)
+                self.assertEqual(compiled.results(variables=variables), expected)
+
+    def assert_error(self, expression: str, error_type: str):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(expression=expression, backend=backend):
+                compiled: CompiledExpression = compile_expression(expression=expression, backend=backend)
+                self.assertEqual(compiled.evaluate()["error"]["type"], error_type)
+
+    def test_list_is_repeated_exactly(self):
+        self.assert_all_backends('[1, 2] * 3', [1, 2, 1, 2, 1, 2])
+        self.assert_all_backends('3 * [1]', [1, 1, 1])
+        self.assert_all_backends('MULTIPLY([1], 30)', [1] * 30)
+        self.assert_all_backends('[1] * 1', [1])
+        self.assert_all_backends('[1] * 0', [])
+        self.assert_all_backends('MULTIPLY([1], SUBTRACT(0, 2))', [])
+        self.assert_all_backends('MULTIPLY("ab", 3)', "ababab")
+
+    def test_repetition_does_not_modify_inputs(self):
+        variables: dict[str, any] = {"items": [1, 2]}
+        self.assert_all_backends('[items * 2, items]', [[1, 2, 1, 2], [1, 2]], variables=variables)
+        self.assert_all_backends('APPEND(items * 2, 3)', [1, 2, 1, 2, 3], variables=variables)
+        self.assertEqual(variables, {"items": [1, 2]})
+
+    def test_repetition_streams_into_pipelines(self):
+        self.assert_all_backends('SUM([1, 2] * 1000000)', 3_000_000)
+        self.assert_all_backends('LEN([0] * 5000000)', 5_000_000)
+        self.assert_all_backends('MAP([1, 2] * 2, "x", x * 10)', [10, 20, 10, 20])
+        self.assert_all_backends('SLICE([1, 2, 3] * 3, 2, 5)', [3, 1, 2])
+
+    def test_size_ceiling(self):
+        self.assert_error('[1] * 20000000', "Value Error")
+        self.assert_error('LEN([1, 2] * 6000000)', "Value Error")
+        self.assert_error('"ab" * 6000000', "Value Error")
+        self.assert_error('MULTIPLY([1], 1000000000000000000000)', "Value Error")
+        self.assert_all_backends('TRY([1] * 20000000, "Value Error", [])', [])
+
+    def test_size_ceiling_is_configurable(self):
+        original: int = OQSInterpreter.MAX_REPEATED_SIZE
+        OQSInterpreter.MAX_REPEATED_SIZE = 4
+        try:
+            self.assert_all_backends('[1, 2] * 2', [1, 2, 1, 2])
+            self.assert_error('[1, 2] * 3', "Value Error")
+        finally:
+            OQSInterpreter.MAX_REPEATED_SIZE = original
+
+    def test_repeated_list(self):
+        repeated: LazyList = LazyList(RepeatedList(items=[1, 2], times=3))
+        self.assertEqual(list(repeated), [1, 2, 1, 2, 1, 2])
+        self.assertEqual(repeated.count(), 6)
+        self.assertEqual(materialize(repeated), [1, 2, 1, 2, 1, 2])
+        self.assertEqual(materialize(LazyList(RepeatedList(items=[1], times=-1))), [])
@@ -0,0 +1,128 @@
+import unittest
+from python_oqs_implementation.oqs.engine import evaluate_expression
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import FunctionNode
+from python_oqs_implementation.oqs.ruleset import RuleSet
+
+
+RULES: dict[str, str] = {
+    "total": 'SUM(MAP(ACCESS(order, "items"), "item", ACCESS(item, "price") * ACCESS(item, "quantity")))',
+    "large": 'SUM(MAP(ACCESS(order, "items"), "item", ACCESS(item, "price") * ACCESS(item, "quantity"))) > 10',
+    "count": 'LEN(ACCESS(order, "items"))',
+    "expensive": 'FILTER(ACCESS(order, "items"), "item", ACCESS(item, "price") > 3)',
+    "sorted": 'SORT(ACCESS(order, "items"), "item", ACCESS(item, "price"))',
+    "appended": 'APPEND(SORT(ACCESS(order, "items"), "item", ACCESS(item, "price")), null)',
+    "error": 'ACCESS(order, "missing") + 1',
+    "invalid": 'LEN(',
+    "undefined": 'IF(true, 1, UNKNOWN())',
+}
+
+
+def build_variables() -> dict[str, any]:
+    return {"order": {"items": [{"price": 2, "quantity": 3}, {"price": 5, "quantity": 1}]}}
+
+
+class TestRuleSet(unittest.TestCase):
+    def assert_matches_evaluate_expression(self, rule_set: RuleSet, variables: dict[str, any]):
+        results: dict[str, dict[str, any]] = rule_set.evaluate(variables=variables)
+        self.assertEqual(list(results), list(rule_set.rules))
+        for name, expression in rule_set.rules.items():
+            with self.subTest(name=name):
+                self.assertEqual(
+                    results[name],
+                    evaluate_expression(
+                        expression=expression,
+                        variables=variables,
+                        defer_undefined_functions=rule_set.defer_undefined_functions
+                    )
+                )
+
+    def test_results_match_evaluate_expression(self):
+        for defer_undefined_functions in (False, True):
+            rule_set: RuleSet = RuleSet(rules=RULES, defer_undefined_functions=defer_undefined_functions)
+            self.assert_matches_evaluate_expression(rule_set=rule_set, variables=build_variables())
+            self.assert_matches_evaluate_expression(rule_set=rule_set, variables={"order": {"items": []}})
+            self.assert_matches_evaluate_expression(rule_set=rule_set, variables={})
+
+    def test_identical_sub_trees_are_shared(self):
+        rule_set: RuleSet = RuleSet(rules=RULES)
+        sum_node: FunctionNode = rule_set.roots["total"]
+        self.assertIs(rule_set.roots["large"].left, sum_node)
+        self.assertIs(rule_set.roots["appended"].args[0], rule_set.roots["sorted"])
+        items_node: FunctionNode = rule_set.roots["count"].args[0]
+        for name in ("expensive", "sorted"):
+            self.assertIs(rule_set.roots[name].args[0], items_node)
+        self.assertIn(sum_node, rule_set.shared)
+        self.assertIn(items_node, rule_set.shared)
+        self.assertNotIn(rule_set.roots["count"], rule_set.shared)
+        mixed_case: RuleSet = RuleSet(rules={"lower": 'len(items) + 1', "upper": 'LEN(items) * 2'})
+        self.assertIs(mixed_case.roots["lower"].left, mixed_case.roots["upper"].left)
+        self.assertIn(mixed_case.roots["upper"].left, mixed_case.shared)
+        self.assert_matches_evaluate_expression(rule_set=mixed_case, variables={"items": [1, 2]})
+
+    def test_shared_nodes_are_evaluated_once_per_variables(self):
+        rule_set: RuleSet = RuleSet(rules={**RULES, "again": RULES["sorted"]})
+        for variables in (build_variables(), {"order": {"items": [{"price": 4, "quantity": 2}]}}):
+            results: dict[str, dict[str, any]] = rule_set.evaluate(variables=variables)
+            sorted_items: list[dict[str, int]] = results["sorted"]["results"]["value"]
+            self.assertEqual(results["again"]["results"]["value"], sorted_items)
+            self.assertIsNot(results["again"]["results"]["value"], sorted_items)
+            self.assertEqual(results["appended"]["results"]["value"], sorted_items + [None])
+            self.assertEqual(len(sorted_items), len(variables["order"]["items"]))
+        rows: list[dict[str, any]] = [{"order": {"items": []}}, build_variables()]
+        self.assertEqual(
+            list(rule_set.evaluate_many(rows)), [rule_set.evaluate(variables=variables) for variables in rows]
+        )
+
+    def test_results_do_not_share_containers(self):
+        rule_set: RuleSet = RuleSet(rules={
+            "items": 'ACCESS(order, "items")',
+            "either": 'IF(true, ACCESS(order, "items"))',
+            "count": 'LEN(ACCESS(order, "items"))'
+        })
+        results: dict[str, dict[str, any]] = rule_set.evaluate(variables=build_variables())
+        results["items"]["results"]["value"].append(None)
+        results["either"]["results"]["value"][0]["price"] = 0
+        self.assertEqual(len(results["either"]["results"]["value"]), 2)
+        self.assertEqual(results["items"]["results"]["value"][0]["price"], 2)
+        self.assertEqual(results["count"]["results"]["value"], 2)
+
+    def test_loop_variables_are_not_shared(self):
+        rule_set: RuleSet = RuleSet(rules={"top": 'x * 2', "loop": 'MAP(items, "x", x * 2)', "again": 'x * 2 + 1'})
+        self.assertEqual(rule_set.shared, frozenset())
+        self.assert_matches_evaluate_expression(rule_set=rule_set, variables={"x": 10, "items": [1, 2]})
+        dynamic: RuleSet = RuleSet(rules={"top": 'LEN(items) + 1', "loop": 'MAP(items, name, LEN(items) + 1)'})
+        self.assertEqual(dynamic.shared, frozenset())
+        self.assert_matches_evaluate_expression(rule_set=dynamic, variables={"name": "items", "items": [[1], [2, 3]]})
+
+    def test_impure_and_custom_functions_are_not_shared(self):
+        calls: list[int] = []
+
+        def counter(interpreter: OQSInterpreter, node: FunctionNode) -> int:
+            calls.append(1)
+            return len(calls)
+
+        rule_set: RuleSet = RuleSet(
+            rules={"first": 'COUNTER() + 1', "second": 'COUNTER() + 1', "now": 'TYPE(NOW())', "again": 'TYPE(NOW())'},
+            additional_functions=[("counter", counter)]
+        )
+        self.assertEqual(rule_set.shared, frozenset())
+        results: dict[str, dict[str, any]] = rule_set.evaluate()
+        self.assertEqual(results["first"]["results"]["value"], 2)
+        self.assertEqual(results["second"]["results"]["value"], 3)
+        self.assertEqual(results["now"], results["again"])
+
+    def test_literals_keep_their_types(self):
+        rule_set: RuleSet = RuleSet(rules={"integer": '[1, 2]', "float": '[1.0, 2]', "boolean": '[true, 2]'})
+        self.assertEqual(
+            {name: result["results"]["value"] for name, result in rule_set.evaluate().items()},
+            {"integer": [1, 2], "float": [1.0, 2], "boolean": [True, 2]}
+        )
+        self.assertEqual(
+            [type(value[0]) for value in (result["results"]["value"] for result in rule_set.evaluate().values())],
+            [int, float, bool]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import copy
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression)
+from python_oqs_implementation.oqs.scope import OQSScope
+
+
+class TestOQSScope(unittest.TestCase):
+    def test_lookup_falls_back_to_parent(self):
+        parent: dict[str, any] = {"a": 1, "b": 2}
+        scope: OQSScope = OQSScope(parent=parent)
+        scope["a"] = 10
+        self.assertEqual(scope["a"], 10)
+        self.assertEqual(scope["b"], 2)
+        self.assertIn("b", scope)
+        self.assertNotIn("c", scope)
+        self.assertEqual(scope.get("b"), 2)
+        self.assertEqual(scope.get("c", 3), 3)
+        with self.assertRaises(KeyError):
+            scope["c"]
+        self.assertEqual(parent, {"a": 1, "b": 2})
+
+    def test_nested_scopes(self):
+        inner: OQSScope = OQSScope(parent=OQSScope(parent={"a": 1}))
+        self.assertEqual(inner["a"], 1)
+        self.assertIn("a", inner)
+
+
+class TestScopedLoops(unittest.TestCase):
+    def assert_all_backends(self, expression: str, variables: dict[str, any], expected: any) -> None:
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(expression=expression, backend=backend):
+                original: dict[str, any] = copy.deepcopy(variables)
+                compiled: CompiledExpression = compile_expression(
+                    expression=expression, backend=backend, optimize=False
+                )
+                self.assertEqual(compiled.results(variables=variables), expected)
+                self.assertEqual(variables, original)
+
+    def test_loops_do_not_modify_variables(self):
+        variables: dict[str, any] = {"items": [3, 1, 2], "limit": 1}
+        self.assert_all_backends('MAP(items, "x", x * 2)', variables, [6, 2, 4])
+        self.assert_all_backends('FOR(items, "x", x + limit)', variables, [4, 2, 3])
+        self.assert_all_backends('FILTER(items, "x", x > limit)', variables, [3, 2])
+        self.assert_all_backends('FILTER({"a": 1, "b": 2}, "x", x > limit)', variables, {"b": 2})
+        self.assert_all_backends('SORT(items, "x", x)', variables, [1, 2, 3])
+
+    def test_loop_variable_shadows_outer_variable(self):
+        variables: dict[str, any] = {"x": 100, "items": [1, 2]}
+        self.assert_all_backends('[MAP(items, "x", x), x]', variables, [[1, 2], 100])
+
+    def test_nested_loops_do_not_clobber(self):
+        variables: dict[str, any] = {"rows": [[1, 2], [3]]}
+        self.assert_all_backends(
+            'MAP(rows, "x", [MAP(x, "x", x * 10), LEN(x)])', variables, [[[10, 20], 2], [[30], 1]]
+        )
+        self.assert_all_backends(
+            'MAP(rows, "row", MAP(row, "x", [x, LEN(row)]))', variables, [[[1, 2], [2, 2]], [[3, 1]]]
+        )
+
+    def test_scope_is_restored_after_errors(self):
+        variables: dict[str, any] = {"items": [1, 0], "x": "outer"}
+        self.assert_all_backends(
+            '[TRY(MAP(items, "x", 1 / x), "Division By Zero Error", x), x]', variables, ["outer", "outer"]
+        )
+
+    def test_shared_variables_across_threads(self):
+        variables: dict[str, any] = {"items": list(range(200)), "offset": 1}
+        compiled: CompiledExpression = compile_expression(expression='SUM(MAP(items, "x", x + offset))', optimize=False)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results: list[any] = list(pool.map(lambda _: compiled.results(variables=variables), range(32)))
+        self.assertEqual(results, [sum(range(200)) + 200] * 32)
+        self.assertEqual(variables, {"items": list(range(200)), "offset": 1})
@@ -0,0 +1,90 @@
+import tracemalloc
+import unittest
+from python_oqs_implementation.oqs.engine import (CompiledExpression, compile_expression, evaluate_expression)
+from python_oqs_implementation.oqs.nodes import FunctionNode
+from python_oqs_implementation.oqs.sequences import (LazyList, materialize)
+
+
+def reversed_map(interpreter, node: FunctionNode) -> list[any]:
+    return list(reversed(interpreter.evaluate(node.args[0])))
+
+
+class TestLazySequences(unittest.TestCase):
+    def assert_all_backends(self, expression: str, expected: dict[str, any], variables: dict[str, any] = None):
+        for backend in CompiledExpression.BACKENDS:
+            with self.subTest(expression=expression, backend=backend):
+                compiled: CompiledExpression = compile_expression(
+                    expression=expression, backend=backend, optimize=False
+                )
+                self.assertEqual(compiled.evaluate(variables=dict(variables or {})), expected)
+
+    def assert_value(self, expression: str, value: any, value_type: str, variables: dict[str, any] = None):
+        self.assert_all_backends(
+            expression=expression, expected={"results": {"value": value, "type": value_type}}, variables=variables
+        )
+
+    def test_pipelines(self):
+        self.assert_value(
+            'SUM(MAP(FILTER(RANGE(0, 1000), "x", x % 2 == 0), "x", x * x))',
+            sum(x * x for x in range(0, 1000, 2)),
+            "Integer"
+        )
+        self.assert_value('LEN(FILTER(RANGE(100), "x", x > 50))', 49, "Integer")
+        self.assert_value('LEN(MAP(RANGE(0, 10, 3), "x", x))', 4, "Integer")
+        self.assert_value('SLICE(MAP(RANGE(10), "x", x * 2), 2, 5)', [4, 6, 8], "List")
+        self.assert_value('SLICE(RANGE(10), 0 - 3)', [7, 8, 9], "List")
+        self.assert_value('SLICE(MAP(RANGE(5), "x", x), 0 - 2)', [3, 4], "List")
+        self.assert_value('SLICE(FILTER(RANGE(10), "x", x > 2), 1, 0 - 1)', [4, 5, 6, 7, 8], "List")
+        self.assert_value('MAP(SLICE(RANGE(100), 95), "x", x)', [95, 96, 97, 98, 99], "List")
+        self.assert_value('FILTER(MAP(items, "x", x + 1), "x", x > 2)', [3, 4], "List", variables={"items": [1, 2, 3]})
+        self.assert_value('FILTER({"a": 1, "b": 2}, "v", v > 1)', {"b": 2}, "KVS")
+        self.assert_value('SUM(RANGE(0))', 0, "Integer")
+
+    def test_errors_match_eager_evaluation(self):
+        self.assert_all_backends(
+            'SLICE(MAP(RANGE(10), "x", 10 / (x - 8)), 0, 2)', evaluate_expression('MAP(RANGE(10), "x", 10 / (x - 8))')
+        )
+        self.assert_all_backends(
+            'SUM(MAP(RANGE(3), "x", "a"))',
+            {"error": {"type": "Type Error", "message": "Argument must be a list of numbers"}}
+        )
+        self.assert_all_backends(
+            'MAP(SLICE("abc", 1), "x", x)',
+            {"error": {"type": "Type Error", "message": "list argument must be a List. Instead got 'String'."}}
+        )
+        self.assert_all_backends(
+            'LEN(RANGE("a"))',
+            {"error": {"type": "Type Error", "message": "stop argument must be an Integer. Instead got 'String'."}}
+        )
+
+    def test_loop_variable_does_not_leak(self):
+        self.assert_all_backends(
+            '[SUM(MAP(RANGE(5), "x", x)), x]',
+            {"error": {"type": "Undefined Variable Error", "message": "The variable x is not defined."}}
+        )
+        self.assert_value('SUM(MAP(FILTER(RANGE(5), "x", x > 2), "y", y + x))', 11, "Integer", variables={"x": 2})
+
+    def test_pipelines_do_not_materialize_intermediate_lists(self):
+        compiled: CompiledExpression = compile_expression(
+            expression='SUM(MAP(FILTER(RANGE(0, 20000), "x", x % 2 == 0), "x", x * x))', optimize=False
+        )
+        tracemalloc.start()
+        try:
+            result: any = compiled.results()
+            peak: int = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(result, sum(x * x for x in range(0, 20000, 2)))
+        self.assertLess(peak, 64 * 1024)
+
+    def test_overridden_functions_are_not_streamed(self):
+        result: dict[str, any] = evaluate_expression(
+            'SUM(RANGE([1, 2, 3]))', additional_functions=[("RANGE", reversed_map)]
+        )
+        self.assertEqual(result, {"results": {"value": 6, "type": "Integer"}})
+
+    def test_lazy_list(self):
+        self.assertEqual(LazyList(range(3)).count(), 3)
+        self.assertEqual(LazyList(iter([1, 2])).count(), 2)
+        self.assertEqual(materialize(LazyList(range(3))), [0, 1, 2])
+        self.assertEqual(materialize([1]), [1])
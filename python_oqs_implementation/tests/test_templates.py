@@ -0,0 +1,59 @@
+import unittest
+from python_oqs_implementation.oqs.engine import (CompiledTemplate, compile_template, evaluate_expression, oqs_engine)
+from python_oqs_implementation.oqs.interpreter import OQSInterpreter
+from python_oqs_implementation.oqs.nodes import FunctionNode
+
+
+class TestCompiledTemplates(unittest.TestCase):
+    def test_templates_are_split_once(self):
+        template: CompiledTemplate = compile_template('<{a}> + <{b}> = <{a + b}>, again <{a}>!')
+        self.assertEqual(template.chunks, ["", " + ", " = ", ", again ", "!"])
+        self.assertEqual(template.positions, [0, 1, 2, 0])
+        self.assertEqual(len(template.slots), 3)
+        self.assertEqual(template.render(variables={"a": 1, "b": 2}), "1 + 2 = 3, again 1!")
+        self.assertEqual(template.render(variables={"a": "x", "b": "y"}), "x + y = xy, again x!")
+
+    def test_templates_without_expressions(self):
+        self.assertEqual(compile_template("plain {text}").render(), "plain {text}")
+        self.assertEqual(compile_template("").render(), "")
+        self.assertEqual(compile_template("<{1}>").render(), "1")
+
+    def test_values_are_rendered_as_before(self):
+        self.assertEqual(
+            compile_template('<{[1, 2]}> <{"s"}> <{null}> <{true}> <{{"k": 1}}> <{1.50}>').render(),
+            "[1, 2] s None True {'k': 1} 1.5"
+        )
+
+    def test_repeated_slots_are_evaluated_once(self):
+        calls: list[int] = []
+
+        def count(interpreter: OQSInterpreter, node: FunctionNode) -> int:
+            calls.append(1)
+            return len(calls)
+
+        template: CompiledTemplate = compile_template('<{COUNT()}> <{COUNT()}> <{ COUNT() }>')
+        self.assertEqual(template.render(additional_functions=[("count", count)]), "1 1 2")
+
+    def test_errors_match_evaluate_expression(self):
+        for template in ['a <{1 / 0}> b', '<{ADD(1, }> x', '<{<{1}>}>', '<{missing}>']:
+            with self.subTest(template=template):
+                result: dict[str, any] = evaluate_expression(expression=template, string_embedded=True)
+                self.assertEqual(result["error"]["type"], "unknown")
+                self.assertEqual(result["additional_info"], {"type": "KeyError", "message": "'results'"})
+                self.assertEqual(compile_template(template).evaluate(), result)
+
+    def test_engine_uses_compiled_templates(self):
+        for variables in ({"x": 1}, {"x": 2}):
+            with self.subTest(variables=variables):
+                self.assertEqual(
+                    oqs_engine(expression='x is <{x}>, twice <{x * 2}>', variables=variables, string_embedded=True),
+                    {"results": {"value": f"x is {variables['x']}, twice {variables['x'] * 2}", "type": "String"}}
+                )
+        self.assertEqual(
+            oqs_engine(expression='<{IF(true, 1, UNKNOWN())}>', string_embedded=True, defer_undefined_functions=True),
+            {"results": {"value": "1", "type": "String"}}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
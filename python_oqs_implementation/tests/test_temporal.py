@@ -0,0 +1,79 @@
+import datetime
+import re
+import unittest
+from python_oqs_implementation.oqs.engine import evaluate_expression
+from python_oqs_implementation.oqs.utils.temporal import (
+    TEMPORAL_PARSER_CACHE, compile_temporal_format, parse_datetime, parse_duration
+)
+
+
+class TestTemporalParsing(unittest.TestCase):
+    def test_parsers_match_strptime(self):
+        for string, format_str in [
+            ("2023-12-25T10:30:00", "%Y-%m-%dT%H:%M:%S"),
+            ("2023-12-25", "%Y-%m-%d"),
+            ("10:30:00", "%H:%M:%S"),
+            ("25/12/2023 10:30", "%d/%m/%Y %H:%M"),
+            ("20231225 103000.25", "%Y%m%d %H%M%S.%f"),
+            ("1/2/69", "%d/%m/%y"),
+            ("1/2/68", "%d/%m/%y"),
+            ("2024-02-29", "%Y-%m-%d"),
+            ("100%  5", "100%%  %m"),
+        ]:
+            with self.subTest(string=string, format_str=format_str):
+                self.assertEqual(
+                    parse_datetime(string=string, format_str=format_str),
+                    datetime.datetime.strptime(string, format_str)
+                )
+
+    def test_unsupported_input_falls_back_to_strptime(self):
+        for string, format_str in [
+            ("2023-02-29", "%Y-%m-%d"),
+            ("2023-12-25 10:30:00", "%Y-%m-%dT%H:%M:%S"),
+            ("2023-12-25T10:30:00+00:00", "%Y-%m-%dT%H:%M:%S"),
+            ("Monday 2023", "%A %Y"),
+            ("2023-13-01", "%Y-%m-%d"),
+        ]:
+            with self.subTest(string=string, format_str=format_str):
+                try:
+                    expected: any = datetime.datetime.strptime(string, format_str)
+                except ValueError as e:
+                    with self.assertRaisesRegex(ValueError, re.escape(str(e))):
+                        parse_datetime(string=string, format_str=format_str)
+                else:
+                    self.assertEqual(parse_datetime(string=string, format_str=format_str), expected)
+
+    def test_custom_formats_are_compiled_once(self):
+        TEMPORAL_PARSER_CACHE.clear()
+        parse_datetime(string="25/12/2023", format_str="%d/%m/%Y")
+        parser: any = TEMPORAL_PARSER_CACHE.get("%d/%m/%Y")
+        parse_datetime(string="26/12/2023", format_str="%d/%m/%Y")
+        self.assertIs(TEMPORAL_PARSER_CACHE.get("%d/%m/%Y"), parser)
+        self.assertIsNotNone(parser)
+        self.assertIsNone(compile_temporal_format(format_str="%A %Y"))
+
+    def test_parse_duration(self):
+        self.assertEqual(
+            parse_duration(string="2 03:04:05"), datetime.timedelta(days=2, hours=3, minutes=4, seconds=5)
+        )
+        with self.assertRaisesRegex(ValueError, "Invalid duration format"):
+            parse_duration(string="03:04:05")
+
+    def test_parse_temporal_results_are_unchanged(self):
+        for expression, expected in [
+            ('PARSE_TEMPORAL("2023-12-25T10:30:00", "DateTime")', datetime.datetime(2023, 12, 25, 10, 30)),
+            ('PARSE_TEMPORAL("2023-12-25", "Date")', datetime.date(2023, 12, 25)),
+            ('PARSE_TEMPORAL("10:30:00", "Time")', datetime.time(10, 30)),
+            ('PARSE_TEMPORAL("25.12.2023", "Date", "%d.%m.%Y")', datetime.date(2023, 12, 25)),
+            ('PARSE_TEMPORAL("1 02:00:00", "Duration")', datetime.timedelta(days=1, hours=2)),
+        ]:
+            with self.subTest(expression=expression):
+                self.assertEqual(evaluate_expression(expression=expression)["results"]["value"], expected)
+        self.assertEqual(
+            evaluate_expression(expression='PARSE_TEMPORAL("2023-02-30", "Date")'),
+            evaluate_expression(expression='PARSE_TEMPORAL("2023-02-30", "Date", "%Y-%m-%d")')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import random
+import unittest
+from typing import Iterator
+from python_oqs_implementation.oqs.engine import (
+    CompiledExpression,
+    compile_expression,
+    evaluate_expression,
+    evaluate_many
+)
+from python_oqs_implementation.oqs.nodes import FunctionNode
+from python_oqs_implementation.oqs.parser import OQSParser
+from python_oqs_implementation.oqs.vectorizer import (OQSVectorizer, numpy)
+
+
+EXPRESSIONS: list[str] = [
+    "price * quantity",
+    "price * quantity - discount",
+    "price * 1.2 + quantity",
+    "rate / quantity",
+    "price / 2.5",
+    "price / quantity",
+    "price * quantity > 100",
+    "price < discount == (quantity >= 3)",
+    "(price > 10) + (quantity < 5) * 2",
+    "price == quantity",
+    "price != 3.0",
+    "quantity * quantity * quantity * quantity * quantity",
+    "rate",
+]
+
+
+def build_rows(count: int, seed: int) -> list[dict[str, any] | None]:
+    generator: random.Random = random.Random(seed)
+    rows: list[dict[str, any] | None] = []
+    for _ in range(count):
+        row: dict[str, any] = {
+            "price": generator.randint(-50, 50),
+            "quantity": generator.choice([0, 1, 2, 3, 7, 2 ** 40]),
+            "discount": generator.uniform(-10, 10),
+            "rate": generator.choice([0.0, 0.5, 1.5, -2.25])
+        }
+        special: int = generator.randrange(12)
+        if special == 0:
+            row.pop("price")
+        elif special == 1:
+            row["quantity"] = "many"
+        elif special == 2:
+            row["price"] = True
+        elif special == 3:
+            row["price"] = 2 ** 70
+        elif special == 4:
+            row["price"] = 2 ** 53 + 1
+        elif special == 5:
+            row["price"] = 0.5
+        elif special == 6:
+            row = None
+        rows.append(row)
+    return rows
+
+
+def double(interpreter, node: FunctionNode) -> any:
+    return interpreter.evaluate(node.args[0]) * 2
+
+
+def add_strings(interpreter, node: FunctionNode) -> any:
+    return "".join(str(interpreter.evaluate(arg)) for arg in node.args)
+
+
+class TestEvaluateMany(unittest.TestCase):
+    def setUp(self):
+        self.rows: list[dict[str, any] | None] = build_rows(count=300, seed=7)
+
+    def expected(self, expression: str, rows: list[dict[str, any] | None]) -> list[dict[str, any]]:
+        return [evaluate_expression(expression=expression, variables=row) for row in rows]
+
+    def test_matches_per_row_evaluation(self):
+        for expression in EXPRESSIONS + ["DOUBLE(price)", "LEN(quantity)", "price +"]:
+            with self.subTest(expression=expression):
+                results: list[dict[str, any]] = list(
+                    evaluate_many(expression=expression, rows=self.rows, additional_functions=[("DOUBLE", double)])
+                )
+                self.assertEqual(
+                    results,
+                    [
+                        evaluate_expression(
+                            expression=expression, variables=row, additional_functions=[("DOUBLE", double)]
+                        )
+                        for row in self.rows
+                    ]
+                )
+
+    def test_streams_results(self):
+        def rows():
+            yield {"x": 1}
+            yield {"x": 2}
+            raise AssertionError("Rows must be consumed lazily")
+
+        results: Iterator[dict[str, any]] = evaluate_many(expression="x + 1", rows=rows())
+        self.assertEqual(next(results), {"results": {"value": 2, "type": "Integer"}})
+        self.assertEqual(next(results), {"results": {"value": 3, "type": "Integer"}})
+
+    def test_compiled_expression_evaluate_many(self):
+        compiled: CompiledExpression = compile_expression(
+            expression="IF(premium, rate, 1) * amount", known_variables={"premium": True}
+        )
+        results: list[dict[str, any]] = list(compiled.evaluate_many(rows=[{"rate": 3, "amount": 2}, {"amount": 2}]))
+        self.assertEqual(results[0], {"results": {"value": 6, "type": "Integer"}})
+        self.assertEqual(results[1]["error"]["type"], "Undefined Variable Error")
+
+    def test_compile_errors_are_reported_once_per_row(self):
+        self.assertEqual(
+            list(evaluate_many(expression="1 +", rows=[{}, {}])),
+            [evaluate_expression(expression="1 +")] * 2
+        )
+        results: list[dict[str, any]] = list(evaluate_many(expression="x", rows=[{"x": 1}], backend="missing"))
+        self.assertEqual(results[0]["error"]["type"], "unknown")
+        self.assertEqual(results[0]["additional_info"]["type"], "ValueError")
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            evaluate_many(expression="x", rows=[], chunk_size=0)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestVectorizedEvaluateMany(unittest.TestCase):
+    def setUp(self):
+        self.rows: list[dict[str, any] | None] = build_rows(count=500, seed=11)
+
+    def test_matches_per_row_evaluation(self):
+        for expression in EXPRESSIONS:
+            for chunk_size in (1, 64, 10_000):
+                with self.subTest(expression=expression, chunk_size=chunk_size):
+                    results: list[dict[str, any]] = list(
+                        evaluate_many(expression=expression, rows=self.rows, vectorize=True, chunk_size=chunk_size)
+                    )
+                    self.assertEqual(
+                        results, [evaluate_expression(expression=expression, variables=row) for row in self.rows]
+                    )
+
+    def test_result_types_match(self):
+        rows: list[dict[str, any]] = [{"a": 2, "b": 3}, {"a": 2.0, "b": 3}, {"a": 1, "b": 0.5}]
+        for expression in ("a * b", "a < b", "a + b"):
+            with self.subTest(expression=expression):
+                for result, row in zip(evaluate_many(expression=expression, rows=rows, vectorize=True), rows):
+                    expected: dict[str, any] = evaluate_expression(expression=expression, variables=row)
+                    self.assertEqual(result, expected)
+                    self.assertIs(type(result["results"]["value"]), type(expected["results"]["value"]))
+
+    def test_supported_expressions(self):
+        parser: OQSParser = OQSParser(eager=True)
+        self.assertTrue(OQSVectorizer(ast=parser.parse(expression="a * b + 1.5 <= c")).is_vectorizable)
+        self.assertFalse(OQSVectorizer(ast=parser.parse(expression="a % b")).is_vectorizable)
+        self.assertFalse(OQSVectorizer(ast=parser.parse(expression="LEN(a)")).is_vectorizable)
+        self.assertFalse(OQSVectorizer(ast=parser.parse(expression='a + "text"')).is_vectorizable)
+
+    def test_overridden_operators_are_not_vectorized(self):
+        rows: list[dict[str, any]] = [{"a": 1, "b": 2}]
+        results: list[dict[str, any]] = list(
+            evaluate_many(expression="a + b", rows=rows, vectorize=True, additional_functions=[("ADD", add_strings)])
+        )
+        self.assertEqual(results, [{"results": {"value": "12", "type": "String"}}])